@@ -1,7 +1,7 @@
-import traceback
-
 from typing import Tuple
 
+from .aecError import aecError
+
 """
 aecColor instantiates a set of color constants and 
 variables as RGB tuples and an alpha component.
@@ -48,6 +48,24 @@ class aecColor:
         self.__blue = 255
         self.__alpha = 0
 
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict):
+        return self.clone()
+
+    def __getstate__(self) -> tuple:
+        """
+        Returns a compact state for pickling.
+        """
+        return (self.__red, self.__green, self.__blue, self.__alpha)
+
+    def __setstate__(self, state: tuple):
+        """
+        Restores a pickled state.
+        """
+        self.__red, self.__green, self.__blue, self.__alpha = state
+
     @property
     def alpha(self) -> int:
         """
@@ -56,7 +74,7 @@ class aecColor:
         try:
             return self.__alpha 
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     @alpha.setter
@@ -67,7 +85,7 @@ class aecColor:
         try:
             self.__alpha = (int(abs(value))) % 256
         except Exception:
-            traceback.print_exc()
+            aecError.report()
  
     @property
     def alpha_01(self) -> int:
@@ -77,7 +95,7 @@ class aecColor:
         try:
             return self.__alpha / 255
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None       
 
     @property
@@ -88,7 +106,7 @@ class aecColor:
         try:
             return (self.__red, self.__green, self.__blue)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
  
     @color.setter
@@ -103,7 +121,7 @@ class aecColor:
             self.__green = value[1]
             self.__blue = value[2]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
 
     @property
     def color_01(self) -> Tuple[float, float, float]:
@@ -115,8 +133,24 @@ class aecColor:
                     self.__green / 255,
                     self.__blue / 255)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None        
+
+    def clone(self):
+        """
+        Returns a new aecColor with the same color and alpha values.
+        Returns None on failure.
+        """
+        try:
+            color = aecColor.__new__(aecColor)
+            color.__red = self.__red
+            color.__green = self.__green
+            color.__blue = self.__blue
+            color.__alpha = self.__alpha
+            return color
+        except Exception:
+            aecError.report()
+            return None
         
 
 
@@ -1,7 +1,6 @@
-import traceback
-
 from typing import NamedTuple
 
+from .aecError import aecError
 from .aecPoint import aecPoint
 
 class aecCompass:
@@ -66,7 +65,7 @@ class aecCompass:
         try:
             return self.__orient
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False
             
     
@@ -1,7 +1,6 @@
-import traceback
-
 from typing import List
 
+from aecSpace.aecError import aecError
 from aecSpace.aecGeometry import aecGeometry
 from aecSpace.aecPoint import aecPoint
 from aecSpace.aecShaper import aecShaper
@@ -63,7 +62,7 @@ class aecCorridor():
         try:
             return self.__persons
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @persons.setter
@@ -80,7 +79,7 @@ class aecCorridor():
             if value > self.__minPersons: value -= self.__minPersons
             self.__width += self.__personWidth * value
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             
     @property
     def space(self) -> aecSpace:
@@ -91,7 +90,7 @@ class aecCorridor():
         try:
             return self.__space
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @property
@@ -103,7 +102,7 @@ class aecCorridor():
         try:
             return self.__width
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
 
     def addLobby(self, lobby: aecSpace) -> bool:
@@ -143,7 +142,7 @@ class aecCorridor():
             print(self.__dimensionError)
             return False        
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False
         
     def makeL(self, floor: aecSpace, margin: float = 0.0, rotate: float = 0.0) -> bool:
@@ -177,7 +176,7 @@ class aecCorridor():
             print(self.__dimensionError)
             return False
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False        
 
        
@@ -212,7 +211,7 @@ class aecCorridor():
             print(self.__dimensionError)
             return False
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False                
            
     def makeU(self, floor: aecSpace, margin: float = 0.0, rotate: float = 0.0) -> bool:
@@ -247,7 +246,7 @@ class aecCorridor():
             print(self.__dimensionError)
             return False
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False       
         
     def makeX(self, floor: aecSpace, margin: float = 0.0, rotate: float = 0.0) -> bool:
@@ -281,6 +280,6 @@ class aecCorridor():
             print(self.__dimensionError)
             return False        
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return False       
         
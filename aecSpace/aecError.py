@@ -0,0 +1,150 @@
+import logging
+import sys
+import time
+import traceback
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List
+
+class aecError:
+    """
+    class aecError
+    Applies the project-wide policy for exceptions caught by aecSpace methods,
+    which then return None or False to their callers. The policy is one of:
+
+    * 'print' writes the traceback to stderr, the default.
+
+    * 'raise' re-raises the exception to the caller.
+
+    * 'silent' ignores the exception without formatting it.
+
+    * 'log' writes the traceback to the 'aecSpace' logger, up to a
+      limited number of times in each interval and counting the rest.
+
+    * 'collect' stores the exception without formatting it.
+
+    The policy is set globally with setMode or for a block of code with
+    the policy context manager, which overrides the global mode.
+    """
+
+    # Defines the available error handling modes.
+
+    Print, Raise, Silent, Log, Collect = 'print', 'raise', 'silent', 'log', 'collect'
+
+    __modes = (Print, Raise, Silent, Log, Collect)
+    __mode = Print
+    __context = ContextVar('aecErrorMode', default = None)
+    __collected = ContextVar('aecErrorCollected', default = None)
+    __errors = []
+    __logger = logging.getLogger('aecSpace')
+    __logLimit = 10
+    __logInterval = 60.0
+    __logStart = 0.0
+    __logCount = 0
+    __suppressed = 0
+
+    @staticmethod
+    def __check(mode: str) -> str:
+        """
+        Returns the delivered mode if it is a valid error handling mode.
+        """
+        mode = str(mode).lower()
+        if mode not in aecError.__modes: raise ValueError('Unknown error mode: ' + mode)
+        return mode
+
+    @staticmethod
+    def clearErrors() -> bool:
+        """
+        Clears the exceptions stored by the global 'collect' mode.
+        Returns True on success.
+        """
+        aecError.__errors.clear()
+        return True
+
+    @staticmethod
+    def getErrors() -> List[Exception]:
+        """
+        Returns a list of the exceptions stored by the global 'collect' mode.
+        """
+        return list(aecError.__errors)
+
+    @staticmethod
+    def getMode() -> str:
+        """
+        Returns the error handling mode in effect.
+        """
+        return aecError.__context.get() or aecError.__mode
+
+    @staticmethod
+    @contextmanager
+    def policy(mode: str):
+        """
+        Context manager applying the delivered error handling mode within its block,
+        yielding a list receiving the exceptions caught in the block in 'collect' mode.
+        Raises ValueError for an unknown mode.
+        """
+        mode = aecError.__check(mode)
+        errors = []
+        modeToken = aecError.__context.set(mode)
+        errorsToken = aecError.__collected.set(errors)
+        try:
+            yield errors
+        finally:
+            aecError.__collected.reset(errorsToken)
+            aecError.__context.reset(modeToken)
+
+    @staticmethod
+    def report(error: Exception = None):
+        """
+        Handles the delivered exception according to the error handling mode in effect,
+        or the exception currently being caught if no exception is delivered, in which
+        case it must be called from within an except block.
+        """
+        mode = aecError.__context.get() or aecError.__mode
+        if mode == aecError.Silent: return
+        if mode == aecError.Print:
+            if error is None: traceback.print_exc()
+            else: traceback.print_exception(type(error), error, error.__traceback__)
+            return
+        if mode == aecError.Raise:
+            if error is None: raise
+            raise error
+        if mode == aecError.Collect:
+            errors = aecError.__collected.get()
+            if errors is None: errors = aecError.__errors
+            errors.append(sys.exc_info()[1] if error is None else error)
+            return
+        now = time.monotonic()
+        if now - aecError.__logStart >= aecError.__logInterval:
+            if aecError.__suppressed:
+                aecError.__logger.warning('%d further aecSpace errors were not logged', aecError.__suppressed)
+            aecError.__logStart = now
+            aecError.__logCount = 0
+            aecError.__suppressed = 0
+        if aecError.__logCount >= aecError.__logLimit:
+            aecError.__suppressed += 1
+            return
+        aecError.__logCount += 1
+        aecError.__logger.error('aecSpace error', exc_info = True if error is None else error)
+
+    @staticmethod
+    def setLogLimit(limit: int = 10, interval: float = 60.0) -> bool:
+        """
+        Sets the maximum quantity of errors written to the log
+        in each interval of the delivered number of seconds.
+        Returns True on success.
+        """
+        aecError.__logLimit = max(int(limit), 0)
+        aecError.__logInterval = abs(float(interval))
+        return True
+
+    @staticmethod
+    def setMode(mode: str = 'print') -> bool:
+        """
+        Sets the global error handling mode.
+        Raises ValueError for an unknown mode.
+        Returns True on success.
+        """
+        aecError.__mode = aecError.__check(mode)
+        return True
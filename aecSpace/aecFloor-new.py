@@ -1,8 +1,7 @@
-import traceback
-
 from random import randint
 
 from aecSpace.aecCorridor import aecCorridor
+from aecSpace.aecError import aecError
 from aecSpace.aecGeometry import aecGeometry
 from aecSpace.aecPoint import aecPoint
 from aecSpace.aecShaper import aecShaper
@@ -47,7 +46,7 @@ class aecFloor():
         try:
             return self.__corridor
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
                
     @property
@@ -59,7 +58,7 @@ class aecFloor():
         try:
             return self.__floor
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @property
@@ -71,7 +70,7 @@ class aecFloor():
         try:
             return self.__rooms
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     def makeI(self, offset: float = 0,
@@ -271,6 +270,6 @@ class aecFloor():
             if rotate != 0: floor.rotate(rotate)  
             return None
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
     
\ No newline at end of file
@@ -1,6 +1,5 @@
-import traceback
-
 from aecSpace.aecCorridor import aecCorridor
+from aecSpace.aecError import aecError
 from aecSpace.aecGeometry import aecGeometry
 from aecSpace.aecPoint import aecPoint
 from aecSpace.aecShaper import aecShaper
@@ -45,7 +44,7 @@ class aecFloor():
         try:
             return self.__corridor
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
                
     @property
@@ -57,7 +56,7 @@ class aecFloor():
         try:
             return self.__floor
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @property
@@ -69,7 +68,7 @@ class aecFloor():
         try:
             return self.__rooms
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     def makeI(self, offset: float = 0,
@@ -242,8 +241,12 @@ class aecFloor():
                                                    testRooms[index].area < self.__minSpace:
                    testRooms[(index + 1) % len(testRooms)].add(testRooms[index].points_floor)
                 index += 1
-            for room in testRooms:
-                if room.fitWithin(floor.points_floor) and \
+            clipRooms = aecSpaceGroup()
+            clipRooms.add(testRooms)
+            outcomes = clipRooms.fitWithin(floor.points_floor)
+            if outcomes is None: raise Exception
+            for room, outcome in zip(testRooms, outcomes):
+                if outcome in (aecSpaceGroup.Unchanged, aecSpaceGroup.Clipped) and \
                 self.__geometry.areAdjacent(room.points_floor, self.corridor.space.points_floor) and \
                 room.area >= self.__minSpace:
                     finalRooms.append(room)            
@@ -261,6 +264,6 @@ class aecFloor():
             if rotate != 0: floor.rotate(rotate)  
             return None
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
     
\ No newline at end of file
@@ -1,12 +1,11 @@
 import math
 import numpy
-import traceback
 
-from matplotlib.tri import Triangulation
 from shapely import geometry as shapely
 from shapely import ops as shapeOps
 from typing import List, NamedTuple, Tuple
 
+from .aecError import aecError
 from .aecPoint import aecPoint
 
 class aecGeometry:
@@ -160,7 +159,7 @@ class aecGeometry:
             if shapeOne.touches(shapeTwo) or shapeOne.intersects(shapeTwo): return True
             return False
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
 
     def areColinear(self, points: List[aecPoint]) -> bool:
@@ -175,7 +174,7 @@ class aecGeometry:
             if shapely.Polygon(points).area > 0: return False
             return True    
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def getAngles(self, vtxPoint: aecPoint, prvPoint: aecPoint, nxtPoint: aecPoint) -> vertexAngle:
@@ -197,7 +196,7 @@ class aecGeometry:
             angle.exterior = (math.pi * 2) - angle.interior
             return angle
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def getBoxPoints(self, origin: aecPoint, xDelta: float, yDelta: float) -> List[aecPoint]:
@@ -214,7 +213,7 @@ class aecGeometry:
                 aecPoint(origin.x, origin.y + yDelta)
             ]
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     def getCompassLine(self, box: quad_points, orient: int = 0) -> List[aecPoint]:
@@ -228,7 +227,7 @@ class aecGeometry:
             if center and compass: return [center, compass]
             return None
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def getCompassPoint(self, box: quad_points, orient: int = 0) -> aecPoint:
@@ -265,7 +264,7 @@ class aecGeometry:
             if orient == self.NNE: return self.getMidpoint(north, box.NE)
             return None
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None        
 
     def getConvexHull(self, points: List[aecPoint]) -> List[aecPoint]:
@@ -310,28 +309,47 @@ class aecGeometry:
             hull_points = lower[:-1] + upper[:-1]
             return [aecPoint(pnt[0], pnt[1]) for pnt in hull_points]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
-    def getDifference(self, boundary: List[aecPoint], shape: List[aecPoint]) -> List[List[aecPoint]]:
-        """
-        Returns the points of perimeter(s) not shared between boundary and shape.
-        If more than one perimeter is found, the return value is a list of lists of points
-        defining each perimeter.
+    def getDifference(self, boundary: List[aecPoint], 
+                            shape: List[aecPoint] = None, 
+                            shapes: List[List[aecPoint]] = None) -> List[List[aecPoint]]:
+        """
+        Returns the points of perimeter(s) not shared between the boundary and the
+        delivered shape and/or list of shapes. All shapes are combined in a single
+        cascaded union and subtracted from the boundary in one operation.
+        The return value is a list of lists of points defining each perimeter,
+        including every part of a multipolygon result. A part enclosing a hole,
+        such as a floor with a core subtracted from within it, is divided along
+        a vertical line through each hole into parts without holes.
         Returns None if unable to determine the difference perimeter(s).
         """
         try:
+            cutters = []
+            if shape: cutters.append(shape)
+            if shapes: cutters += list(shapes)
             boundary = shapely.polygon.orient(shapely.Polygon([pnt.xy for pnt in boundary]))
-            shape = shapely.polygon.orient(shapely.Polygon([pnt.xy for pnt in shape]))
-            difference = boundary.difference(shape)
-            if difference.type == 'MultiPolygon':
-                differs = []
-                for polygon in list(difference.geoms):
-                    differs.append([aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]])
-                return differs
-            return [[aecPoint(pnt[0], pnt[1]) for pnt in difference.exterior.coords[:-1]]]
+            cutters = shapeOps.unary_union([shapely.Polygon([pnt.xy for pnt in points]) for points in cutters])
+            polygons = [boundary.difference(cutters)]
+            differs = []
+            while polygons:
+                polygon = polygons.pop()
+                if polygon.is_empty: continue
+                if polygon.geom_type != 'Polygon':
+                    polygons += list(getattr(polygon, 'geoms', []))
+                    continue
+                if polygon.interiors:
+                    x = shapely.Polygon(polygon.interiors[0]).representative_point().x
+                    minX, minY, maxX, maxY = polygon.bounds
+                    polygons.append(polygon.intersection(shapely.box(minX, minY, x, maxY)))
+                    polygons.append(polygon.intersection(shapely.box(x, minY, maxX, maxY)))
+                    continue
+                differs.append([aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]])
+            differs.reverse()
+            return differs
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
 
     def getIntersect(self, boundary: List[aecPoint], shape: List[aecPoint]) -> List[aecPoint]:
@@ -346,11 +364,11 @@ class aecGeometry:
             bnd = shapely.polygon.orient(shapely.Polygon(bnd_pnts))
             shp = shapely.polygon.orient(shapely.Polygon(shp_pnts))
             intersect = bnd.intersection(shp)
-            if intersect.type == 'MultiPolygon': intersect = shapeOps.unary_union(intersect)
+            if intersect.geom_type == 'MultiPolygon': intersect = shapeOps.unary_union(intersect)
             if type(intersect) != shapely.polygon.Polygon: return None
             return [aecPoint(pnt[0], pnt[1]) for pnt in intersect.exterior.coords[:-1]]
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
     
     def getMesh2D(self, points: List[aecPoint]) -> mesh2D:
@@ -364,6 +382,7 @@ class aecGeometry:
             boundary = shapely.polygon.orient(shapely.Polygon(bndPoints))
             xPoints = [point.x for point in points]
             yPoints = [point.y for point in points]
+            from matplotlib.tri import Triangulation
             meshD = Triangulation(xPoints, yPoints)
             triangles = meshD.triangles
             indices = []
@@ -383,7 +402,7 @@ class aecGeometry:
             mesh.indices = indices
             return mesh
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def getMidpoint(self, point1: aecPoint, point2: aecPoint) -> aecPoint:
@@ -397,7 +416,7 @@ class aecGeometry:
             zCoord = (point1.z + point2.z) * 0.5
             return aecPoint(xCoord, yCoord, zCoord)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None              
     
     def getNormal(self, point: aecPoint, prePoint: aecPoint, nxtPoint: aecPoint) -> Tuple[float, float, float]:
@@ -411,7 +430,7 @@ class aecGeometry:
             normal = preNormal / (math.sqrt(sum(preNormal**2)))
             return tuple(normal)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None     
     
     def isConvex(self, points: List[aecPoint]) -> bool:
@@ -431,7 +450,7 @@ class aecGeometry:
                 index += 1
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None          
             
     def mirrorPoints2D (self, points: List[aecPoint], mPoint1: aecPoint, mPoint2: aecPoint) -> List[aecPoint]:
@@ -475,7 +494,7 @@ class aecGeometry:
                 newPoints.append(point)
             return newPoints
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def rmvColinear(self, points: List[aecPoint]) -> List[aecPoint]:
@@ -497,7 +516,7 @@ class aecGeometry:
             points = (sorted(set(points), key = points.index))
             return [aecPoint(pnt[0], pnt[1], level) for pnt in points]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
            
     def toDegrees(self, radians: float = 0):
@@ -508,5 +527,5 @@ class aecGeometry:
         try:
             return (radians * (180 / aecGeometry.pi)) % 360
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None       
\ No newline at end of file
@@ -0,0 +1,254 @@
+import numpy
+import shapely as shapelyArray
+
+from typing import List, NamedTuple, Tuple
+
+from .aecError import aecError
+from .aecPoint import aecPoint
+
+class aecGeometryArray:
+    """
+    Provides vectorized geometry functions over arrays of shapely polygons,
+    evaluating each operation for every polygon in a single call.
+    """
+
+    # Defines a packed mesh data structure for a series of spaces, listing float32
+    # vertices and normals, uint32 triangle indices local to each space, and the
+    # offsets of each space's vertices and indices, with the range of space n
+    # running from offset n to offset n + 1.
+
+    meshes = \
+        NamedTuple(
+        'meshes',
+        [
+            ('vertices', numpy.ndarray),
+            ('normals', numpy.ndarray),
+            ('indices', numpy.ndarray),
+            ('vertexOffsets', numpy.ndarray),
+            ('indexOffsets', numpy.ndarray)
+        ])
+
+    def getAreas(self, shapes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns an array of the areas of the delivered polygons.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.area(shapes)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getBounds(self, shapes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns an array of the minimum x, minimum y, maximum x,
+        and maximum y coordinates of the delivered polygons.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.bounds(shapes).reshape(-1, 4)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getCentroids(self, shapes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns an array of the x and y coordinates of the centroids of the delivered polygons.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.get_coordinates(shapelyArray.centroid(shapes)).reshape(-1, 2)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getContains(self, shapes: numpy.ndarray, shape: shapelyArray.Polygon) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating which of the delivered polygons wholly contain the shape.
+        Returns None on failure.
+        """
+        try:
+            shapelyArray.prepare(shapes)
+            return shapelyArray.contains(shapes, shape)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getCovered(self, shapes: numpy.ndarray, shape: shapelyArray.Polygon) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating which of the delivered polygons
+        lie wholly within the shape, including along its perimeter.
+        Returns None on failure.
+        """
+        try:
+            shapelyArray.prepare(shape)
+            return shapelyArray.covers(shape, shapes)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getDifference(self, shapes: numpy.ndarray, shape: shapelyArray.Polygon) -> numpy.ndarray:
+        """
+        Returns an array of the geometries remaining from each of
+        the delivered polygons after subtracting the shape.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.difference(shapes, shape)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getIntersection(self, shapes: numpy.ndarray, shape: shapelyArray.Polygon) -> numpy.ndarray:
+        """
+        Returns an array of the geometries shared by each of the delivered polygons and the shape.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.intersection(shapes, shape)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getIntersects(self, shapes: numpy.ndarray, shape: shapelyArray.Polygon) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating which of the delivered polygons
+        share any interior area with the shape.
+        Returns None on failure.
+        """
+        try:
+            shapelyArray.prepare(shape)
+            return shapelyArray.intersects(shape, shapes) & ~shapelyArray.touches(shape, shapes)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getLargest(self, shapes: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns an array of the largest polygon part of each of the delivered
+        geometries, or None where a geometry has no polygon part of positive area,
+        and an array of the quantity of polygon parts of positive area in each.
+        Returns None on failure.
+        """
+        try:
+            parts, index = shapelyArray.get_parts(shapes, return_index = True)
+            areas = shapelyArray.area(parts)
+            areas[shapelyArray.get_type_id(parts) != 3] = 0
+            counts = numpy.bincount(index[areas > 0], minlength = shapes.size)
+            largest = numpy.full(shapes.size, None, dtype = object)
+            order = numpy.lexsort((-areas, index))
+            first = numpy.ones(order.size, dtype = bool)
+            first[1:] = index[order][1:] != index[order][:-1]
+            order = order[first]
+            order = order[areas[order] > 0]
+            largest[index[order]] = parts[order]
+            return largest, counts
+        except Exception:
+            aecError.report()
+            return None
+
+    def getMeshes(self, shapes: numpy.ndarray, levels: numpy.ndarray, heights: numpy.ndarray) -> meshes:
+        """
+        Returns a packed mesh of the spaces with the delivered boundaries, levels, and
+        heights. Each space contributes its ceiling triangles, its floor triangles with
+        reversed winding, and a quadrilateral of two triangles for each side, in that
+        order, with vertices unshared between faces so that each carries its face normal.
+        Returns None on failure.
+        """
+        try:
+            shapes = shapelyArray.orient_polygons(shapes)
+            levels = numpy.asarray(levels, dtype = float).reshape(-1)
+            tops = levels + numpy.asarray(heights, dtype = float).reshape(-1)
+            size = shapes.size
+            parts, owner = shapelyArray.get_parts(shapelyArray.constrained_delaunay_triangles(shapes), return_index = True)
+            triangles = shapelyArray.get_coordinates(parts).reshape(-1, 4, 2)[:, :3]
+            x, y = triangles[:, :, 0], triangles[:, :, 1]
+            clockwise = ((x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (y[:, 1] - y[:, 0]) * (x[:, 2] - x[:, 0])) < 0
+            triangles[clockwise] = triangles[clockwise][:, ::-1]
+            rings = shapelyArray.get_exterior_ring(shapes)
+            ringCounts = shapelyArray.get_num_coordinates(rings)
+            coords = shapelyArray.get_coordinates(rings)
+            last = numpy.cumsum(ringCounts) - 1
+            starts = numpy.ones(coords.shape[0], dtype = bool)
+            starts[last] = False
+            edgeOwner = numpy.repeat(numpy.arange(size), ringCounts - 1)
+            head, tail = coords[starts], coords[numpy.flatnonzero(starts) + 1]
+            triCounts = numpy.bincount(owner, minlength = size)
+            edgeCounts = ringCounts - 1
+            vertexOffsets = numpy.concatenate(([0], numpy.cumsum(6 * triCounts + 4 * edgeCounts))).astype(numpy.int64)
+            indexOffsets = numpy.concatenate(([0], numpy.cumsum(6 * triCounts + 6 * edgeCounts))).astype(numpy.int64)
+            triRank = numpy.arange(owner.size) - numpy.concatenate(([0], numpy.cumsum(triCounts)))[owner]
+            edgeRank = numpy.arange(edgeOwner.size) - numpy.concatenate(([0], numpy.cumsum(edgeCounts)))[edgeOwner]
+            vertices = numpy.empty((vertexOffsets[-1], 3), dtype = numpy.float32)
+            normals = numpy.zeros((vertexOffsets[-1], 3), dtype = numpy.float32)
+            indices = numpy.empty(indexOffsets[-1], dtype = numpy.uint32)
+            corners = numpy.arange(3)
+            local = 3 * triRank[:, None] + corners
+            ceiling = vertexOffsets[owner][:, None] + local
+            vertices[ceiling, :2] = triangles
+            vertices[ceiling, 2] = tops[owner][:, None]
+            normals[ceiling, 2] = 1
+            indices[indexOffsets[owner][:, None] + local] = local
+            local = local + 3 * triCounts[owner][:, None]
+            floor = vertexOffsets[owner][:, None] + local
+            vertices[floor, :2] = triangles[:, ::-1]
+            vertices[floor, 2] = levels[owner][:, None]
+            normals[floor, 2] = -1
+            indices[indexOffsets[owner][:, None] + local] = local
+            local = 6 * triCounts[edgeOwner][:, None] + 4 * edgeRank[:, None] + numpy.arange(4)
+            sides = vertexOffsets[edgeOwner][:, None] + local
+            vertices[sides, :2] = numpy.stack((head, tail, tail, head), axis = 1)
+            vertices[sides, 2] = numpy.stack((levels[edgeOwner], levels[edgeOwner], tops[edgeOwner], tops[edgeOwner]), axis = 1)
+            direction = tail - head
+            length = numpy.hypot(direction[:, 0], direction[:, 1])
+            length[length == 0] = 1
+            normals[sides, 0] = (direction[:, 1] / length)[:, None]
+            normals[sides, 1] = (-direction[:, 0] / length)[:, None]
+            quads = 6 * triCounts[edgeOwner][:, None] + 6 * edgeRank[:, None] + numpy.arange(6)
+            indices[indexOffsets[edgeOwner][:, None] + quads] = local[:, [0, 1, 2, 2, 3, 0]]
+            return self.meshes(vertices = vertices,
+                               normals = normals,
+                               indices = indices,
+                               vertexOffsets = vertexOffsets,
+                               indexOffsets = indexOffsets)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getUnion(self, shapes: numpy.ndarray) -> List[List[aecPoint]]:
+        """
+        Returns the points of the perimeters of the union of the delivered polygons,
+        as a list of lists of points defining each separate perimeter.
+        Returns None on failure.
+        """
+        try:
+            union = shapelyArray.get_parts(shapelyArray.union_all(shapes))
+            union = union[shapelyArray.get_type_id(union) == 3]
+            return [[aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]] for polygon in union]
+        except Exception:
+            aecError.report()
+            return None
+
+    def makeShape(self, points: List[aecPoint]) -> shapelyArray.Polygon:
+        """
+        Returns an anticlockwise polygon constructed from the delivered list of points.
+        Returns None on failure.
+        """
+        try:
+            return shapelyArray.orient_polygons(shapelyArray.polygons([pnt.xy for pnt in points]))
+        except Exception:
+            aecError.report()
+            return None
+
+    def makeShapes(self, shapes: list) -> numpy.ndarray:
+        """
+        Returns an array of the delivered polygons, for example the boundaries of a list of aecSpaces.
+        Returns None on failure.
+        """
+        try:
+            array = numpy.empty(len(shapes), dtype = object)
+            array[:] = shapes
+            return array
+        except Exception:
+            aecError.report()
+            return None
@@ -1,10 +1,11 @@
 import numpy
-import traceback
 
 from shapely import affinity as shpAffine
 from shapely import geometry as shpGeom
 from typing import List, Tuple
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from .aecError import aecError
 
 class aecPoint():
     """
@@ -22,6 +23,19 @@ class aecPoint():
         self.__y = float(y)
         self.__z = float(z)
 
+    def __getstate__(self) -> tuple:
+        """
+        Returns a compact state for pickling.
+        """
+        return (UUID(self.__ID).bytes, self.__x, self.__y, self.__z)
+
+    def __setstate__(self, state: tuple):
+        """
+        Restores a pickled state.
+        """
+        ID, self.__x, self.__y, self.__z = state
+        self.__ID = str(UUID(bytes = ID))
+
     @property
     def ID(self) -> str:
         """
@@ -31,7 +45,7 @@ class aecPoint():
         try:
             return self.__ID
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     @property
@@ -43,7 +57,7 @@ class aecPoint():
         try:
             return self.__x
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
     
     @x.setter
@@ -58,7 +72,7 @@ class aecPoint():
             self.__x = float(x)
         except Exception:
             self.__x = preX
-            traceback.print_exc()
+            aecError.report()
        
     @property
     def y(self) -> float:
@@ -69,7 +83,7 @@ class aecPoint():
         try:
             return self.__y
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
     
     @y.setter
@@ -84,7 +98,7 @@ class aecPoint():
             self.__y = float(y)
         except Exception:
             self.__y = preY
-            traceback.print_exc()
+            aecError.report()
     
     @property
     def z(self) -> float:
@@ -95,7 +109,7 @@ class aecPoint():
         try:
             return self.__z
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
     
     @z.setter
@@ -110,7 +124,7 @@ class aecPoint():
             self.__z = float(z)
         except Exception:
             self.__z = preZ
-            traceback.print_exc()
+            aecError.report()
 
     @property
     def xy(self) -> Tuple[float, float]:
@@ -121,7 +135,7 @@ class aecPoint():
         try:
             return (self.x, self.y)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None  
         
     @xy.setter
@@ -138,7 +152,7 @@ class aecPoint():
         except Exception:
             self.x = preX
             self.y = preY   
-            traceback.print_exc()
+            aecError.report()
             return None          
 
     @property
@@ -150,7 +164,7 @@ class aecPoint():
         try:
             return numpy.array(self.xyz)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None 
 
     @property
@@ -162,7 +176,7 @@ class aecPoint():
         try:
             return list(self.xyz)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None  
                  
     @property
@@ -175,7 +189,7 @@ class aecPoint():
         try:
             return (self.x, self.y, self.z)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None           
     
     @xyz.setter
@@ -196,7 +210,7 @@ class aecPoint():
             self.x = preX
             self.y = preY 
             self.z = preZ  
-            traceback.print_exc()
+            aecError.report()
             return None     
 
     @property
@@ -208,7 +222,7 @@ class aecPoint():
         try:
             return numpy.array(self.xyz)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
 
     @property
@@ -220,7 +234,7 @@ class aecPoint():
         try:
             return list(self.xyz)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None       
                
     def moveBy(self, x:float = 0, y:float = 0, z:float = 0) -> bool:
@@ -241,7 +255,7 @@ class aecPoint():
             self.x = preX
             self.y = preY             
             self.z = preZ             
-            traceback.print_exc()
+            aecError.report()
             return False
         
     def rotate(self, angle: float = 180, point: Tuple[float, float] = (0, 0)) -> bool:
@@ -260,5 +274,5 @@ class aecPoint():
             self.y = newPoint.y
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False           
\ No newline at end of file
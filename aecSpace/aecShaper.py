@@ -1,10 +1,11 @@
-import traceback
+import numpy
 
-from math import cos, sin, pi
+from math import pi
 from shapely import geometry as shapely
 from shapely import ops as shapelyOps
-from typing import List
+from typing import Dict, List, NamedTuple, Sequence, Tuple
 
+from aecSpace.aecError import aecError
 from aecSpace.aecGeometry import aecGeometry
 from aecSpace.aecPoint import aecPoint
 from aecSpace.aecValid import aecValid
@@ -17,6 +18,55 @@ class aecShaper():
     __aecGeometry = aecGeometry()
     __aecValid = aecValid()
     
+    # Shared cache of unioned shape rings normalized to a unit box for parameters
+    # outside the closed-form constructions, keyed by shape and normalized
+    # parameters, and the cache size limit.
+    
+    __templates = {}
+    __templateLimit = 4096
+    
+    # Default chord deviation of approximated circles as a proportion
+    # of the radius, and the limit on the number of polygon sides.
+    
+    __deviation = 0.005
+    __sidesLimit = 4096
+    
+    # Defines a series of constants indicating shapes for parameter sweeps.
+    
+    Box, Cross, Cylinder, H, L, Polygon, T, U = range(0, 8)
+    
+    # Defines the parameters of each shape's make function in sweep results.
+    
+    __sweepParams = \
+    {
+        Box: ('xSize', 'ySize'),
+        Cross: ('xSize', 'ySize', 'xWidth', 'yDepth', 'xAxis', 'yAxis'),
+        Cylinder: ('radius', 'deviation', 'edge'),
+        H: ('xSize', 'ySize', 'xWidth1', 'xWidth2', 'yDepth'),
+        L: ('xSize', 'ySize', 'xWidth', 'yDepth'),
+        Polygon: ('radius', 'sides', 'deviation', 'edge'),
+        T: ('xSize', 'ySize', 'xWidth', 'yDepth'),
+        U: ('xSize', 'ySize', 'xWidth1', 'xWidth2', 'yDepth'),
+    }
+    
+    # Defines a data structure of shape metrics for every combination of
+    # swept parameters, listing the shape constant, the resolved parameter
+    # arrays, and arrays of area, perimeter, bounding box sizes, and
+    # whether each combination produces a valid shape.
+    
+    sweepMetrics = \
+        NamedTuple(
+        'sweepMetrics',
+        [
+            ('shape', int),
+            ('params', Dict[str, numpy.ndarray]),
+            ('area', numpy.ndarray),
+            ('perimeter', numpy.ndarray),
+            ('size_x', numpy.ndarray),
+            ('size_y', numpy.ndarray),
+            ('valid', numpy.ndarray)
+        ])
+    
     def __init__(self, x:float = 0, y:float = 0, z:float = 0):
         """
         Constructor defaults to origin point coordinates.
@@ -38,7 +88,92 @@ class aecShaper():
             if type(boundary) != shapely.polygon.Polygon: return None
             return [aecPoint(pnt[0], pnt[1]) for pnt in list(boundary.exterior.coords)[:-1]]                
         except Exception:
-            traceback.print_exc()
+            aecError.report()
+            return None
+      
+    def __place(self, ring: List[Tuple[float, float]],
+                      origin: aecPoint,
+                      xSize: float,
+                      ySize: float) -> List[aecPoint]:
+        """
+        Returns a series of anticlockwise points from the delivered ring of coordinates
+        within a unit box, scaled to the delivered sizes and translated to the origin.
+        Returns None on failure.
+        """
+        try:
+            if ring is None: return None
+            ring = (numpy.array(ring, dtype = float) * (xSize, ySize)) + (origin.x, origin.y)
+            if xSize * ySize < 0: ring = ring[::-1]
+            return [aecPoint(pnt[0], pnt[1]) for pnt in ring.tolist()]
+        except Exception:
+            aecError.report()
+            return None
+
+    def __sides(self, radius, sides, deviation, edge) -> numpy.ndarray:
+        """
+        Returns the number of sides of regular polygons of the delivered radii,
+        increased from the delivered sides as necessary to keep within the
+        delivered chord deviations and edge lengths, as an integer array.
+        Returns None on failure.
+        """
+        try:
+            radius = numpy.abs(numpy.asarray(radius, dtype = float))
+            sides = numpy.abs(numpy.asarray(sides, dtype = float)).astype(int)
+            deviation = numpy.abs(numpy.asarray(deviation, dtype = float))
+            edge = numpy.abs(numpy.asarray(edge, dtype = float))
+            with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+                devSides = numpy.ceil(pi / numpy.arccos(1 - (deviation / radius)))
+                edgeSides = numpy.ceil(pi / numpy.arcsin(edge / (radius * 2)))
+            sides = numpy.where((deviation > 0) & (deviation < radius), numpy.maximum(sides, devSides), sides)
+            sides = numpy.where((edge > 0) & (edge < radius * 2), numpy.maximum(sides, edgeSides), sides)
+            return numpy.clip(sides, 3, self.__sidesLimit).astype(int)
+        except Exception:
+            aecError.report()
+            return None
+
+    def __simplify(self, ring: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """
+        Returns the delivered closed ring of coordinates with repeated
+        and colinear vertices removed.
+        Returns None on failure.
+        """
+        try:
+            ring = [pnt for index, pnt in enumerate(ring) if pnt != ring[(index + 1) % len(ring)]]
+            length = len(ring)
+            points = []
+            for index, pnt in enumerate(ring):
+                prePnt = ring[index - 1]
+                nxtPnt = ring[(index + 1) % length]
+                if (pnt[0] - prePnt[0]) * (nxtPnt[1] - pnt[1]) != \
+                   (pnt[1] - prePnt[1]) * (nxtPnt[0] - pnt[0]): points.append(pnt)
+            return points
+        except Exception:
+            aecError.report()
+            return None
+
+    def __template(self, key: tuple, boxes: List[Tuple[float, float, float, float]]) -> numpy.ndarray:
+        """
+        Returns the ring of coordinates of the union of the delivered boxes, each given
+        as (x, y, xSize, ySize) within a unit box, for parameters falling outside the
+        range of the closed-form shape constructions.
+        The unioned ring is computed once per normalized parameter set and cached.
+        Returns None on failure.
+        """
+        try:
+            key = tuple(round(value, 10) if type(value) == float else value for value in key)
+            if key in self.__templates: return self.__templates[key]
+            points = self.__add([self.makeBox(aecPoint(box[0], box[1]), box[2], box[3]) for box in boxes])
+            ring = None
+            if points:
+                ring = numpy.array([point.xy for point in points])
+                area = numpy.dot(ring[:, 0], numpy.roll(ring[:, 1], -1)) - \
+                       numpy.dot(ring[:, 1], numpy.roll(ring[:, 0], -1))
+                if area < 0: ring = ring[::-1]
+            if len(self.__templates) >= self.__templateLimit: self.__templates.clear()
+            self.__templates[key] = ring
+            return ring
+        except Exception:
+            aecError.report()
             return None
       
     def makeBox(self, origin: aecPoint = aecPoint(), 
@@ -55,7 +190,7 @@ class aecShaper():
                     aecPoint(origin.x + xSize, origin.y + ySize),
                     aecPoint(origin.x, origin.y + ySize)]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
 
     def makeCross(self, origin: aecPoint = aecPoint(0, 0, 0), 
@@ -76,27 +211,41 @@ class aecShaper():
         try:
             if not xWidth: xWidth = xSize * 0.5
             if not yDepth: yDepth = ySize * 0.5
-            xPnt = aecPoint(origin.x + ((yAxis * xSize) - (xWidth * 0.5)), origin.y)
-            yPnt = aecPoint(origin.x, origin.y + ((xAxis * ySize) - (yDepth * 0.5)))
-            armX = self.makeBox(xPnt, xWidth, ySize)
-            armY = self.makeBox(yPnt, xSize, yDepth)
-            return self.__add([armX, armY])
+            xWidth /= xSize
+            yDepth /= ySize
+            x1 = yAxis - (xWidth * 0.5)
+            x2 = x1 + xWidth
+            y1 = xAxis - (yDepth * 0.5)
+            y2 = y1 + yDepth
+            if 0 <= x1 < x2 <= 1 and 0 <= y1 < y2 <= 1:
+                ring = self.__simplify([(x1, 0), (x2, 0), (x2, y1), (1, y1),
+                                        (1, y2), (x2, y2), (x2, 1), (x1, 1),
+                                        (x1, y2), (0, y2), (0, y1), (x1, y1)])
+            else:
+                armX = (x1, 0, xWidth, 1)
+                armY = (0, y1, 1, yDepth)
+                ring = self.__template(('Cross', xWidth, yDepth, xAxis, yAxis), [armX, armY])
+            return self.__place(ring, origin, xSize, ySize)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
-    def makeCylinder(self, origin: aecPoint = aecPoint(), radius = 1) -> List[aecPoint]:
+    def makeCylinder(self, origin: aecPoint = aecPoint(), 
+                           radius = 1,
+                           deviation: float = None,
+                           edge: float = None) -> List[aecPoint]:
         """
-        Returns a series of anticlockwise points representing an approximated circular boundary 
-        setting a ratio from the delivered radius to the number of sides.
+        Returns a series of anticlockwise points representing an approximated circular boundary.
+        The number of sides is the fewest keeping the chord deviation from the true circle
+        within the delivered deviation and each side within the delivered edge length.
+        Absent either tolerance, the deviation defaults to a small proportion of the radius.
         Returns None on failure.
         """
         try:
-            if radius < 3: sides = 3
-            else: sides = radius
-            return self.makePolygon(origin, radius, sides)
+            if not deviation and not edge: deviation = abs(radius) * self.__deviation
+            return self.makePolygon(origin, radius, 3, deviation, edge)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def makeH(self, origin: aecPoint = aecPoint(),
@@ -121,14 +270,24 @@ class aecShaper():
             if xWidth1 >= xSize * 0.5: return None
             if xWidth2 >= xSize * 0.5: return None            
             if yDepth >= ySize: return None             
-            arm1 = self.makeBox(origin, xWidth1, ySize)
-            oPnt = aecPoint(origin.x + (xSize - xWidth2), origin.y)
-            arm2 = self.makeBox(oPnt, xWidth2, ySize)
-            oPnt = aecPoint(origin.x, origin.y + ((ySize * 0.5) - (yDepth * 0.5)))
-            arm3 = self.makeBox(oPnt, xSize, yDepth)
-            return self.__add([arm1, arm2, arm3])
+            xWidth1 /= xSize
+            xWidth2 /= xSize
+            yDepth /= ySize
+            y1 = 0.5 - (yDepth * 0.5)
+            y2 = 0.5 + (yDepth * 0.5)
+            x2 = 1 - xWidth2
+            if xWidth1 > 0 and xWidth2 > 0 and xWidth1 < x2 and 0 < yDepth < 1:
+                ring = [(0, 0), (xWidth1, 0), (xWidth1, y1), (x2, y1),
+                        (x2, 0), (1, 0), (1, 1), (x2, 1),
+                        (x2, y2), (xWidth1, y2), (xWidth1, 1), (0, 1)]
+            else:
+                arm1 = (0, 0, xWidth1, 1)
+                arm2 = (x2, 0, xWidth2, 1)
+                arm3 = (0, y1, 1, yDepth)
+                ring = self.__template(('H', xWidth1, xWidth2, yDepth), [arm1, arm2, arm3])
+            return self.__place(ring, origin, xSize, ySize)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def makeL(self, origin: aecPoint = aecPoint(), 
@@ -147,41 +306,72 @@ class aecShaper():
             if not yDepth: yDepth = ySize * 0.5            
             if xWidth >= xSize: return None
             if yDepth >= ySize: return None
-            armX = self.makeBox(origin, xWidth, ySize)
-            armY = self.makeBox(origin, xSize, yDepth)
-            return self.__add([armX, armY])
+            xWidth /= xSize
+            yDepth /= ySize
+            if 0 < xWidth < 1 and 0 < yDepth < 1:
+                ring = [(0, 0), (1, 0), (1, yDepth), (xWidth, yDepth), (xWidth, 1), (0, 1)]
+            else:
+                armX = (0, 0, xWidth, 1)
+                armY = (0, 0, 1, yDepth)
+                ring = self.__template(('L', xWidth, yDepth), [armX, armY])
+            return self.__place(ring, origin, xSize, ySize)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def makePolygon(self, origin: aecPoint = aecPoint(), 
                           radius = 1, 
-                          sides = 3) -> List[aecPoint]:
+                          sides = 3,
+                          deviation: float = None,
+                          edge: float = None) -> List[aecPoint]:
         """
         Returns a series of anticlockwise points representing a regular polygon boundary centered
         on the delivered origin point with the first vertex at the maximum y-coordinate.
+        If a chord deviation or maximum edge length is delivered, the number of sides is
+        increased as necessary to remain within the tolerance.
         Returns None failure.
         """
         try:
             radius = abs(radius)
             if radius == 0: return False
-            sides = int(abs(sides))
-            if sides < 3: sides = 3
-            angle = pi * 0.5
-            incAngle = (pi * 2) / sides
-            points = []
-            count = 0
-            while count < sides:
-                x = origin.x + (radius * cos(angle))
-                y = origin.y + (radius * sin(angle))
-                points.append(aecPoint(x, y))
-                angle += incAngle
-                count += 1
-            return points
+            sides = int(self.__sides(radius, sides, deviation or 0, edge or 0))
+            angles = (pi * 0.5) + (numpy.arange(sides) * ((pi * 2) / sides))
+            xCoords = origin.x + (radius * numpy.cos(angles))
+            yCoords = origin.y + (radius * numpy.sin(angles))
+            return [aecPoint(x, y) for x, y in zip(xCoords.tolist(), yCoords.tolist())]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
  
+    def makeSwept(self, sweep: sweepMetrics, 
+                        index: int, 
+                        origin: aecPoint = aecPoint()) -> List[aecPoint]:
+        """
+        Returns a series of anticlockwise points representing the shape
+        constructed from the parameters at the delivered index of the
+        results of a parameter sweep.
+        Returns None on failure.
+        """
+        try:
+            makers = \
+            {
+                self.Box: self.makeBox,
+                self.Cross: self.makeCross,
+                self.Cylinder: self.makeCylinder,
+                self.H: self.makeH,
+                self.L: self.makeL,
+                self.Polygon: self.makePolygon,
+                self.T: self.makeT,
+                self.U: self.makeU,
+            }
+            index = int(index)
+            if not sweep.valid[index]: return None
+            params = {key: value[index].item() for key, value in sweep.params.items()}
+            return makers[sweep.shape](origin = origin, **params)
+        except Exception:
+            aecError.report()
+            return None
+
     def makeT(self, origin = aecPoint(), 
                     xSize: float = 1, 
                     ySize: float = 1,
@@ -198,13 +388,20 @@ class aecShaper():
             if not yDepth: yDepth = ySize * 0.5            
             if xWidth >= xSize: return None
             if yDepth >= ySize: return None
-            oPnt = aecPoint(origin.x, origin.y + (ySize - yDepth))
-            arm1 = self.makeBox(oPnt, xSize, yDepth)
-            oPnt = aecPoint(origin.x + ((xSize * 0.5) - (xWidth * 0.5)), origin.y)
-            arm2 = self.makeBox(oPnt, xWidth, ySize)
-            return self.__add([arm1, arm2])
+            xWidth /= xSize
+            yDepth /= ySize
+            x1 = 0.5 - (xWidth * 0.5)
+            x2 = 0.5 + (xWidth * 0.5)
+            y1 = 1 - yDepth
+            if 0 < xWidth < 1 and 0 < yDepth < 1:
+                ring = [(x1, 0), (x2, 0), (x2, y1), (1, y1), (1, 1), (0, 1), (0, y1), (x1, y1)]
+            else:
+                arm1 = (0, y1, 1, yDepth)
+                arm2 = (x1, 0, xWidth, 1)
+                ring = self.__template(('T', xWidth, yDepth), [arm1, arm2])
+            return self.__place(ring, origin, xSize, ySize)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
         
     def makeU(self, origin = aecPoint(),
@@ -226,10 +423,106 @@ class aecShaper():
             if xWidth1 >= xSize * 0.5: return None
             if xWidth2 >= xSize * 0.5: return None            
             if yDepth >= ySize: return None            
-            pointsL = self.makeL(origin, xSize, ySize, xWidth1, yDepth)
-            xPoint = aecPoint(origin.x + (xSize - xWidth2), origin.y)
-            pointsU = self.makeBox(xPoint, xWidth2, ySize)
-            return self.__add([pointsL, pointsU])
+            xWidth1 /= xSize
+            xWidth2 /= xSize
+            yDepth /= ySize
+            x2 = 1 - xWidth2
+            if xWidth1 > 0 and xWidth2 > 0 and xWidth1 < x2 and 0 < yDepth < 1:
+                ring = [(0, 0), (1, 0), (1, 1), (x2, 1), (x2, yDepth), (xWidth1, yDepth), (xWidth1, 1), (0, 1)]
+            else:
+                arm1 = (0, 0, xWidth1, 1)
+                arm2 = (0, 0, 1, yDepth)
+                arm3 = (x2, 0, xWidth2, 1)
+                ring = self.__template(('U', xWidth1, xWidth2, yDepth), [arm1, arm2, arm3])
+            return self.__place(ring, origin, xSize, ySize)
+        except Exception:
+            aecError.report()
+            return None
+
+    def sweep(self, shape: int, param_grid: Dict[str, Sequence[float]]) -> sweepMetrics:
+        """
+        Evaluates the area, perimeter, and bounding box sizes of the delivered shape
+        constant for every combination of the delivered parameter values, keyed by the
+        argument names of the shape's make function, without constructing any points.
+        Parameters absent from the grid take the make function's defaults.
+        Combinations the make function would reject or that fall outside its closed-form
+        construction are marked invalid and report NaN metrics.
+        Use makeSwept to construct the points of selected combinations.
+        Returns None on failure.
+        """
+        try:
+            names = self.__sweepParams[shape]
+            for key in param_grid.keys():
+                if key not in names: raise ValueError('Unknown parameter: ' + str(key))
+            keys = list(param_grid.keys())
+            grids = numpy.meshgrid(*[numpy.asarray(param_grid[key], dtype = float).ravel() for key in keys], 
+                                   indexing = 'ij')
+            grid = {key: values.ravel() for key, values in zip(keys, grids)}
+            count = grids[0].size if grids else 1
+            
+            def param(name: str, default) -> numpy.ndarray:
+                value = grid.get(name, numpy.zeros(count))
+                return numpy.where(value == 0, default, value)
+            
+            if shape in (self.Cylinder, self.Polygon):
+                radius = numpy.abs(param('radius', 1.0))
+                edge = grid.get('edge', numpy.zeros(count))
+                if shape == self.Cylinder:
+                    deviation = numpy.where((grid.get('deviation', numpy.zeros(count)) == 0) & (edge == 0),
+                                            radius * self.__deviation, grid.get('deviation', numpy.zeros(count)))
+                    sides = self.__sides(radius, 3, deviation, edge)
+                    params = {'radius': radius, 'deviation': deviation, 'edge': edge}
+                else:
+                    deviation = grid.get('deviation', numpy.zeros(count))
+                    sides = self.__sides(radius, grid.get('sides', numpy.full(count, 3.0)), deviation, edge)
+                    params = {'radius': radius, 'sides': sides, 'deviation': deviation, 'edge': edge}
+                valid = radius > 0
+                area = 0.5 * sides * (radius ** 2) * numpy.sin((pi * 2) / sides)
+                perimeter = 2 * sides * radius * numpy.sin(pi / sides)
+                quarter = numpy.round(sides / 4)
+                size_x = 2 * radius * numpy.cos(numpy.abs(((pi * 2) * quarter / sides) - (pi * 0.5)))
+                size_y = numpy.where(sides % 2 == 1, radius * (1 + numpy.cos(pi / sides)), radius * 2)
+            else:
+                xSize = grid.get('xSize', numpy.ones(count))
+                ySize = grid.get('ySize', numpy.ones(count))
+                valid = (xSize > 0) & (ySize > 0)
+                size_x = xSize
+                size_y = ySize
+                perimeter = (xSize + ySize) * 2
+                if shape == self.Box:
+                    params = {'xSize': xSize, 'ySize': ySize}
+                    area = xSize * ySize
+                elif shape in (self.Cross, self.L, self.T):
+                    xWidth = param('xWidth', xSize * 0.5)
+                    yDepth = param('yDepth', ySize * 0.5)
+                    params = {'xSize': xSize, 'ySize': ySize, 'xWidth': xWidth, 'yDepth': yDepth}
+                    valid &= (xWidth > 0) & (yDepth > 0) & (xWidth < xSize) & (yDepth < ySize)
+                    if shape == self.Cross:
+                        xAxis = grid.get('xAxis', numpy.full(count, 0.5))
+                        yAxis = grid.get('yAxis', numpy.full(count, 0.5))
+                        params.update({'xAxis': xAxis, 'yAxis': yAxis})
+                        x1 = (yAxis * xSize) - (xWidth * 0.5)
+                        y1 = (xAxis * ySize) - (yDepth * 0.5)
+                        valid &= (x1 >= 0) & (x1 + xWidth <= xSize) & (y1 >= 0) & (y1 + yDepth <= ySize)
+                    area = (xSize * yDepth) + (xWidth * (ySize - yDepth))
+                else:
+                    xWidth1 = param('xWidth1', xSize * 0.3)
+                    xWidth2 = param('xWidth2', xSize * 0.3)
+                    yDepth = param('yDepth', ySize * 0.3)
+                    params = {'xSize': xSize, 'ySize': ySize, 'xWidth1': xWidth1, 'xWidth2': xWidth2, 'yDepth': yDepth}
+                    valid &= (xWidth1 > 0) & (xWidth2 > 0) & (yDepth > 0) & \
+                             (xWidth1 < xSize * 0.5) & (xWidth2 < xSize * 0.5) & (yDepth < ySize)
+                    area = ((xWidth1 + xWidth2) * ySize) + ((xSize - xWidth1 - xWidth2) * yDepth)
+                    perimeter = perimeter + ((ySize - yDepth) * 2)
+            nan = numpy.full(count, numpy.nan)
+            params = {key: numpy.broadcast_to(value, (count,)) for key, value in params.items()}
+            return self.sweepMetrics(shape = shape,
+                                     params = params,
+                                     area = numpy.where(valid, area, nan),
+                                     perimeter = numpy.where(valid, perimeter, nan),
+                                     size_x = numpy.where(valid, size_x, nan),
+                                     size_y = numpy.where(valid, size_y, nan),
+                                     valid = valid)
         except Exception:
-            traceback.print_exc()
-            return None
\ No newline at end of file
+            aecError.report()
+            return None
@@ -1,14 +1,16 @@
-import traceback
+import numpy
 
-from random import uniform
+from random import getrandbits
 from typing import List, Tuple
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import shapely as shapelyArray
 from shapely import geometry as shapely
 from shapely import affinity as shapelyAffine
 from shapely import ops as shapelyOps
 
 from .aecColor import aecColor
+from .aecError import aecError
 from .aecGeometry import aecGeometry
 from .aecPoint import aecPoint
 from .aecValid import aecValid
@@ -37,11 +39,11 @@ class aecSpace:
          '__boundary',         
          '__color',           
          '__convex',
+         '__coords',
          '__height',
          '__ID',
          '__level',
          '__name',
-         '__points_floor',
     ]   
 
     def __init__(self, points: List[aecPoint] = None):
@@ -51,11 +53,12 @@ class aecSpace:
         self.__address = (0, 0, 0)
         self.__boundary = None
         self.__color = aecColor()
+        self.__convex = None
+        self.__coords = None
         self.__height = 1.0
         self.__ID = str(uuid4())
         self.__level = 0.0
         self.__name = ''
-        self.__points_floor = None
         if not points:
             points = \
             [
@@ -66,25 +69,128 @@ class aecSpace:
             ]
         self.__setBoundary(points)
 
+    def __shape(self) -> shapely.Polygon:
+        """
+        Returns the boundary polygon, constructing it from
+        the coordinate buffer of a restored state if necessary.
+        Returns None if no boundary has been set.
+        """
+        if self.__boundary is None and self.__coords is not None:
+            self.__boundary = shapelyArray.polygons(self.__coords)
+            self.__coords = None
+        return self.__boundary
+
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict):
+        return self.clone()
+
+    def __getstate__(self) -> tuple:
+        """
+        Returns a compact state for pickling, holding the boundary
+        as a buffer of x and y coordinates rather than a polygon,
+        which is empty if no boundary has been set.
+        """
+        if self.__boundary is not None: coords = shapelyArray.get_coordinates(self.__boundary)[:-1]
+        elif self.__coords is not None: coords = self.__coords
+        else: coords = numpy.empty((0, 2))
+        return (self.__address,
+                numpy.ascontiguousarray(coords, dtype = float).tobytes(),
+                self.__color.color + (self.__color.alpha,),
+                self.__convex,
+                self.__height,
+                self.__packedID(),
+                self.__level,
+                self.__name)
+
+    def __packedID(self):
+        """
+        Returns the ID as 16 bytes if it is a UUID in canonical
+        form, or otherwise returns the ID string unchanged.
+        """
+        try:
+            ID = UUID(self.__ID)
+            if str(ID) == self.__ID: return ID.bytes
+        except ValueError:
+            pass
+        return self.__ID
+
+    def __prepared(self) -> shapely.Polygon:
+        """
+        Returns the boundary prepared for repeated spatial predicates, preparing
+        it on first use. Every boundary change creates a new polygon, so a stale
+        prepared boundary is never reused.
+        """
+        boundary = self.__shape()
+        if not shapelyArray.is_prepared(boundary): shapelyArray.prepare(boundary)
+        return boundary
+
+    def __setstate__(self, state: tuple):
+        """
+        Restores a pickled state, deferring construction
+        of the boundary polygon until it is first used.
+        """
+        address, coords, color, convex, height, ID, level, name = state
+        if not isinstance(coords, numpy.ndarray): coords = numpy.frombuffer(coords, dtype = float).reshape(-1, 2)
+        self.__address = address
+        self.__boundary = None
+        self.__color = aecColor.__new__(aecColor)
+        self.__color.__setstate__(color)
+        self.__convex = convex
+        self.__coords = coords if coords.shape[0] > 0 else None
+        self.__height = height
+        self.__ID = ID if isinstance(ID, str) else str(UUID(bytes = ID))
+        self.__level = level
+        self.__name = name
+
     def __setBoundary(self, points: List[aecPoint]) -> bool:
         """
         Creates a boundary from a set of anticlockwise points.
         """
         try:
-            prePoints = self.__points_floor
             points = self.__aecGeometry.rmvColinear(points)
             if len(points) < 3: raise ValueError('Need at least three non-colinear points')                
             polygon = shapely.polygon.orient(shapely.Polygon([point.xy for point in points]))
             if type(polygon) != shapely.polygon.Polygon: raise Exception
-            self.__points_floor = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]] 
             self.__boundary = polygon
-            self.__convex = self.__aecGeometry.isConvex(points)
+            self.__convex = None
+            self.__coords = None
             return True
         except Exception:
-            self.__points_floor = prePoints
-            traceback.print_exc() 
+            aecError.report() 
             return False                 
 
+    @classmethod
+    def fromValidated(cls, coords, level: float = 0.0, height: float = 1.0,
+                      color: Tuple[int, int, int] = None, name: str = ''):
+        """
+        Returns a new aecSpace with a boundary constructed directly from the delivered
+        anticlockwise coordinates, delivered as a list of aecPoints or as an array with x
+        and y in the first two columns, skipping the removal of colinear points, reorientation,
+        and validation applied to boundaries set through the constructor or boundary property.
+        Intended for coordinates already known to describe a valid anticlockwise polygon,
+        such as those produced by aecShaper or by clipping an existing space.
+        Returns None on failure.
+        """
+        try:
+            if len(coords) > 0 and isinstance(coords[0], aecPoint): coords = [pnt.xy for pnt in coords]
+            space = cls.__new__(cls)
+            space.__address = (0, 0, 0)
+            space.__boundary = shapelyArray.polygons(numpy.asarray(coords, dtype = float)[:, :2])
+            space.__color = aecColor()
+            if color is not None: space.__color.color = color
+            space.__convex = None
+            space.__coords = None
+            space.__height = float(height)
+            space.__ID = str(uuid4())
+            space.__level = float(level)
+            space.__name = str(name)
+            return space
+        except Exception:
+            aecError.report()
+            return None
+
     @property
     def address(self) -> Tuple[int, int, int]:
         """
@@ -96,7 +202,7 @@ class aecSpace:
         try:
             return self.__address
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None  
 
     @address.setter
@@ -111,7 +217,7 @@ class aecSpace:
             self.__address = value
         except Exception:
             self.__address = address
-            traceback.print_exc()    
+            aecError.report()    
 
     @property
     def area(self) -> float:
@@ -123,7 +229,7 @@ class aecSpace:
         try:
             return self.boundary.area
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
     
     @property
@@ -141,7 +247,7 @@ class aecSpace:
             if xDelta >= yDelta: return self.axis_x
             else: return self.axis_y
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -159,7 +265,7 @@ class aecSpace:
             if xDelta < yDelta: return self.axis_x
             else: return self.axis_y
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None             
 
     @property
@@ -174,7 +280,7 @@ class aecSpace:
             return [self.__aecGeometry.getMidpoint(box.SW, box.NW),
                     self.__aecGeometry.getMidpoint(box.SE, box.NE)]
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -189,7 +295,7 @@ class aecSpace:
             return [self.__aecGeometry.getMidpoint(box.SW, box.SE),
                     self.__aecGeometry.getMidpoint(box.NW, box.NE)]
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None              
 
     @property
@@ -200,9 +306,9 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            return self.__boundary
+            return self.__shape()
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @boundary.setter
@@ -214,7 +320,7 @@ class aecSpace:
         try:
             self.__setBoundary(value)
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
     
     @property
     def box(self) -> shapely.Polygon:
@@ -224,7 +330,7 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            bounds = self.__boundary.bounds
+            bounds = self.__shape().bounds
             return shapely.polygon.orient(
                    shapely.Polygon(
                    [
@@ -234,7 +340,7 @@ class aecSpace:
                        (bounds[0], bounds[3])
                    ]))
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None  
 
     @property
@@ -249,7 +355,7 @@ class aecSpace:
             point.z = self.elevation
             return point
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -265,7 +371,7 @@ class aecSpace:
             point.z = self.level
             return point
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -280,7 +386,7 @@ class aecSpace:
             flrCenter.z = self.level + (self.height * 0.5)
             return flrCenter
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None     
 
     @property
@@ -294,7 +400,7 @@ class aecSpace:
             centroid = self.centroid_floor
             return aecPoint(centroid.x, centroid.y, self.elevation)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -305,10 +411,10 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            centroid = self.__boundary.centroid    
+            centroid = self.__shape().centroid    
             return aecPoint(centroid.x, centroid.y, self.level)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
         
     @property
@@ -322,7 +428,7 @@ class aecSpace:
             centroid = self.centroid_floor    
             return aecPoint(centroid.x, centroid.y, (self.level + (self.height * 0.5)))
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None         
         
     @property
@@ -333,9 +439,9 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.__boundary.length
+            return self.__shape().length
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None             
 
     @property
@@ -348,7 +454,7 @@ class aecSpace:
         try:
             return self.__color
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @color.setter
@@ -360,7 +466,7 @@ class aecSpace:
         try:
             self.__color.color = value
         except Exception:
-            traceback.print_exc()  
+            aecError.report()  
    
     @property
     def color_alpha(self) -> int:
@@ -372,7 +478,7 @@ class aecSpace:
         try:
             return self.__color.alpha
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @color_alpha.setter
@@ -384,7 +490,7 @@ class aecSpace:
         try:
             self.__color.alpha = value
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             
     @property
     def copy_properties(self) -> dict:
@@ -403,7 +509,7 @@ class aecSpace:
                 'name': self.name,
             }
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
  
     @property
@@ -414,9 +520,10 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
+            if self.__convex is None: self.__convex = self.__aecGeometry.isConvex(self.points_floor)
             return self.__convex
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @property
@@ -429,7 +536,7 @@ class aecSpace:
         try:
             return self.level + self.height
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
 
     @property
@@ -442,7 +549,7 @@ class aecSpace:
         try:
             return self.__height
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @height.setter
@@ -456,7 +563,7 @@ class aecSpace:
             self.__height = float(value)
         except Exception:
             self.__height = preVal
-            traceback.print_exc()   
+            aecError.report()   
 
     @property
     def ID(self) -> str:
@@ -467,7 +574,7 @@ class aecSpace:
         try:
             return self.__ID
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     @property
@@ -480,7 +587,7 @@ class aecSpace:
         try:
             return self.__level
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
  
     @level.setter
@@ -494,7 +601,7 @@ class aecSpace:
             self.__level = float(value)
         except:
             self.__level = preVal
-            traceback.print_exc() 
+            aecError.report() 
 
     @property
     def mesh(self) -> aecGeometry.mesh3D:
@@ -523,7 +630,7 @@ class aecSpace:
                                       indices = indices, 
                                       normals = normals)                      
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None  
         
     @property
@@ -542,7 +649,7 @@ class aecSpace:
                                              indices = mesh2D.indices,
                                              normals = normals)            
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None
         
     @property
@@ -561,7 +668,7 @@ class aecSpace:
                                              indices = mesh2D.indices,
                                              normals = normals)            
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
 
     @property
@@ -584,7 +691,7 @@ class aecSpace:
                                              indices = indices, 
                                              normals = normals)
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None   
 
     @property
@@ -610,7 +717,7 @@ class aecSpace:
                index += 1
             return meshes
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -623,7 +730,7 @@ class aecSpace:
         try:
             return self.__name
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @name.setter
@@ -637,7 +744,7 @@ class aecSpace:
             self.__name = str(value)
         except Exception:
             self.__name = name
-            traceback.print_exc() 
+            aecError.report() 
 
     @property
     def normal_ceiling(self) -> Tuple[float, float, float]:
@@ -649,7 +756,7 @@ class aecSpace:
         try:
             return (0.0, 0.0, 1.0)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
         
     @property
@@ -662,7 +769,7 @@ class aecSpace:
         try:
             return (0.0, 0.0, -1.0)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
              
     @property
@@ -678,7 +785,7 @@ class aecSpace:
                 normals.append(self.__aecGeometry.getNormal(side[0], side[3], side[1]))
             return normals
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None                  
 
     @property
@@ -689,15 +796,10 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            box = self.points_box
-            within = False
-            while not within:
-                x = uniform(box.SW.x, box.SE.x)
-                y = uniform(box.SW.y, box.NW.y)
-                within = self.containsPoint(aecPoint(x, y))
-            return aecPoint(x, y, self.elevation)
+            point = self.samplePoints(1)[0]
+            return aecPoint(point[0], point[1], self.elevation)
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None 
 
     @property
@@ -710,7 +812,7 @@ class aecSpace:
         try:
             return self.points_ceiling[0]
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
 
     @property
@@ -723,7 +825,7 @@ class aecSpace:
         try:
             return self.points_floor[0]
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None        
     
     @property
@@ -734,15 +836,10 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            box = self.points_box
-            within = False
-            while not within:
-                x = uniform(box.SW.x, box.SE.x)
-                y = uniform(box.SW.y, box.NW.y)
-                within = self.containsPoint(aecPoint(x, y))
-            return aecPoint(x, y, self.level)
+            point = self.samplePoints(1)[0]
+            return aecPoint(point[0], point[1], self.level)
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None   
         
     @property
@@ -754,7 +851,7 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            bounds = self.__boundary.bounds
+            bounds = self.__shape().bounds
             level = self.level
             return aecGeometry.quad_points(ID = 0,
                                            SW = aecPoint(bounds[0], bounds[1], level),
@@ -763,7 +860,7 @@ class aecSpace:
                                            NW = aecPoint(bounds[0], bounds[3], level),
                                            normal = self.normal_floor)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None
     
     @property
@@ -776,7 +873,7 @@ class aecSpace:
         try:
             return [aecPoint(pnt.x, pnt.y, self.elevation) for pnt in self.points_floor]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     @property
@@ -787,9 +884,9 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return [aecPoint(pnt.x, pnt.y, self.level) for pnt in self.__points_floor]
+            return [aecPoint(pnt[0], pnt[1], self.level) for pnt in self.__shape().exterior.coords[:-1]]
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None
             
     @property
@@ -811,7 +908,7 @@ class aecSpace:
                 index += 1
             return sides
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @property
@@ -825,7 +922,7 @@ class aecSpace:
             points = self.points_box
             return abs(points.SE.x - points.SW.x)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None  
         
     @property
@@ -839,7 +936,7 @@ class aecSpace:
             points = self.points_box
             return abs(points.NW.y - points.SW.y)
         except:
-            traceback.print_exc() 
+            aecError.report() 
             return None               
 
     @property
@@ -852,7 +949,7 @@ class aecSpace:
         try:
             return self.height * self.area
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None            
 
     def add(self, points: List[aecPoint], restart: bool = False) -> bool:
@@ -866,9 +963,9 @@ class aecSpace:
         """
         try:
             if restart: boundaries = []
-            else: boundaries = [self.__boundary]
+            else: boundaries = [self.__shape()]
             if self.__setBoundary(points):
-                boundaries.append(self.__boundary)
+                boundaries.append(self.__shape())
                 boundaries = shapely.MultiPolygon(boundaries)
                 boundary = shapelyOps.unary_union(boundaries)
                 if type(boundary) != shapely.polygon.Polygon: return False
@@ -876,9 +973,32 @@ class aecSpace:
                 return self.__setBoundary(points)
             return False
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
+    def clone(self):
+        """
+        Returns a new aecSpace with a new ID and the same boundary, address, color,
+        height, level, and name, copying values directly rather than revalidating them.
+        The copy shares the immutable boundary polygon until either space changes it.
+        Returns None on failure.
+        """
+        try:
+            space = aecSpace.__new__(aecSpace)
+            space.__address = self.__address
+            space.__boundary = self.__boundary
+            space.__color = self.__color.clone()
+            space.__convex = self.__convex
+            space.__coords = self.__coords
+            space.__height = self.__height
+            space.__ID = str(uuid4())
+            space.__level = self.__level
+            space.__name = self.__name
+            return space
+        except Exception:
+            aecError.report()
+            return None
+
     def compassLine(self, orient: int = aecGeometry.N) -> List[aecPoint]:
         """
         Returns a line as two endpoints, the spacefloor center and a point
@@ -888,7 +1008,7 @@ class aecSpace:
         try:
             return self.__aecGeometry.getCompassLine(self.points_box, orient)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None 
 
     def compassPoint(self, orient: int = aecGeometry.N) -> aecPoint:
@@ -900,7 +1020,7 @@ class aecSpace:
         try:
             return self.__aecGeometry.getCompassPoint(self.points_box, orient)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None         
 
     def containsPoint(self, point: aecPoint) -> bool:
@@ -909,9 +1029,26 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.boundary.contains(shapely.Point(point.x, point.y))
+            return bool(shapelyArray.contains_xy(self.__prepared(), point.x, point.y))
         except Exception:
-            traceback.print_exc()
+            aecError.report()
+            return None
+
+    def containsPoints(self, points) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating whether the boundary contains each of the
+        delivered points on the shared zero plane, delivered as a list of aecPoints
+        or as an array of coordinates with x and y in the first two columns.
+        Returns an empty array if no points are delivered.
+        Returns None on failure.
+        """
+        try:
+            if len(points) == 0: return numpy.zeros(0, dtype = bool)
+            if isinstance(points[0], aecPoint): points = [pnt.xy for pnt in points]
+            points = numpy.asarray(points, dtype = float).reshape(len(points), -1)
+            return shapelyArray.contains_xy(self.__prepared(), points[:, 0], points[:, 1])
+        except Exception:
+            aecError.report()
             return None
 
     def containsShape(self, points: List[aecPoint]) -> bool:
@@ -920,13 +1057,50 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            shape_points = [pnt.xy for pnt in points]
-            shape = shapely.polygon.orient(shapely.Polygon(shape_points))
-            return self.boundary.contains(shape)
+            shape = shapely.Polygon([pnt.xy for pnt in points])
+            return bool(self.__prepared().contains(shape))
         except Exception:
-            traceback.print_exc()
+            aecError.report()
+            return None
+
+    def containsShapes(self, shapes) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating whether the boundary wholly contains each of
+        the delivered shapes on the shared zero plane, delivered as a list of lists of
+        aecPoints, or as an array of coordinates shaped (shapes, points, 2) for shapes
+        sharing a point count.
+        Returns None on failure.
+        """
+        try:
+            if not isinstance(shapes, numpy.ndarray):
+                shapes = [shapely.Polygon([pnt.xy for pnt in points]) for points in shapes]
+                shapes = numpy.array(shapes, dtype = object)
+            else: shapes = shapelyArray.polygons(shapes[..., :2])
+            return shapelyArray.contains(self.__prepared(), shapes)
+        except Exception:
+            aecError.report()
             return None
         
+    def encloses(self, points) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating whether each of the delivered points falls
+        within the space, respecting the boundary and the level and elevation of the space,
+        delivered as a list of aecPoints or as an array of x, y, and z coordinates.
+        Points delivered without z coordinates are tested against the boundary only.
+        Returns an empty array if no points are delivered.
+        Returns None on failure.
+        """
+        try:
+            if len(points) == 0: return numpy.zeros(0, dtype = bool)
+            if isinstance(points[0], aecPoint): points = [pnt.xyz for pnt in points]
+            points = numpy.asarray(points, dtype = float).reshape(len(points), -1)
+            within = self.containsPoints(points)
+            if points.shape[1] < 3: return within
+            return within & (points[:, 2] >= self.level) & (points[:, 2] <= self.elevation)
+        except Exception:
+            aecError.report()
+            return None
+
     def enclosesPoint(self, point: aecPoint) -> bool:
         """
         Returns True if the delivered point falls within the space,
@@ -936,10 +1110,10 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.boundary.containsPoint(point) and \
+            return self.containsPoint(point) and \
                    point.z >= self.level and point.z <= self.elevation
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
         
     def enclosesSpace(self, points: List[aecPoint], level, elevation) -> bool:
@@ -951,11 +1125,10 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            points = [pnt.xy for pnt in points]
-            return self.boundary.containsShape(points) and \
+            return self.containsShape(points) and \
                    level >= self.level and self.elevation >= elevation
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def fitWithin(self, points: List[aecPoint]) -> bool:
@@ -971,7 +1144,7 @@ class aecSpace:
             if not intersect: return False
             return self.__setBoundary(intersect)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def mirror(self, points: List[aecPoint] = None) -> bool:
@@ -987,7 +1160,7 @@ class aecSpace:
             if not newPoints: return False
             return self.__setBoundary(newPoints)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
     def moveBy(self, x: float = 0, y: float = 0, z: float = 0) -> bool:
@@ -997,11 +1170,13 @@ class aecSpace:
         Returns False on failure.
         """
         try:
-            points = [aecPoint(pnt.x + x, pnt.y + y) for pnt in self.points_floor]
+            x = float(x)
+            y = float(y)
             self.level += z
-            return self.__setBoundary(points)
+            if x or y: self.__boundary = shapelyAffine.translate(self.__shape(), x, y)
+            return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
     def moveTo(self, fromPnt: aecPoint, toPnt: aecPoint) -> bool:
@@ -1016,7 +1191,7 @@ class aecSpace:
             z = toPnt.z - fromPnt.z
             return self.moveBy(x, y, z)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
     def rotate(self, angle: float = 180, point: aecPoint = None) -> bool:
@@ -1030,15 +1205,76 @@ class aecSpace:
         try:
             angle = float(angle)
             if not point: point = self.centroid_floor
-            polygon = shapelyAffine.rotate(self.__boundary, angle, point.xy)
+            polygon = shapelyAffine.rotate(self.__shape(), angle, point.xy)
             if type(polygon) != shapely.polygon.Polygon: return False
             self.__boundary = polygon
             points = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]]
             return self.__setBoundary(points)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False    
       
+    def samplePoints(self, count: int = 1, seed: int = None, spacing: float = None) -> numpy.ndarray:
+        """
+        Returns an array of x, y, and z coordinates of random points within the boundary at
+        the floor level, drawn by triangulating the boundary once, choosing triangles weighted
+        by area, and placing each point at uniform barycentric coordinates in its triangle.
+        If a spacing is delivered, points are instead accepted only if they lie at least that
+        distance from every earlier point, which may return fewer than the requested count
+        if the boundary cannot hold them within a budget of 30 candidates per point.
+        If no seed is delivered, the generator is seeded from the random module, so
+        random.seed() repeats the points as it does placements by aecSpacer.
+        Returns None on failure.
+        """
+        try:
+            count = int(count)
+            if count < 0: return None
+            generator = numpy.random.default_rng(getrandbits(64) if seed is None else seed)
+            triangles = shapelyArray.get_parts(shapelyArray.constrained_delaunay_triangles(self.__shape()))
+            triangles = shapelyArray.get_coordinates(triangles).reshape(-1, 4, 2)[:, :3]
+            origins = triangles[:, 0]
+            edges1 = triangles[:, 1] - origins
+            edges2 = triangles[:, 2] - origins
+            areas = numpy.abs((edges1[:, 0] * edges2[:, 1]) - (edges1[:, 1] * edges2[:, 0]))
+            if areas.sum() <= 0: return None
+            cumulative = numpy.cumsum(areas)
+            def draw(quantity: int) -> numpy.ndarray:
+                chosen = numpy.searchsorted(cumulative, generator.uniform(0, cumulative[-1], quantity), side = 'right')
+                chosen = numpy.minimum(chosen, areas.size - 1)
+                u, v = generator.uniform(0, 1, (2, quantity))
+                flip = (u + v) > 1
+                u[flip] = 1 - u[flip]
+                v[flip] = 1 - v[flip]
+                return origins[chosen] + (u[:, None] * edges1[chosen]) + (v[:, None] * edges2[chosen])
+            if not spacing: points = draw(count)
+            else:
+                spacing = abs(float(spacing))
+                size = spacing / numpy.sqrt(2)
+                xMin, yMin = origins.min(axis = 0)
+                cells = {}
+                accepted = []
+                for candidate in draw(count * 30):
+                    if len(accepted) == count: break
+                    i = int((candidate[0] - xMin) // size)
+                    j = int((candidate[1] - yMin) // size)
+                    near = False
+                    for x in range(i - 2, i + 3):
+                        for y in range(j - 2, j + 3):
+                            other = cells.get((x, y))
+                            if other is not None and \
+                               ((other[0] - candidate[0]) ** 2) + ((other[1] - candidate[1]) ** 2) < spacing ** 2:
+                                near = True
+                                break
+                        if near: break
+                    if near: continue
+                    cells[(i, j)] = candidate
+                    accepted.append(candidate)
+                points = numpy.array(accepted).reshape(-1, 2)
+            return numpy.column_stack((points, numpy.full(points.shape[0], self.level)))
+        except Exception:
+            aecError.report()
+            return None
+
     def scale(self, x: float = 1, y: float = 1, z: float = 1, point: aecPoint = None) -> bool:
         """
         Scales the boundary by a vector from the delivered point.
@@ -1049,16 +1285,65 @@ class aecSpace:
         try:
             prePoints = self.points_floor
             if not point: point = self.centroid_floor
-            polygon = shapelyAffine.scale(self.__boundary, x, y, 1, point.xy)
+            polygon = shapelyAffine.scale(self.__shape(), x, y, 1, point.xy)
             if type(polygon) != shapely.polygon.Polygon: return False
             points = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]] 
             self.height *= float(z)
             return self.__setBoundary(points)
         except Exception:
             self.__setBoundary(prePoints)
-            traceback.print_exc()
+            aecError.report()
             return False        
         
+    def subdivide(self, xDivs = 2, yDivs = 2):
+        """
+        Divides the space into a grid of cells clipped to the boundary, delivered either as
+        quantities of equal divisions of the bounding box or as sequences of the x and y
+        coordinates of the dividing lines. All cells are clipped in a single vectorized
+        intersection, empty cells are dropped, and cells split by the boundary become
+        separate spaces sharing the address of their grid cell.
+        Returns an aecSpaceGroup of spaces with the level, height, and color of this space
+        and addresses of (x index, y index, 0).
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceGroup import aecSpaceGroup
+            xMin, yMin, xMax, yMax = self.__shape().bounds
+            lines = []
+            for divs, low, high in ((xDivs, xMin, xMax), (yDivs, yMin, yMax)):
+                if numpy.isscalar(divs):
+                    divs = int(divs)
+                    if divs < 1: return None
+                    lines.append(numpy.linspace(low, high, divs + 1))
+                    continue
+                divs = numpy.asarray(divs, dtype = float).ravel()
+                divs = divs[(divs > low) & (divs < high)]
+                lines.append(numpy.unique(numpy.concatenate(([low, high], divs))))
+            xLines, yLines = lines
+            xIndex, yIndex = numpy.meshgrid(numpy.arange(xLines.size - 1),
+                                            numpy.arange(yLines.size - 1), indexing = 'ij')
+            xIndex = xIndex.ravel()
+            yIndex = yIndex.ravel()
+            cells = shapelyArray.box(xLines[xIndex], yLines[yIndex], xLines[xIndex + 1], yLines[yIndex + 1])
+            shapelyArray.prepare(self.__shape())
+            cells = shapelyArray.intersection(cells, self.__shape())
+            parts, index = shapelyArray.get_parts(cells, return_index = True)
+            polygons = (shapelyArray.get_type_id(parts) == 3) & (shapelyArray.area(parts) > 0)
+            parts = shapelyArray.orient_polygons(shapelyArray.simplify(parts[polygons], 0))
+            index = index[polygons]
+            group = aecSpaceGroup()
+            spaces = []
+            for part, cell in zip(parts, index.tolist()):
+                space = aecSpace.fromValidated(part.exterior.coords[:-1], self.level, self.height, self.color.color)
+                space.address = (int(xIndex[cell]), int(yIndex[cell]), 0)
+                space.color_alpha = self.color_alpha
+                spaces.append(space)
+            group.add(spaces)
+            return group
+        except Exception:
+            aecError.report()
+            return None
+
     def wrap(self, points: List[aecPoint]) -> bool:
         """
         Sets the boundary to a convex hull
@@ -1071,7 +1356,7 @@ class aecSpace:
             if conHull: return self.__setBoundary(conHull)
             return False
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False       
         
         
\ No newline at end of file
@@ -1,15 +1,4 @@
-import traceback
-
-from OCC.Display.SimpleGui import init_display
-import OCC.AIS
-import OCC.Quantity
-from OCC.gp import gp_Pnt
-from OCC.gp import gp_Vec
-
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeWire
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeFace
-from OCC.BRepPrimAPI import BRepPrimAPI_MakePrism
+from .aecError import aecError
 
 """
 aecSpaceDraw accepts lists of aecSpaces or an
@@ -25,13 +14,14 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
             edges = []
             for pair in pointPairs:
                 newEdge = BRepBuilderAPI_MakeEdge(pair[0], pair[1])
                 edges.append(newEdge.Edge())
             return edges
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def makePointPairs(self, points):
@@ -52,7 +42,7 @@ class aecSpaceDrawOCC:
                 x += 1
             return pointPairs
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def makePoints(self, space):
@@ -63,11 +53,12 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.gp import gp_Pnt
             points = space.points_floor
             if not points: return None
             return [gp_Pnt(pnt.x, pnt.y, pnt.z) for pnt in points]
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def makeWire(self, edges):
@@ -78,12 +69,13 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeWire
             wire = BRepBuilderAPI_MakeWire(edges[0])
             del edges[0] 
             for edge in edges: wire.Add(edge)
             return wire
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def draw3D(self, spaces, displaySize = (1024, 768), update = False):
@@ -94,6 +86,11 @@ class aecSpaceDrawOCC:
         Returns False on failure.
         """
         try:
+            import OCC.Quantity
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeFace
+            from OCC.BRepPrimAPI import BRepPrimAPI_MakePrism
+            from OCC.Display.SimpleGui import init_display
+            from OCC.gp import gp_Vec
             if not spaces: return False
             if type(spaces) != list: spaces = spaces.spaces
             if not spaces: return False
@@ -128,6 +125,6 @@ class aecSpaceDrawOCC:
             __display = None
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
@@ -1,9 +1,6 @@
-import plotly.graph_objs as graph
-import plotly
-import traceback
-
 from typing import List
 
+from .aecError import aecError
 from .aecSpace import aecSpace
 
 """
@@ -27,6 +24,8 @@ class aecSpaceDrawPlotly:
         Returns False on failure.
         """
         try:
+            import plotly
+            import plotly.graph_objs as graph
             for space in spaces:
                 mesh = space.mesh
                 vertices = mesh.vertices
@@ -42,7 +41,7 @@ class aecSpaceDrawPlotly:
             plotly.offline.plot([trace])           
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
 # end class
@@ -0,0 +1,222 @@
+import gc
+import json
+import numpy
+import shapely as shapelyArray
+import struct
+import zlib
+
+from typing import Dict, List, Union
+
+from .aecError import aecError
+from .aecSpace import aecSpace
+from .aecSpaceGroup import aecSpaceGroup
+
+class aecSpaceFile:
+    """
+    Reads and writes groups of aecSpaces in a versioned binary format.
+
+    The file begins with a header recording the format version, the quantity of
+    spaces and coordinates, and a table locating each section. Each section begins
+    on a 64-byte boundary and holds one column for all spaces: IDs, levels, heights,
+    colors with alpha, name indices, addresses, bounding boxes, coordinate offsets,
+    and a single buffer of the x and y coordinates of every boundary in sequence.
+    IDs are held as a single buffer of UTF-8 text with a column of offsets, so IDs
+    of any length are stored unchanged. Version 1 files held 36-byte IDs instead.
+    A JSON section holds the group name and the table of space names. Sections may
+    be compressed with zlib, while uncompressed files can be memory-mapped.
+    """
+
+    __align = 64
+    __magic = b'AECSPACE'
+    __version = 2
+
+    # Defines the header and section table layouts.
+
+    __header = struct.Struct('<8sHHIQQ')
+    __entry = struct.Struct('<16sQQQ')
+
+    # Defines the sections in file order with the data type and row width of each.
+
+    __sections = \
+    {
+        'meta': (numpy.uint8, 1),
+        'ids': (numpy.uint8, 1),
+        'idOffsets': (numpy.int64, 1),
+        'levels': (numpy.float64, 1),
+        'heights': (numpy.float64, 1),
+        'colors': (numpy.uint8, 4),
+        'nameIDs': (numpy.int32, 1),
+        'addresses': (numpy.int64, 3),
+        'bounds': (numpy.float64, 4),
+        'offsets': (numpy.int64, 1),
+        'coords': (numpy.float64, 2),
+    }
+
+    # Defines the header flags.
+
+    Compressed = 1
+
+    def __columns(self, spaces: List[aecSpace]) -> Dict[str, numpy.ndarray]:
+        """
+        Returns the columns of the delivered spaces keyed by section name.
+        """
+        shapes = numpy.empty(len(spaces), dtype = object)
+        shapes[:] = [space.boundary for space in spaces]
+        rings = shapelyArray.get_exterior_ring(shapes)
+        counts = shapelyArray.get_num_coordinates(rings) - 1
+        coords = shapelyArray.get_coordinates(rings)
+        closing = numpy.cumsum(counts + 1) - 1
+        keep = numpy.ones(coords.shape[0], dtype = bool)
+        keep[closing] = False
+        names = {}
+        nameIDs = [names.setdefault(space.name, len(names)) for space in spaces]
+        colors = [space.color.color + (space.color_alpha,) for space in spaces]
+        IDs = [space.ID.encode('utf-8') for space in spaces]
+        return \
+        {
+            'ids': numpy.frombuffer(b''.join(IDs), dtype = numpy.uint8),
+            'idOffsets': numpy.concatenate(([0], numpy.cumsum([len(ID) for ID in IDs]))).astype(numpy.int64),
+            'levels': numpy.array([space.level for space in spaces], dtype = numpy.float64),
+            'heights': numpy.array([space.height for space in spaces], dtype = numpy.float64),
+            'colors': numpy.array(colors, dtype = numpy.uint8).reshape(-1, 4),
+            'nameIDs': numpy.array(nameIDs, dtype = numpy.int32),
+            'addresses': numpy.array([space.address for space in spaces], dtype = numpy.int64).reshape(-1, 3),
+            'bounds': shapelyArray.bounds(shapes).reshape(-1, 4),
+            'offsets': numpy.concatenate(([0], numpy.cumsum(counts))).astype(numpy.int64),
+            'coords': coords[keep],
+            'names': list(names),
+        }
+
+    def getColumns(self, path: str, mmap: bool = False) -> Dict[str, Union[numpy.ndarray, str, List[str]]]:
+        """
+        Returns the columns of the file at the delivered path keyed by section name,
+        with the group name under 'name' and the table of space names under 'names'.
+        The IDs of version 1 files are converted to the buffer and offsets of version 2.
+        If mmap is True and the file is uncompressed, the numeric columns are
+        read-only views of the memory-mapped file rather than copies in memory.
+        Returns None on failure.
+        """
+        try:
+            with open(path, 'rb') as file:
+                magic, version, flags, sections, count, coords = self.__header.unpack(file.read(self.__header.size))
+                if magic != self.__magic: raise ValueError('Not an aecSpace file: ' + str(path))
+                if version > self.__version: raise ValueError('Unsupported aecSpace file version: ' + str(version))
+                entries = [self.__entry.unpack(file.read(self.__entry.size)) for section in range(sections)]
+                compressed = bool(flags & self.Compressed)
+                if not mmap or compressed: data = file.read()
+            columns = {}
+            for key, offset, stored, size in entries:
+                key = key.rstrip(b'\0').decode('ascii')
+                if key not in self.__sections: continue
+                dtype, width = self.__sections[key]
+                if key == 'ids' and version < 2: dtype = 'S36'
+                if size == 0:
+                    column = numpy.empty(0, dtype = dtype)
+                elif compressed:
+                    start = offset - self.__header.size - (self.__entry.size * sections)
+                    column = numpy.frombuffer(zlib.decompress(data[start:start + stored]), dtype = dtype)
+                elif mmap:
+                    column = numpy.memmap(path, dtype = dtype, mode = 'r', offset = offset,
+                                          shape = (size // numpy.dtype(dtype).itemsize,))
+                else:
+                    start = offset - self.__header.size - (self.__entry.size * sections)
+                    column = numpy.frombuffer(data, dtype = dtype, count = size // numpy.dtype(dtype).itemsize, offset = start)
+                if width > 1: column = column.reshape(-1, width)
+                columns[key] = column
+            if version < 2:
+                IDs = [ID.rstrip(b'\0') for ID in columns['ids'].tolist()]
+                columns['ids'] = numpy.frombuffer(b''.join(IDs), dtype = numpy.uint8)
+                columns['idOffsets'] = numpy.concatenate(([0], numpy.cumsum([len(ID) for ID in IDs]))).astype(numpy.int64)
+            meta = json.loads(bytes(columns.pop('meta')).decode('utf-8'))
+            columns['name'] = meta['name']
+            columns['names'] = meta['names']
+            return columns
+        except Exception:
+            aecError.report()
+            return None
+
+    def read(self, path: str) -> aecSpaceGroup:
+        """
+        Returns a new aecSpaceGroup of the spaces in the file at the delivered path,
+        deferring construction of each space's boundary polygon until it is first used
+        and suspending garbage collection while the spaces are created.
+        Returns None on failure.
+        """
+        try:
+            columns = self.getColumns(path)
+            if columns is None: return None
+            offsets = columns['offsets'].tolist()
+            coords = columns['coords']
+            data = columns['ids'].tobytes()
+            ends = columns['idOffsets'].tolist()
+            ids = [data[start:end].decode('utf-8') for start, end in zip(ends[:-1], ends[1:])]
+            names = columns['names']
+            levels = columns['levels'].tolist()
+            heights = columns['heights'].tolist()
+            colors = columns['colors'].tolist()
+            nameIDs = columns['nameIDs'].tolist()
+            addresses = columns['addresses'].tolist()
+            spaces = []
+            collect = gc.isenabled()
+            gc.disable()
+            try:
+                for index in range(len(levels)):
+                    space = aecSpace.__new__(aecSpace)
+                    space.__setstate__((tuple(addresses[index]),
+                                        coords[offsets[index]:offsets[index + 1]],
+                                        tuple(colors[index]),
+                                        None,
+                                        heights[index],
+                                        ids[index],
+                                        levels[index],
+                                        names[nameIDs[index]]))
+                    spaces.append(space)
+            finally:
+                if collect: gc.enable()
+            group = aecSpaceGroup()
+            group.name = columns['name']
+            group.add(spaces)
+            return group
+        except Exception:
+            aecError.report()
+            return None
+
+    def write(self, spaces: Union[aecSpaceGroup, List[aecSpace]], path: str, compress: bool = False) -> bool:
+        """
+        Writes the delivered aecSpaceGroup or list of aecSpaces to the delivered path,
+        compressing each section with zlib if compress is True.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            name = ''
+            if isinstance(spaces, aecSpaceGroup):
+                name = spaces.name
+                spaces = spaces.spaces
+            columns = self.__columns(list(spaces))
+            meta = json.dumps({'name': name, 'names': columns.pop('names')}).encode('utf-8')
+            columns['meta'] = numpy.frombuffer(meta, dtype = numpy.uint8)
+            keys = list(self.__sections)
+            flags = self.Compressed if compress else 0
+            blocks = []
+            for key in keys:
+                raw = numpy.ascontiguousarray(columns[key], dtype = self.__sections[key][0]).tobytes()
+                blocks.append((key, zlib.compress(raw) if compress else raw, len(raw)))
+            offset = self.__header.size + (self.__entry.size * len(keys))
+            starts = []
+            for key, block, size in blocks:
+                offset += -offset % self.__align
+                starts.append(offset)
+                offset += len(block)
+            with open(path, 'wb') as file:
+                file.write(self.__header.pack(self.__magic, self.__version, flags, len(keys),
+                                              len(columns['levels']), len(columns['coords'])))
+                for (key, block, size), start in zip(blocks, starts):
+                    file.write(self.__entry.pack(key.encode('ascii'), start, len(block), size))
+                for (key, block, size), start in zip(blocks, starts):
+                    file.write(b'\0' * (start - file.tell()))
+                    file.write(block)
+            return True
+        except Exception:
+            aecError.report()
+            return False
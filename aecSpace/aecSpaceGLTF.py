@@ -0,0 +1,183 @@
+import json
+import numpy
+import shutil
+import struct
+import tempfile
+
+from itertools import islice
+from typing import Iterable
+
+from .aecError import aecError
+from .aecGeometryArray import aecGeometryArray
+from .aecSpace import aecSpace
+
+class aecSpaceGLTF:
+    """
+    Writes aecSpaces to binary glTF (GLB) files from the packed meshes of aecGeometryArray.
+
+    Meshes are computed and written in batches of spaces, with each vertex attribute and
+    the triangle indices streamed to temporary files that are copied into the binary
+    chunk once the JSON chunk describing them is complete, so memory use is bounded by
+    the batch size. Each space becomes a node with its own mesh and a material from its
+    aecColor, or all spaces are merged into a single mesh with per-vertex colors.
+    The z-up aecSpace coordinates are rotated to the y-up glTF convention at the root node.
+    """
+
+    __aecGeometryArray = aecGeometryArray()
+
+    # Defines the GLB header and chunk layouts and identifiers.
+
+    __header = struct.Struct('<4sII')
+    __chunk = struct.Struct('<I4s')
+    __magic = b'glTF'
+
+    # Defines the glTF component types, buffer view targets, and root rotation.
+
+    __float, __unsigned, __unsignedByte = 5126, 5125, 5121
+    __arrayBuffer, __elementBuffer = 34962, 34963
+    __rotation = [-0.7071067811865476, 0.0, 0.0, 0.7071067811865476]
+
+    def __material(self, color: tuple) -> dict:
+        """
+        Returns a glTF material with the delivered red, green, blue, and alpha
+        values, treating alpha as transparency in the manner of aecColor.
+        """
+        red, green, blue, alpha = color
+        material = \
+        {
+            'pbrMetallicRoughness':
+            {
+                'baseColorFactor': [red / 255, green / 255, blue / 255, 1 - (alpha / 255)],
+                'metallicFactor': 0.0,
+                'roughnessFactor': 1.0,
+            },
+            'doubleSided': False,
+        }
+        if alpha > 0: material['alphaMode'] = 'BLEND'
+        return material
+
+    def write(self, spaces: Iterable[aecSpace], path: str, merge: bool = False, batch: int = 10000) -> bool:
+        """
+        Writes the delivered aecSpaceGroup or iterable of aecSpaces to a GLB file at the
+        delivered path, as a node for each space or, if merge is True, as a single mesh
+        with per-vertex colors, computing and streaming meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            name = getattr(spaces, 'name', '')
+            spaces = iter(getattr(spaces, 'spaces', spaces))
+            batch = max(int(batch), 1)
+            keys = ['positions', 'normals', 'colors', 'indices'] if merge else ['positions', 'normals', 'indices']
+            files = {key: tempfile.TemporaryFile() for key in keys}
+            try:
+                vertexTotal, indexTotal = 0, 0
+                low, high = numpy.full(3, numpy.inf), numpy.full(3, -numpy.inf)
+                nodes, meshes, accessors, materials, colors = [], [], [], [], {}
+                transparent = False
+                while True:
+                    group = list(islice(spaces, batch))
+                    if not group: break
+                    shapes = self.__aecGeometryArray.makeShapes([space.boundary for space in group])
+                    mesh = self.__aecGeometryArray.getMeshes(shapes,
+                                                             [space.level for space in group],
+                                                             [space.height for space in group])
+                    if mesh is None: raise ValueError('Cannot compute meshes')
+                    vertexCounts = numpy.diff(mesh.vertexOffsets)
+                    spaceColors = [space.color.color + (space.color_alpha,) for space in group]
+                    mesh.vertices.tofile(files['positions'])
+                    mesh.normals.tofile(files['normals'])
+                    if merge:
+                        rgba = numpy.array(spaceColors, dtype = numpy.uint8).reshape(-1, 4)
+                        transparent = transparent or bool(rgba[:, 3].any())
+                        rgba[:, 3] = 255 - rgba[:, 3]
+                        numpy.repeat(rgba, vertexCounts, axis = 0).tofile(files['colors'])
+                        offsets = numpy.repeat(mesh.vertexOffsets[:-1] + vertexTotal, numpy.diff(mesh.indexOffsets))
+                        (mesh.indices + offsets.astype(numpy.uint32)).tofile(files['indices'])
+                        if mesh.vertices.size:
+                            low = numpy.minimum(low, mesh.vertices.min(axis = 0))
+                            high = numpy.maximum(high, mesh.vertices.max(axis = 0))
+                    else:
+                        mesh.indices.tofile(files['indices'])
+                        present = vertexCounts > 0
+                        starts = mesh.vertexOffsets[:-1][present]
+                        lows = numpy.minimum.reduceat(mesh.vertices, starts, axis = 0).tolist() if starts.size else []
+                        highs = numpy.maximum.reduceat(mesh.vertices, starts, axis = 0).tolist() if starts.size else []
+                        for item, index in enumerate(numpy.flatnonzero(present).tolist()):
+                            space = group[index]
+                            vertexStart, vertexEnd = mesh.vertexOffsets[index:index + 2].tolist()
+                            indexStart, indexEnd = mesh.indexOffsets[index:index + 2].tolist()
+                            vertexCount = vertexEnd - vertexStart
+                            first = len(accessors)
+                            accessors.append({'bufferView': 0, 'byteOffset': (vertexTotal + vertexStart) * 12,
+                                              'componentType': self.__float, 'count': vertexCount, 'type': 'VEC3',
+                                              'min': lows[item], 'max': highs[item]})
+                            accessors.append({'bufferView': 1, 'byteOffset': (vertexTotal + vertexStart) * 12,
+                                              'componentType': self.__float, 'count': vertexCount, 'type': 'VEC3'})
+                            accessors.append({'bufferView': 2, 'byteOffset': (indexTotal + indexStart) * 4,
+                                              'componentType': self.__unsigned, 'count': indexEnd - indexStart,
+                                              'type': 'SCALAR'})
+                            material = colors.get(spaceColors[index])
+                            if material is None:
+                                material = colors[spaceColors[index]] = len(materials)
+                                materials.append(self.__material(spaceColors[index]))
+                            meshes.append({'primitives': [{'attributes': {'POSITION': first, 'NORMAL': first + 1},
+                                                           'indices': first + 2, 'material': material}]})
+                            nodes.append({'name': space.name, 'mesh': len(meshes) - 1, 'extras': {'ID': space.ID}})
+                    vertexTotal += int(mesh.vertexOffsets[-1])
+                    indexTotal += int(mesh.indexOffsets[-1])
+                sizes = {key: files[key].tell() for key in keys}
+                views, offset = [], 0
+                for key in keys:
+                    view = {'buffer': 0, 'byteOffset': offset, 'byteLength': sizes[key]}
+                    if key == 'indices': view['target'] = self.__elementBuffer
+                    else: view.update({'byteStride': 4 if key == 'colors' else 12, 'target': self.__arrayBuffer})
+                    views.append(view)
+                    offset += sizes[key]
+                if merge and vertexTotal:
+                    accessors = \
+                    [
+                        {'bufferView': 0, 'componentType': self.__float, 'count': vertexTotal, 'type': 'VEC3',
+                         'min': low.tolist(), 'max': high.tolist()},
+                        {'bufferView': 1, 'componentType': self.__float, 'count': vertexTotal, 'type': 'VEC3'},
+                        {'bufferView': 2, 'componentType': self.__unsignedByte, 'normalized': True,
+                         'count': vertexTotal, 'type': 'VEC4'},
+                        {'bufferView': 3, 'componentType': self.__unsigned, 'count': indexTotal, 'type': 'SCALAR'},
+                    ]
+                    materials = [self.__material((255, 255, 255, 0))]
+                    if transparent: materials[0]['alphaMode'] = 'BLEND'
+                    meshes = [{'primitives': [{'attributes': {'POSITION': 0, 'NORMAL': 1, 'COLOR_0': 2},
+                                               'indices': 3, 'material': 0}]}]
+                    nodes = [{'name': name, 'mesh': 0}]
+                document = \
+                {
+                    'asset': {'version': '2.0', 'generator': 'aecSpace'},
+                    'scene': 0,
+                    'scenes': [{'nodes': [0]}],
+                    'nodes': [{'name': name, 'rotation': self.__rotation,
+                               'children': list(range(1, len(nodes) + 1))}] + nodes,
+                }
+                if meshes:
+                    document.update({'meshes': meshes, 'materials': materials, 'accessors': accessors,
+                                     'bufferViews': views, 'buffers': [{'byteLength': offset}]})
+                if not document['nodes'][0]['children']: del document['nodes'][0]['children']
+                text = json.dumps(document, separators = (',', ':')).encode('utf-8')
+                text += b' ' * (-len(text) % 4)
+                binary = offset if meshes else 0
+                length = self.__header.size + self.__chunk.size + len(text)
+                if binary: length += self.__chunk.size + binary
+                with open(path, 'wb') as file:
+                    file.write(self.__header.pack(self.__magic, 2, length))
+                    file.write(self.__chunk.pack(len(text), b'JSON'))
+                    file.write(text)
+                    if binary:
+                        file.write(self.__chunk.pack(binary, b'BIN\0'))
+                        for key in keys:
+                            files[key].seek(0)
+                            shutil.copyfileobj(files[key], file, 1 << 20)
+            finally:
+                for key in keys: files[key].close()
+            return True
+        except Exception:
+            aecError.report()
+            return False
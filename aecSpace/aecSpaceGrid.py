@@ -1,307 +1,599 @@
-import traceback
-import typing
-import uuid
-
-\from aecGeomCalc import aecGeomCalc
-from aecSpace import aecSpace
-from aecSpacer import aecSpacer
-
-
-
-class aecSpaceGrid():
-    
-#    # utility objects and data shared by all instances.
-#    
-#    __aecErrorCheck = aecErrorCheck() # An instance of aecErrorCheck.
-#    __aecGeomCalc = aecGeomCalc()     # An instance of aecGeometryCalc
-#    __aecSpacer = aecSpacer()         # An instance of aecSpacer        
-#    __type = 'aecSpaceGrid'                # Type identifier of object instances
-#    
-#    #__retain is a shared list of self.__property keys of
-#    # values to be retained through a call to __initialize.
-#
-#    __retain = \
-#    ( 
-#        'ID',
-#        'name',
-#    )    
-#    
-#    def __init__(self):
-#        """
-#        INTERNAL
-#        Constructor
-#        Creates the dictionary of all internal keys and values.
-#        Sets the ID to a new UUID.
-#        """
-#        
-#        # __properties is a dictionary of all internal variables
-#        
-#        self.__properties = \
-#        {
-# 
-#            # The following property values are preserved through a call to __initialize.
-#
-#            'cells' : {},           # A dictionary of cells managed by this instance. 
-#            'extents' : (0, 0, 0),  # Dimensions of the cell grid.
-#            'ID' : None,            # A UUID
-#            'name' : "",            # A custom string designation.     
-#
-#            # The following properties are reset by __initialize()
-#
-#            'area' : None,    # Aggregate area of all cells                                
-#            'volume' : None,  # Aggregate volume of all cells
-#
-#        } # end dictionary
-#
-#        self.__properties['ID'] = uuid.uuid4()
-#    
-#    def __initialize(self):
-#        """
-#        INTERNAL
-#        __initialize()
-#        Resets specific internal variables to NONE to 
-#        ensure on-demand recompute of dependent values.
-#        Returns True on success.
-#        Returns False on failure.
-#        """
-#        try:
-#            for key in self.__properties.keys():
-#                if not key in self.__retain:
-#                    self.__properties[key] = None
-#            self.__properties['cells'] = {}
-#            self.__properties['extents'] = (0, 0, 0)
-#            return True
-#        except Exception:
-#            traceback.print_exc()
-#            return False
-#        
-#    def deleteCell(self, address):
-#        """
-#        bool deleteCell((int, int, int))
-#        Deletes the cell at the specified address.
-#        """
-#        try:
-#            address = self.__aecErrorCheck.checkAddress(address)
-#            if not address: return False
-#            self.__properties['cells'][address] = None
-#            return True
-#        except Exception:
-#            traceback.print_exc()
-#            return False
-#        
-#    def deleteCells(self, addresses):
-#        """
-#        [(int, int, int),] deleteCell([(int, int, int),])
-#        Deletes the cells at the specified list of addresses.
-#        Returns list of cells successfully deleted.
-#        Returns False on failure.
-#        """
-#        try:
-#            report = []
-#            for address in addresses:
-#                if self.deleteCell(address): 
-#                    report.append(address)
-#            return report
-#        except Exception:
-#            traceback.print_exc()
-#            return report
-#
-#    def getAddresses(self):
-#        """
-#        [(int, int, int),] getAddresses()
-#        Returns the list of all cell addresses in the grid.
-#        Returns None on failure.
-#        """
-#        try:
-#            addresses = []
-#            for key in self.__properties['cells'].keys():
-#                addresses.append(key)
-#            return addresses
-#        except Exception:
-#            traceback.print_exc()
-#            return None                 
-#    
-#    def getCell(self, address):
-#        """
-#        aecSpace getCell((int, int, int))
-#        Returns the cell at the specified address as an aecSpace.
-#        Returns the last cell if the address is out of range. 
-#        Returns None if the cell at the address has been deleted.
-#        Returns None on Failure.
-#        """
-#        try:
-#            address = self.__aecErrorCheck.checkAddress(address, self.__properties['extents'])
-#            if not address: return None
-#            return self.__properties['cells'][address]
-#        except Exception:
-#            traceback.print_exc()
-#            return None 
-#
-#    def getCells(self, addresses = None):
-#        """
-#        [aecSpace,] getCells([(int, int, int),])
-#        Returns the cells at the specified addresess as a list of aecSpaces.
-#        Returns the last cell if a specified address is out of range. 
-#        Returns an entry of None for every requested cell that has been deleted.
-#        Returns None on Failure.
-#        """
-#        try:
-#            cells = []            
-#            if not addresses: addresses = self.getAddresses()            
-#            for address in addresses:
-#                address = self.__aecErrorCheck.checkAddress(address, self.__properties['extents'])
-#                if not address: continue
-#                cells.append(self.__properties['cells'][address])
-#            return cells
-#        except Exception:
-#            traceback.print_exc()
-#            return None                     
-#
-#    def getExtents(self):
-#        """
-#        (int, int, int) getExtents()
-#        Returns the extents of grid as a 3-digit tuple.
-#        Returns None on Failure.
-#        """
-#        try:
-#            return self.__properties['extents']
-#        except Exception:
-#            traceback.print_exc()
-#            return None 
-#
-#    def getProperties(self):
-#        """
-#        dictionary getProperties()
-#        Retrieves the properties dictionary of all internal values.
-#        Intended for use by other components of the aecSpace toolkit.
-#        Returns None on failure.
-#        """
-#        try:
-#            return self.__properties
-#        except Exception:
-#            traceback.print_exc()
-#            return None        
-#
-#    def getProperty(self, prpName: str):
-#        """
-#        value getProperty(string)
-#        Directly retrieves a property by its string key, bypassing all error checking.
-#        Intended for use by other components of the aecSpace toolkit.
-#        Returns None on failure.
-#        """
-#        try:
-#            return self.__properties[prpName]
-#        except Exception:
-#            traceback.print_exc()
-#            return None
-#
-#    def getType(self):
-#        """
-#        string getType()
-#        Returns a string constant to identify the object type.
-#        Returns None on failure.
-#        """
-#        try:
-#            return self.__type
-#        except Exception:
-#            traceback.print_exc()
-#            return None    
-#
-#    def makeCells(self, origin: tuple = (0, 0, 0), \
-#                        cellSize: tuple = (1, 1, 1), \
-#                        extents: tuple = (1, 1, 1)):
-#        """
-#        bool makeCells((3D point), number, (int, int, int))
-#        Creates a grid in the positive xyz directions from the specified origin.
-#        Each cell will be an aecSpace cube of diameter cellSize.
-#        The overall dimensions of the grid are extents[0] x-axis cells
-#        by extents[1] y-axis cells by extents[2] z-axis cells.
-#        Returns True on success.
-#        Returns False on failure.
-#        """
-#        try:
-#
-#            origin = self.__aecErrorCheck.checkPoint(origin)
-#            if not origin: return False
-#            self.__initialize()
-#            cell = aecSpace()
-#            cell.makeBox(origin, cellSize)
-#            xKey = yKey = zKey = (0, 0, 0)
-#            extents = [int(x - 1) for x in list(extents)]
-#            xRow = [cell] + self.__aecSpacer.row(cell, extents[0])
-#            for xCell in xRow:
-#                if not xCell: continue
-#                xCell.setAddress(xKey)
-#                self.__properties['cells'][xKey] = xCell
-#                yRow = self.__aecSpacer.row(xCell, extents[1], xAxis = False)
-#                for yCell in yRow:
-#                    yKey = (yKey[0], yKey[1] + 1, yKey[2])
-#                    yCell.setAddress(yKey)
-#                    self.__properties['cells'][yKey] = yCell
-#                xKey = yKey = (xKey[0] + 1, xKey[1], xKey[2]) 
-#            zCells = []
-#            for key in self.__properties['cells'].keys():
-#                zStack = self.__aecSpacer.stack(self.__properties['cells'][key], extents[2])
-#                for zCell in zStack:
-#                    zKey = (key[0], key[1], zKey[2] + 1)
-#                    zCell.setAddress(zKey)
-#                    zCells.append((zKey, zCell))
-#                zKey = (key[0], key[1], key[2])
-#            for zCell in zCells:
-#                self.__properties['cells'][zCell[0]] = zCell[1]
-#            self.__properties['extents'] = tuple(extents)
-#            return True
-#        except Exception:
-#            traceback.print_exc()
-#            return False
-#
-#    def setColor(self, newColor = None, addresses = None):
-#        """
-#        [(int, int, int),] setColor (int range 0 - 255, int range 0 - 255, int range 0 - 255), [(int, int, int),])
-#        Sets the color[R G B] values of each cell listed by address in addresses,
-#        or without argument randomizes the color.
-#        Affects all cells if no indices are delivered.        
-#        Returns a list of cell addresses whose color has been changed.
-#        Returns n
-#        Returns False on failure.
-#        """
-#        try:
-#            if not addresses: addresses = self.getAddresses()
-#            report = []
-#            for address in addresses:
-#                address = self.__aecErrorCheck.checkAddresses(address)
-#                if not address: continue
-#                cell = self.getCell(address)
-#                if not cell: continue
-#                cell.setColor(newColor)
-#                report.append(address)
-#            return report
-#        except Exception:
-#            traceback.print_exc()
-#            return report
-#
-#    def setTransparency(self, newTrans = 0, addresses = None):
-#        """
-#        [(int, int, int),] setTransparency(number | string, [(int, int, int),])
-#        Sets the transparency as a percentage or without argument sets transparency to 0.
-#        Converts newTrans input to a range from 0 to 1.
-#        Returns True if successful.
-#        Returns False on failure.
-#        """
-#        try:
-#            newTrans = self.__aecErrorCheck.checkPercentage(newTrans)
-#            if not newTrans: return False
-#            if not addresses: addresses = self.getAddresses()
-#            report = []            
-#            for address in addresses:
-#                address = self.__aecErrorCheck.checkAddresses(address)
-#                if not address: continue
-#                cell = self.getCell(address)
-#                if not cell: continue
-#                cell.setTransparency(newTrans) 
-#                report.append(address)
-#            return True
-#        except Exception:
-#            traceback.print_exc()
-#            return report
-           
\ No newline at end of file
+import numpy
+
+from typing import List, Tuple, Union
+from uuid import uuid4
+
+from .aecError import aecError
+from .aecPoint import aecPoint
+from .aecShaper import aecShaper
+from .aecSpace import aecSpace
+from .aecSpaceGroup import aecSpaceGroup
+from .aecValid import aecValid
+
+class aecSpaceGrid:
+    """
+    Manages a three-dimensional grid of box cells, each identified by an
+    (x, y, z) integer address. Cell states are held in dense arrays indexed
+    by address, and aecSpaces representing cells are created only on request.
+    """
+    __aecShaper = aecShaper()
+    __aecValid = aecValid()
+
+    __slots__ = \
+    [
+        '__alpha',
+        '__cellSize',
+        '__color',
+        '__ID',
+        '__level',
+        '__name',
+        '__nameID',
+        '__names',
+        '__occupied',
+        '__origin',
+    ]
+
+    def __init__(self, origin: aecPoint = aecPoint(),
+                       cellSize: Union[float, Tuple[float, float, float]] = (1, 1, 1),
+                       extents: Tuple[int, int, int] = (1, 1, 1)):
+        """
+        Constructor defaults to a single 1 x 1 x 1 cell with an origin at (0, 0, 0).
+        """
+        self.__ID = str(uuid4())
+        self.__name = ''
+        self.makeCells(origin, cellSize, extents)
+
+    def __index(self, cells = None) -> tuple:
+        """
+        Returns an index into the cell arrays for the delivered cells, which may be a list
+        or array of addresses, a tuple of x, y, and z index arrays such as that returned by
+        numpy.nonzero, omitting any address outside the grid extents, a boolean mask matching
+        the grid extents, or an index expression such as numpy.s_[:, 0, :].
+        Returns an index to all cells if no cells are delivered.
+        """
+        if cells is None: return (slice(None), slice(None), slice(None))
+        if isinstance(cells, (slice, type(Ellipsis))): return (cells,)
+        if isinstance(cells, tuple):
+            if any(isinstance(item, (slice, type(Ellipsis))) for item in cells): return cells
+            if cells and all(isinstance(item, numpy.ndarray) for item in cells):
+                if len(cells) != 3: raise ValueError('Index arrays must cover the x, y, and z axes')
+                cells = numpy.stack(numpy.broadcast_arrays(*cells), axis = -1)
+        cells = numpy.asarray(cells)
+        if cells.dtype == bool:
+            if cells.shape != self.__occupied.shape: raise ValueError('Mask must match the grid extents')
+            return cells
+        cells = cells.astype(int).reshape(-1, 3)
+        inside = numpy.all((cells >= 0) & (cells < self.__occupied.shape), axis = 1)
+        cells = cells[inside]
+        return (cells[:, 0], cells[:, 1], cells[:, 2])
+
+    def __offsets(self, connectivity: int = 6) -> numpy.ndarray:
+        """
+        Returns the address offsets to the neighbors of a cell sharing a face (6),
+        a face or an edge (18), or a face, an edge, or a corner (26).
+        """
+        if connectivity not in (6, 18, 26): raise ValueError('Connectivity must be 6, 18, or 26')
+        offsets = numpy.array(numpy.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing = 'ij')).reshape(3, -1).T
+        distance = numpy.abs(offsets).sum(axis = 1)
+        return offsets[(distance > 0) & (distance <= {6: 1, 18: 2, 26: 3}[connectivity])]
+
+    def __passable(self, occupied: bool = True) -> numpy.ndarray:
+        """
+        Returns a boolean array indexed by address of the undeleted cells,
+        or of the deleted cells if occupied is False.
+        """
+        if occupied: return self.__occupied
+        return ~self.__occupied
+
+    def __rasterize(self, ring: numpy.ndarray, xCenters: numpy.ndarray, yCenters: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns a boolean array indexed by (x, y) position indicating which of the delivered
+        cell center coordinates fall within the delivered closed ring of coordinates, filling
+        every row at once by toggling the parity of cells beyond each scanline crossing.
+        """
+        x0 = ring[:-1, 0]
+        y0 = ring[:-1, 1]
+        x1 = ring[1:, 0]
+        y1 = ring[1:, 1]
+        rows = yCenters[:, None]
+        crosses = (y0 <= rows) != (y1 <= rows)
+        rowIndex, edgeIndex = numpy.nonzero(crosses)
+        edgeY0 = y0[edgeIndex]
+        xCross = x0[edgeIndex] + ((yCenters[rowIndex] - edgeY0) * (x1[edgeIndex] - x0[edgeIndex]) / (y1[edgeIndex] - edgeY0))
+        toggles = numpy.zeros((yCenters.size, xCenters.size + 1), dtype = numpy.int32)
+        numpy.add.at(toggles, (rowIndex, numpy.searchsorted(xCenters, xCross, side = 'right')), 1)
+        return (numpy.cumsum(toggles[:, :-1], axis = 1) % 2 == 1).T
+
+    @property
+    def addresses(self) -> numpy.ndarray:
+        """
+        Property
+        Returns the addresses of all undeleted cells as an array of (x, y, z) rows.
+        Returns None on failure.
+        """
+        try:
+            return numpy.argwhere(self.__occupied)
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def area(self) -> float:
+        """
+        Property
+        Returns the aggregate floor area of all undeleted cells.
+        Returns None on failure.
+        """
+        try:
+            return float(self.count * self.__cellSize[0] * self.__cellSize[1])
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def cellSize(self) -> Tuple[float, float, float]:
+        """
+        Property
+        Returns the x, y, and z dimensions of each cell.
+        Returns None on failure.
+        """
+        try:
+            return self.__cellSize
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def count(self) -> int:
+        """
+        Property
+        Returns the quantity of undeleted cells.
+        Returns None on failure.
+        """
+        try:
+            return int(numpy.count_nonzero(self.__occupied))
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def extents(self) -> Tuple[int, int, int]:
+        """
+        Property
+        Returns the quantity of cells along the x, y, and z axes.
+        Returns None on failure.
+        """
+        try:
+            return self.__occupied.shape
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def ID(self) -> str:
+        """
+        Property
+        Returns the UUID.
+        """
+        try:
+            return self.__ID
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def name(self) -> str:
+        """
+        Property
+        Returns the name.
+        Returns None on failure.
+        """
+        try:
+            return self.__name
+        except Exception:
+            aecError.report()
+            return None
+
+    @name.setter
+    def name(self, value: str):
+        """
+        Property
+        Sets the name.
+        """
+        try:
+            name = self.__name
+            self.__name = str(value)
+        except Exception:
+            self.__name = name
+            aecError.report()
+
+    @property
+    def occupied(self) -> numpy.ndarray:
+        """
+        Property
+        Returns a read-only boolean array indexed by address
+        indicating which cells have not been deleted.
+        Returns None on failure.
+        """
+        try:
+            occupied = self.__occupied.view()
+            occupied.flags.writeable = False
+            return occupied
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def origin(self) -> aecPoint:
+        """
+        Property
+        Returns the minimum corner of the grid.
+        Returns None on failure.
+        """
+        try:
+            return aecPoint(self.__origin[0], self.__origin[1], self.__origin[2])
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def volume(self) -> float:
+        """
+        Property
+        Returns the aggregate volume of all undeleted cells.
+        Returns None on failure.
+        """
+        try:
+            return float(self.count * self.__cellSize[0] * self.__cellSize[1] * self.__cellSize[2])
+        except Exception:
+            aecError.report()
+            return None
+
+    def deleteCell(self, address: Tuple[int, int, int]) -> bool:
+        """
+        Deletes the cell at the specified address.
+        Returns True on success.
+        Returns False if the address is outside the grid or on other failure.
+        """
+        try:
+            address = self.__aecValid.address(tuple(numpy.asarray(address).tolist()))
+            if not address: return False
+            if any(index >= limit for index, limit in zip(address, self.extents)): return False
+            self.__occupied[address] = False
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def deleteCells(self, cells = None) -> bool:
+        """
+        Deletes the delivered cells, which may be a list or array of addresses,
+        a tuple of index arrays, a boolean mask matching the grid extents,
+        or an index expression.
+        Deletes all cells if no cells are delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            self.__occupied[self.__index(cells)] = False
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def floodFill(self, seeds: List[Tuple[int, int, int]], 
+                        connectivity: int = 6, 
+                        occupied: bool = True) -> numpy.ndarray:
+        """
+        Returns the addresses of all cells reachable from the delivered list or array
+        of seed addresses by steps between neighboring cells, as an array of (x, y, z) rows.
+        Connectivity of 6, 18, or 26 admits steps through cell faces, edges, or corners.
+        Steps pass through undeleted cells, or through deleted cells if occupied is False.
+        Seeds outside the grid or not matching the occupied state are ignored.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__occupied.shape
+            passable = self.__passable(occupied)
+            offsets = self.__offsets(connectivity)
+            frontier = numpy.asarray(seeds, dtype = int).reshape(-1, 3)
+            frontier = frontier[numpy.all((frontier >= 0) & (frontier < shape), axis = 1)]
+            frontier = frontier[passable[tuple(frontier.T)]]
+            visited = numpy.zeros(shape, dtype = bool)
+            visited[tuple(frontier.T)] = True
+            while len(frontier) > 0:
+                candidates = (frontier[:, None, :] + offsets[None, :, :]).reshape(-1, 3)
+                candidates = candidates[numpy.all((candidates >= 0) & (candidates < shape), axis = 1)]
+                index = tuple(candidates.T)
+                candidates = candidates[passable[index] & ~visited[index]]
+                cells = numpy.unique(numpy.ravel_multi_index(tuple(candidates.T), shape))
+                visited.reshape(-1)[cells] = True
+                frontier = numpy.column_stack(numpy.unravel_index(cells, shape))
+            return numpy.argwhere(visited)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getCell(self, address: Tuple[int, int, int]) -> aecSpace:
+        """
+        Returns a new aecSpace representing the cell at the specified address.
+        Returns the last cell if the address is out of range.
+        Returns None if the cell at the address has been deleted.
+        Returns None on failure.
+        """
+        try:
+            bounds = [limit - 1 for limit in self.extents]
+            address = self.__aecValid.address(tuple(numpy.asarray(address).tolist()), bounds)
+            if not address or not self.__occupied[address]: return None
+            sizeX, sizeY, sizeZ = self.__cellSize
+            origin = aecPoint(self.__origin[0] + (address[0] * sizeX),
+                              self.__origin[1] + (address[1] * sizeY))
+            cell = aecSpace.fromValidated(self.__aecShaper.makeBox(origin, sizeX, sizeY))
+            cell.address = address
+            cell.height = sizeZ
+            cell.level = self.__level[address]
+            cell.color = self.__color[address].tolist()
+            cell.color_alpha = int(self.__alpha[address])
+            cell.name = self.__names[self.__nameID[address]]
+            return cell
+        except Exception:
+            aecError.report()
+            return None
+
+    def getCells(self, addresses: List[Tuple[int, int, int]] = None) -> List[aecSpace]:
+        """
+        Returns new aecSpaces representing the cells at the specified addresses.
+        Returns an entry of None for every requested cell that has been deleted.
+        Returns all undeleted cells if no addresses are delivered.
+        Returns None on failure.
+        """
+        try:
+            if addresses is None: addresses = self.addresses
+            return [self.getCell(address) for address in numpy.asarray(addresses).reshape(-1, 3).tolist()]
+        except Exception:
+            aecError.report()
+            return None
+
+    def getComponents(self, connectivity: int = 6, occupied: bool = True) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Groups the undeleted cells, or the deleted cells if occupied is False, into
+        connected components of neighboring cells. Connectivity of 6, 18, or 26
+        joins cells sharing faces, edges, or corners.
+        Returns an array of (x, y, z) address rows and an array of the
+        corresponding component numbers, counting from 0.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__occupied.shape
+            passable = self.__passable(occupied)
+            size = passable.size
+            labels = numpy.full(size + 1, size, dtype = numpy.int64)
+            labels[:size][passable.reshape(-1)] = numpy.flatnonzero(passable)
+            grid = labels[:size].reshape(shape)
+            offsets = self.__offsets(connectivity)
+            changed = True
+            while changed:
+                previous = labels.copy()
+                for offset in offsets.tolist():
+                    target = tuple(slice(max(step, 0), limit + min(step, 0)) for step, limit in zip(offset, shape))
+                    source = tuple(slice(max(-step, 0), limit + min(-step, 0)) for step, limit in zip(offset, shape))
+                    numpy.minimum(grid[target], grid[source], out = grid[target], where = passable[target])
+                jumped = labels[labels]
+                while not numpy.array_equal(jumped, labels):
+                    labels = jumped
+                    jumped = labels[labels]
+                grid = labels[:size].reshape(shape)
+                changed = not numpy.array_equal(labels, previous)
+            roots = labels[:size][passable.reshape(-1)]
+            components = numpy.unique(roots, return_inverse = True)[1]
+            return numpy.argwhere(passable), components.reshape(-1)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getEnclosed(self, connectivity: int = 6) -> numpy.ndarray:
+        """
+        Returns the addresses of deleted cells that cannot be reached from
+        the outer faces of the grid through other deleted cells, as an
+        array of (x, y, z) rows. Connectivity of 6, 18, or 26 admits steps
+        through cell faces, edges, or corners.
+        Returns None on failure.
+        """
+        try:
+            empty = ~self.__occupied
+            border = numpy.zeros(empty.shape, dtype = bool)
+            border[[0, -1], :, :] = True
+            border[:, [0, -1], :] = True
+            border[:, :, [0, -1]] = True
+            reached = numpy.zeros(empty.shape, dtype = bool)
+            reached[tuple(self.floodFill(numpy.argwhere(empty & border), connectivity, False).T)] = True
+            return numpy.argwhere(empty & ~reached)
+        except Exception:
+            aecError.report()
+            return None
+
+    def getNeighbors(self, addresses: List[Tuple[int, int, int]], 
+                           connectivity: int = 6, 
+                           occupied: bool = True) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the addresses of the neighbors within the grid of each of the delivered
+        list or array of addresses as an array of (x, y, z) rows, and an array of the
+        index of the delivered address to which each neighbor belongs.
+        Connectivity of 6, 18, or 26 includes neighbors sharing faces, edges, or corners.
+        Includes only undeleted neighbors, only deleted neighbors if occupied
+        is False, or all neighbors if occupied is None.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__occupied.shape
+            addresses = numpy.asarray(addresses, dtype = int).reshape(-1, 3)
+            offsets = self.__offsets(connectivity)
+            neighbors = (addresses[:, None, :] + offsets[None, :, :]).reshape(-1, 3)
+            sources = numpy.repeat(numpy.arange(len(addresses)), len(offsets))
+            inside = numpy.all((neighbors >= 0) & (neighbors < shape), axis = 1)
+            neighbors = neighbors[inside]
+            sources = sources[inside]
+            if occupied is not None:
+                keep = self.__passable(occupied)[tuple(neighbors.T)]
+                neighbors = neighbors[keep]
+                sources = sources[keep]
+            return neighbors, sources
+        except Exception:
+            aecError.report()
+            return None
+
+    def makeCells(self, origin: aecPoint = aecPoint(),
+                        cellSize: Union[float, Tuple[float, float, float]] = (1, 1, 1),
+                        extents: Tuple[int, int, int] = (1, 1, 1)) -> bool:
+        """
+        Creates a grid in the positive xyz directions from the specified origin,
+        replacing any existing cells. Cells measure cellSize, delivered as a single
+        dimension or as x, y, and z dimensions, and the overall grid measures
+        extents[0] x-axis cells by extents[1] y-axis cells by extents[2] z-axis cells.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if numpy.isscalar(cellSize): cellSize = (cellSize, cellSize, cellSize)
+            cellSize = tuple(abs(float(size)) for size in cellSize[:3])
+            extents = self.__aecValid.address(tuple(numpy.asarray(extents).tolist()))
+            if not extents or 0 in cellSize: return False
+            self.__origin = origin.xyz
+            self.__cellSize = cellSize
+            self.__occupied = numpy.ones(extents, dtype = bool)
+            self.__color = numpy.full(extents + (3,), 255, dtype = numpy.uint8)
+            self.__alpha = numpy.zeros(extents, dtype = numpy.uint8)
+            self.__nameID = numpy.zeros(extents, dtype = numpy.int32)
+            self.__names = ['']
+            levels = origin.z + (numpy.arange(extents[2]) * cellSize[2])
+            self.__level = numpy.empty(extents, dtype = float)
+            self.__level[...] = levels
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def setColor(self, color: Tuple[int, int, int], cells = None) -> bool:
+        """
+        Sets the color of the delivered cells with RGB integer values from 0 to 255.
+        Cells may be a list or array of addresses, a tuple of index arrays,
+        a boolean mask matching the grid extents, or an index expression.
+        Affects all cells if no cells are delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if len(color) != 3: return False
+            self.__color[self.__index(cells)] = [int(abs(value)) % 256 for value in color]
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def setLevelOffset(self, offset: float = 0, cells = None) -> bool:
+        """
+        Sets the level of the delivered cells to their nominal layer level plus the offset.
+        Cells may be a list or array of addresses, a tuple of index arrays,
+        a boolean mask matching the grid extents, or an index expression.
+        Affects all cells if no cells are delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            levels = self.__origin[2] + (numpy.arange(self.__level.shape[2]) * self.__cellSize[2])
+            levels = numpy.broadcast_to(levels, self.__level.shape)
+            index = self.__index(cells)
+            self.__level[index] = levels[index] + float(offset)
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def setName(self, name: str = '', cells = None) -> bool:
+        """
+        Sets the name of the delivered cells.
+        Cells may be a list or array of addresses, a tuple of index arrays,
+        a boolean mask matching the grid extents, or an index expression.
+        Affects all cells if no cells are delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            name = str(name)
+            if name not in self.__names: self.__names.append(name)
+            self.__nameID[self.__index(cells)] = self.__names.index(name)
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def setTransparency(self, alpha: int = 0, cells = None) -> bool:
+        """
+        Sets the color alpha of the delivered cells with an integer between 0 and 255.
+        Cells may be a list or array of addresses, a tuple of index arrays,
+        a boolean mask matching the grid extents, or an index expression.
+        Affects all cells if no cells are delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            self.__alpha[self.__index(cells)] = int(abs(alpha)) % 256
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def voxelize(self, spaces: Union[aecSpace, aecSpaceGroup, List[aecSpace]],
+                       cellSize: Union[float, Tuple[float, float, float]] = (1, 1, 1)) -> numpy.ndarray:
+        """
+        Rebuilds the grid with the delivered cell size to enclose the delivered aecSpace,
+        list of aecSpaces, or aecSpaceGroup, and marks as occupied each cell whose center
+        falls within a space boundary and between the space's level and elevation.
+        Occupied cells take the color, alpha, and name of their space; all other cells are deleted.
+        Where spaces overlap, later spaces in the list take precedence.
+        Returns an integer array indexed by address holding the list index
+        of the space occupying each cell, or -1 for unoccupied cells.
+        Returns None on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpace): spaces = [spaces]
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            if not spaces: return None
+            if numpy.isscalar(cellSize): cellSize = (cellSize, cellSize, cellSize)
+            size = numpy.abs(numpy.array(cellSize[:3], dtype = float))
+            bounds = numpy.array([space.boundary.bounds for space in spaces])
+            levels = numpy.array([space.level for space in spaces])
+            elevations = numpy.array([space.elevation for space in spaces])
+            minimum = numpy.array([bounds[:, 0].min(), bounds[:, 1].min(), levels.min()])
+            maximum = numpy.array([bounds[:, 2].max(), bounds[:, 3].max(), elevations.max()])
+            extents = numpy.maximum(numpy.ceil((maximum - minimum) / size), 1).astype(int)
+            if not self.makeCells(aecPoint(*minimum.tolist()), tuple(size.tolist()), tuple(extents.tolist())): return None
+            xCenters = minimum[0] + ((numpy.arange(extents[0]) + 0.5) * size[0])
+            yCenters = minimum[1] + ((numpy.arange(extents[1]) + 0.5) * size[1])
+            zCenters = minimum[2] + ((numpy.arange(extents[2]) + 0.5) * size[2])
+            labels = numpy.full(tuple(extents.tolist()), -1, dtype = numpy.int32)
+            for index, space in enumerate(spaces):
+                iLow, jLow = numpy.searchsorted(xCenters, bounds[index, 0]), numpy.searchsorted(yCenters, bounds[index, 1])
+                iTop, jTop = numpy.searchsorted(xCenters, bounds[index, 2]), numpy.searchsorted(yCenters, bounds[index, 3])
+                kLow = numpy.searchsorted(zCenters, levels[index])
+                kTop = numpy.searchsorted(zCenters, elevations[index])
+                if iLow >= iTop or jLow >= jTop or kLow >= kTop: continue
+                ring = numpy.asarray(space.boundary.exterior.coords)
+                inside = self.__rasterize(ring, xCenters[iLow:iTop], yCenters[jLow:jTop])
+                labels[iLow:iTop, jLow:jTop, kLow:kTop][inside] = index
+            occupied = labels >= 0
+            names = sorted(set(space.name for space in spaces) - {''})
+            nameIDs = {name: index + 1 for index, name in enumerate(names)}
+            colors = numpy.array([space.color.color for space in spaces], dtype = numpy.uint8)
+            alphas = numpy.array([space.color_alpha for space in spaces], dtype = numpy.uint8)
+            nameID = numpy.array([nameIDs.get(space.name, 0) for space in spaces], dtype = numpy.int32)
+            spaceIndex = labels[occupied]
+            self.__occupied[...] = occupied
+            self.__color[occupied] = colors[spaceIndex]
+            self.__alpha[occupied] = alphas[spaceIndex]
+            self.__nameID[occupied] = nameID[spaceIndex]
+            self.__names = [''] + names
+            return labels
+        except Exception:
+            aecError.report()
+            return None
@@ -1,9 +1,13 @@
-import traceback
+import numpy
 
 from typing import List, Tuple
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import shapely as shapelyArray
+
+from .aecError import aecError
 from .aecGeometry import aecGeometry
+from .aecGeometryArray import aecGeometryArray
 from .aecPoint import aecPoint
 from .aecSpace import aecSpace
 
@@ -13,7 +17,13 @@ class aecSpaceGroup:
     enabling collective editing and reporting.
     """
 
-    __slots__ = ['__aecGeometry', '__ID', '__name', '__spaces']
+    __aecGeometryArray = aecGeometryArray()
+
+    # Defines a series of constants indicating the outcome of clipping or subtracting from each space.
+    
+    Unchanged, Clipped, Dropped, Split, Pierced = range(0, 5)
+
+    __slots__ = ['__aecGeometry', '__ID', '__name', '__shapeCache', '__spaces']
       
     def __init__(self, x:float = 0, y:float = 0, z:float = 0):
         """
@@ -22,7 +32,99 @@ class aecSpaceGroup:
         self.__aecGeometry = aecGeometry()
         self.__ID = str(uuid4())
         self.__name = ''
+        self.__shapeCache = None
         self.__spaces = []
+
+    def __getstate__(self) -> tuple:
+        """
+        Returns a compact state for pickling, holding the boundaries of all spaces as
+        a single buffer of x and y coordinates with a buffer of the coordinate counts,
+        and the IDs, colors, levels, and heights of all spaces as single buffers.
+        IDs are held as a list instead if any space has an ID that is not a UUID.
+        """
+        states = [space.__getstate__() for space in self.__spaces]
+        addresses, coords, colors, convex, heights, IDs, levels, names = zip(*states) if states else ((),) * 8
+        counts = numpy.array([len(points) // 16 for points in coords], dtype = numpy.int64)
+        return (UUID(self.__ID).bytes,
+                self.__name,
+                b''.join(IDs) if all(isinstance(spaceID, bytes) for spaceID in IDs) else list(IDs),
+                counts.tobytes(),
+                b''.join(coords),
+                numpy.array(colors, dtype = numpy.uint8).tobytes(),
+                numpy.array(levels, dtype = float).tobytes(),
+                numpy.array(heights, dtype = float).tobytes(),
+                list(addresses),
+                list(convex),
+                list(names))
+
+    def __setstate__(self, state: tuple):
+        """
+        Restores a pickled state, deferring construction of each
+        space's boundary polygon until it is first used.
+        """
+        ID, name, IDs, counts, coords, colors, levels, heights, addresses, convex, names = state
+        offsets = numpy.concatenate(([0], numpy.cumsum(numpy.frombuffer(counts, dtype = numpy.int64)))).tolist()
+        coords = numpy.frombuffer(coords, dtype = float).reshape(-1, 2)
+        colors = numpy.frombuffer(colors, dtype = numpy.uint8).reshape(-1, 4).tolist()
+        levels = numpy.frombuffer(levels, dtype = float).tolist()
+        heights = numpy.frombuffer(heights, dtype = float).tolist()
+        self.__aecGeometry = aecGeometry()
+        self.__ID = str(UUID(bytes = ID))
+        self.__name = name
+        self.__shapeCache = None
+        self.__spaces = []
+        for index in range(len(names)):
+            space = aecSpace.__new__(aecSpace)
+            space.__setstate__((addresses[index],
+                                coords[offsets[index]:offsets[index + 1]],
+                                tuple(colors[index]),
+                                convex[index],
+                                heights[index],
+                                IDs[index * 16:(index + 1) * 16] if isinstance(IDs, bytes) else IDs[index],
+                                levels[index],
+                                names[index]))
+            self.__spaces.append(space)
+
+    def __reshape(self, index: numpy.ndarray, shapes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Replaces the boundaries of the spaces at the delivered indices with the largest
+        polygon part of the corresponding delivered geometries, and returns an array of
+        the outcome for each space, which is Dropped if no polygon part remains, or
+        Pierced if the largest part encloses a hole, leaving the space unchanged.
+        New boundaries are simplified and oriented in single vectorized calls and set
+        from their coordinates without the validation of the boundary property.
+        """
+        largest, counts = self.__aecGeometryArray.getLargest(shapes)
+        outcomes = numpy.where(counts > 1, self.Split, numpy.where(counts == 1, self.Clipped, self.Dropped))
+        present = numpy.flatnonzero(counts > 0)
+        parts = shapelyArray.orient_polygons(shapelyArray.simplify(largest[present], 0))
+        pierced = shapelyArray.get_num_interior_rings(parts) > 0
+        outcomes[present[pierced]] = self.Pierced
+        present = present[~pierced]
+        exteriors = shapelyArray.get_exterior_ring(parts[~pierced])
+        offsets = numpy.concatenate(([0], numpy.cumsum(shapelyArray.get_num_coordinates(exteriors)))).tolist()
+        coords = shapelyArray.get_coordinates(exteriors)
+        for item, row in enumerate(present.tolist()):
+            space = self.__spaces[index[row]]
+            space.__setstate__((space.address,
+                                coords[offsets[item]:offsets[item + 1] - 1],
+                                space.color.color + (space.color_alpha,),
+                                None,
+                                space.height,
+                                space.ID,
+                                space.level,
+                                space.name))
+        return outcomes
+
+    def __shapes(self) -> numpy.ndarray:
+        """
+        Returns an array of the current boundaries of all spaces, reusing the array
+        from the previous call if every space still has the same boundary.
+        """
+        boundaries = [space.boundary for space in self.__spaces]
+        if self.__shapeCache is None or self.__shapeCache[0] != boundaries:
+            self.__shapeCache = (boundaries, self.__aecGeometryArray.makeShapes(boundaries))
+        return self.__shapeCache[1]
         
     @property
     def area(self) -> float:
@@ -32,12 +134,37 @@ class aecSpaceGroup:
         Return None on failure.
         """
         try:
-            space_area = 0
-            for space in self.__spaces: space_area += space.area
-            return space_area
+            return float(self.__aecGeometryArray.getAreas(self.__shapes()).sum())
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None   
+
+    @property
+    def areas(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the area of each space.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometryArray.getAreas(self.__shapes())
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def bounds(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the minimum x, minimum y, maximum x,
+        and maximum y coordinates of each space boundary.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometryArray.getBounds(self.__shapes())
+        except Exception:
+            aecError.report()
+            return None
     
     @property
     def by_level(self) -> List[aecSpace]:
@@ -49,9 +176,22 @@ class aecSpaceGroup:
         try:
             return self.__spaces.sort(key = lambda space: space.level)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None     
 
+    @property
+    def centroids(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the x and y coordinates of the floor centroid of each space.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometryArray.getCentroids(self.__shapes())
+        except Exception:
+            aecError.report()
+            return None
+
     @property
     def count(self) -> float:
         """
@@ -62,7 +202,7 @@ class aecSpaceGroup:
         try:
             return len(self.__spaces)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None   
         
     @property
@@ -75,9 +215,26 @@ class aecSpaceGroup:
         try:
             return list(range(0, len(self.__spaces)))
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
 
+    @property
+    def meshes(self) -> aecGeometryArray.meshes:
+        """
+        Property
+        Returns a packed mesh of all spaces with float32 vertices and normals,
+        uint32 triangle indices local to each space, and the offsets of each
+        space's vertices and indices.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometryArray.getMeshes(self.__shapes(),
+                                                     [space.level for space in self.__spaces],
+                                                     [space.height for space in self.__spaces])
+        except Exception:
+            aecError.report()
+            return None
+
     @property
     def name(self) -> str:
         """
@@ -88,7 +245,7 @@ class aecSpaceGroup:
         try:
             return self.__name
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
     @name.setter
@@ -102,7 +259,7 @@ class aecSpaceGroup:
             self.__name = str(value)
         except Exception:
             self.__name = name
-            traceback.print_exc() 
+            aecError.report() 
 
     @property
     def spaces(self) -> List[aecSpace]:
@@ -114,7 +271,7 @@ class aecSpaceGroup:
         try:
             return self.__spaces
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None 
         
     @spaces.setter
@@ -129,7 +286,7 @@ class aecSpaceGroup:
             self.__spaces = value
         except Exception:
             self.__spaces = preSpaces
-            traceback.print_exc()
+            aecError.report()
             return None
     
     @property
@@ -140,11 +297,10 @@ class aecSpaceGroup:
         Returns None on failure.
         """
         try:
-            space_volume = 0
-            for space in self.__spaces: space_volume += space.volume
-            return space_volume
+            heights = numpy.array([space.height for space in self.__spaces], dtype = float)
+            return float((self.__aecGeometryArray.getAreas(self.__shapes()) * heights).sum())
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None    
         
     def add(self, spaces: List[aecSpace]) -> bool:
@@ -157,7 +313,7 @@ class aecSpaceGroup:
             for space in spaces: self.__spaces.append(space)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
         
     def clear(self) -> bool:
@@ -170,9 +326,22 @@ class aecSpaceGroup:
             self.__spaces = []
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False    
         
+    def containsShape(self, points: List[aecPoint]) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating which spaces wholly contain
+        the shape described by the delivered list of points.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__aecGeometryArray.makeShape(points)
+            return self.__aecGeometryArray.getContains(self.__shapes(), shape)
+        except Exception:
+            aecError.report()
+            return None
+
     def delete(self, index):
         """
         Deletes the space at the specified index of the current list of spaces.
@@ -187,9 +356,148 @@ class aecSpaceGroup:
             self.__spaces = spaces
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
         
+    def fitWithin(self, points: List[aecPoint]) -> List[int]:
+        """
+        Clips every space to the perimeter described by the delivered list of points,
+        preparing the perimeter once and intersecting all spaces in a single vectorized call.
+        Spaces wholly within the perimeter are Unchanged, spaces partially within it are
+        Clipped, spaces divided by the perimeter into several parts are Split and keep their
+        largest part, and spaces outside the perimeter are Dropped and removed from the group.
+        Returns a list of outcomes in the order of the spaces before clipping.
+        Returns None on failure.
+        """
+        try:
+            boundary = self.__aecGeometryArray.makeShape(points)
+            shapes = self.__shapes()
+            outcomes = numpy.full(shapes.size, self.Unchanged, dtype = int)
+            clip = numpy.flatnonzero(~self.__aecGeometryArray.getCovered(shapes, boundary))
+            outcomes[clip] = self.__reshape(clip, self.__aecGeometryArray.getIntersection(shapes[clip], boundary))
+            self.__spaces = [space for space, outcome in zip(self.__spaces, outcomes) if outcome != self.Dropped]
+            return outcomes.tolist()
+        except Exception:
+            aecError.report()
+            return None
+
+    def getUnion(self) -> List[List[aecPoint]]:
+        """
+        Returns the points of the perimeters of the combined boundaries of all spaces,
+        as a list of lists of points defining each separate perimeter.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometryArray.getUnion(self.__shapes())
+        except Exception:
+            aecError.report()
+            return None
+
+    def intersectsShape(self, points: List[aecPoint]) -> numpy.ndarray:
+        """
+        Returns a boolean array indicating which spaces share any area
+        with the shape described by the delivered list of points.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__aecGeometryArray.makeShape(points)
+            return self.__aecGeometryArray.getIntersects(self.__shapes(), shape)
+        except Exception:
+            aecError.report()
+            return None
+
+    @staticmethod
+    def iterGeoJSON(path: str, batch: int = 10000):
+        """
+        Returns an iterator of new aecSpaces read incrementally from the GeoJSON
+        FeatureCollection at the delivered path, constructed in batches of the delivered size.
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceJSON import aecSpaceJSON
+            return aecSpaceJSON().iterGeoJSON(path, batch)
+        except Exception:
+            aecError.report()
+            return None
+
+    @staticmethod
+    def iterJSONL(path: str, batch: int = 10000):
+        """
+        Returns an iterator of new aecSpaces read line by line from the JSON-lines
+        file at the delivered path, constructed in batches of the delivered size.
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceJSON import aecSpaceJSON
+            return aecSpaceJSON().iterJSONL(path, batch)
+        except Exception:
+            aecError.report()
+            return None
+
+    def load(self, path: str) -> bool:
+        """
+        Replaces the name and spaces of the group with those
+        stored in the aecSpaceFile at the delivered path.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceFile import aecSpaceFile
+            group = aecSpaceFile().read(path)
+            if group is None: return False
+            self.__name = group.name
+            self.__spaces = group.spaces
+            return True
+        except Exception:
+            aecError.report()
+            return False
+
+    def locate(self, points, chunk: int = 1000000) -> numpy.ndarray:
+        """
+        Returns an array of the index of the space enclosing each of the delivered points,
+        respecting the boundary and the level and elevation of each space, delivered as a
+        list of aecPoints or as an array of x, y, and z coordinates. Points are matched in
+        chunks of the delivered size against a spatial index of the boundaries, then
+        tested against the prepared boundaries of the candidate spaces.
+        Points delivered without z coordinates are located by boundary only.
+        Where spaces overlap, the lowest index is reported.
+        Returns -1 for each point outside every space.
+        Returns an empty array if no points are delivered.
+        Returns None on failure.
+        """
+        try:
+            if len(points) == 0: return numpy.zeros(0, dtype = int)
+            if isinstance(points[0], aecPoint): points = [pnt.xyz for pnt in points]
+            points = numpy.asarray(points, dtype = float).reshape(len(points), -1)
+            count = len(self.__spaces)
+            located = numpy.full(points.shape[0], -1, dtype = int)
+            if count == 0: return located
+            boundaries = self.__shapes()
+            shapelyArray.prepare(boundaries)
+            tree = shapelyArray.STRtree(boundaries)
+            levels = numpy.array([space.level for space in self.__spaces])
+            elevations = numpy.array([space.elevation for space in self.__spaces])
+            chunk = max(int(chunk), 1)
+            for start in range(0, points.shape[0], chunk):
+                block = points[start:start + chunk]
+                pointIndex, spaceIndex = tree.query(shapelyArray.points(block[:, :2]))
+                if block.shape[1] > 2:
+                    z = block[pointIndex, 2]
+                    inside = (z >= levels[spaceIndex]) & (z <= elevations[spaceIndex])
+                    pointIndex = pointIndex[inside]
+                    spaceIndex = spaceIndex[inside]
+                inside = shapelyArray.contains_xy(boundaries[spaceIndex], block[pointIndex, 0], block[pointIndex, 1])
+                pointIndex = pointIndex[inside]
+                spaceIndex = spaceIndex[inside]
+                first = numpy.full(block.shape[0], count, dtype = int)
+                numpy.minimum.at(first, pointIndex, spaceIndex)
+                first[first == count] = -1
+                located[start:start + chunk] = first
+            return located
+        except Exception:
+            aecError.report()
+            return None
+
     def moveBy(self, x: float = 0, y: float = 0, z: float = 0, index: int = None) -> bool:
         """
         Moves the indicated space by the delivered x, y, and z displacements.
@@ -207,7 +515,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.moveBy(x, y, z)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False  
 
     def moveTo(self, fromPnt: aecPoint, toPnt: aecPoint, index: int = None) -> bool:
@@ -227,9 +535,24 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.moveTo(fromPnt, toPnt)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False          
 
+    @staticmethod
+    def open(path: str, mmap: bool = True):
+        """
+        Returns an aecSpaceView of the aecSpaceFile at the delivered path, memory-mapping
+        the file if mmap is True and the file is uncompressed, from which spaces are
+        selected by level and bounding box and created only as requested.
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceView import aecSpaceView
+            return aecSpaceView(path, mmap)
+        except Exception:
+            aecError.report()
+            return None
+
     def rotate(self, angle: float, point: aecPoint = None, index: int = None) -> bool:
         """
         Rotates the indicated space by the delivered angle in degrees.
@@ -248,9 +571,23 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.rotate(angle, point)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False                 
 
+    def save(self, path: str, compress: bool = False) -> bool:
+        """
+        Writes the group to an aecSpaceFile at the delivered path,
+        compressing the file if compress is True.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceFile import aecSpaceFile
+            return aecSpaceFile().write(self, path, compress)
+        except Exception:
+            aecError.report()
+            return False
+
     def scale(self, x: float = 1, y: float = 1, z: float = 1, 
                     point: aecPoint = None, index: int = None) -> bool:
         """
@@ -270,7 +607,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.scale(x, y, z, point)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False         
  
     def setAlpha(self, alpha: int = 255, index: int = None) -> bool:
@@ -290,7 +627,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.alpha = alpha
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False    
     
     def setColor(self, color: Tuple[int, int, int], index: int = None) -> bool:
@@ -310,7 +647,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.color = color
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
     def setHeight(self, value: float = 1.0, index: int = None) -> bool:
@@ -330,7 +667,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.height = value
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
         
     def setLevel(self, value: float = 1.0, index: int = None) -> bool:
@@ -350,7 +687,7 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.level = value
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False  
         
     def setName(self, value: str = "", index: int = None) -> bool:
@@ -370,9 +707,33 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.name = value
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False  
         
+    def subtract(self, points: List[aecPoint]) -> List[int]:
+        """
+        Subtracts the shape described by the delivered list of points from every space,
+        subtracting it from all affected spaces in a single vectorized call.
+        Spaces sharing no area with the shape are Unchanged, spaces partially covered by it
+        are Clipped, spaces divided by it into several parts are Split and keep their largest
+        part, and spaces wholly covered by it are Dropped and removed from the group.
+        Spaces wholly surrounding the shape are Pierced and left unchanged, as a
+        boundary cannot enclose a hole.
+        Returns a list of outcomes in the order of the spaces before subtraction.
+        Returns None on failure.
+        """
+        try:
+            shape = self.__aecGeometryArray.makeShape(points)
+            shapes = self.__shapes()
+            outcomes = numpy.full(shapes.size, self.Unchanged, dtype = int)
+            cut = numpy.flatnonzero(self.__aecGeometryArray.getIntersects(shapes, shape))
+            outcomes[cut] = self.__reshape(cut, self.__aecGeometryArray.getDifference(shapes[cut], shape))
+            self.__spaces = [space for space, outcome in zip(self.__spaces, outcomes) if outcome != self.Dropped]
+            return outcomes.tolist()
+        except Exception:
+            aecError.report()
+            return None
+
     def wrap(self, points: List[aecPoint], index: int = None) -> bool:
         """
         Wraps the indicated space around the delivered points as a convex hull.
@@ -390,5 +751,77 @@ class aecSpaceGroup:
                 for space in self.__spaces: space.wrap(points)
             return True
         except Exception:
-            traceback.print_exc()
-            return False              
\ No newline at end of file
+            aecError.report()
+            return False              
+
+    def writeGLB(self, path: str, merge: bool = False, batch: int = 10000) -> bool:
+        """
+        Writes the group to a binary glTF file at the delivered path, as a node for
+        each space or, if merge is True, as a single mesh with per-vertex colors,
+        computing and streaming meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceGLTF import aecSpaceGLTF
+            return aecSpaceGLTF().write(self, path, merge, batch)
+        except Exception:
+            aecError.report()
+            return False
+
+    def writeGeoJSON(self, path: str, batch: int = 10000) -> bool:
+        """
+        Writes the group to a GeoJSON FeatureCollection at the
+        delivered path, encoding spaces in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceJSON import aecSpaceJSON
+            return aecSpaceJSON().write(self, path, aecSpaceJSON.GeoJSON, batch)
+        except Exception:
+            aecError.report()
+            return False
+
+    def writeJSONL(self, path: str, batch: int = 10000) -> bool:
+        """
+        Writes the group to a JSON-lines file at the delivered path with one
+        GeoJSON Feature per line, encoding spaces in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceJSON import aecSpaceJSON
+            return aecSpaceJSON().write(self, path, aecSpaceJSON.JSONL, batch)
+        except Exception:
+            aecError.report()
+            return False
+
+    def writeOBJ(self, path: str, batch: int = 10000) -> bool:
+        """
+        Writes the group to an OBJ file at the delivered path with a group and
+        material for each space, and a material library beside it with the
+        extension .mtl, computing and writing meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceOBJ import aecSpaceOBJ
+            return aecSpaceOBJ().write(self, path, batch)
+        except Exception:
+            aecError.report()
+            return False
+
+    def writeSTL(self, path: str, batch: int = 10000) -> bool:
+        """
+        Writes the group to a binary STL file at the delivered path,
+        computing and writing meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceSTL import aecSpaceSTL
+            return aecSpaceSTL().write(self, path, batch)
+        except Exception:
+            aecError.report()
+            return False
@@ -0,0 +1,273 @@
+import json
+import numpy
+import shapely as shapelyArray
+
+from itertools import islice
+from typing import Iterable, Iterator, List
+from uuid import uuid4
+
+from .aecError import aecError
+from .aecSpace import aecSpace
+
+class aecSpaceJSON:
+    """
+    Streams aecSpaces to and from GeoJSON FeatureCollections and JSON-lines files
+    holding one GeoJSON Feature per line. Each Feature has a Polygon geometry tracing
+    the space boundary and carries the space's ID, name, level, height, color, alpha,
+    and address as properties. Spaces are processed in batches of a delivered size,
+    so memory use is bounded by the batch rather than the file or group.
+    """
+
+    __chunk = 1 << 20
+    __decoder = json.JSONDecoder()
+
+    # Defines a series of constants indicating the file format.
+
+    GeoJSON, JSONL = range(0, 2)
+
+    def __features(self, spaces: List[aecSpace]) -> Iterator[dict]:
+        """
+        Returns an iterator of GeoJSON Features describing the delivered spaces.
+        """
+        shapes = numpy.empty(len(spaces), dtype = object)
+        shapes[:] = [space.boundary for space in spaces]
+        rings = shapelyArray.get_exterior_ring(shapes)
+        offsets = numpy.concatenate(([0], numpy.cumsum(shapelyArray.get_num_coordinates(rings)))).tolist()
+        coords = shapelyArray.get_coordinates(rings)
+        for index, space in enumerate(spaces):
+            yield \
+            {
+                'type': 'Feature',
+                'geometry':
+                {
+                    'type': 'Polygon',
+                    'coordinates': [coords[offsets[index]:offsets[index + 1]].tolist()],
+                },
+                'properties':
+                {
+                    'ID': space.ID,
+                    'name': space.name,
+                    'level': space.level,
+                    'height': space.height,
+                    'color': list(space.color.color),
+                    'alpha': space.color_alpha,
+                    'address': list(space.address),
+                },
+            }
+
+    def __iterate(self, features: Iterator[dict], batch: int) -> Iterator[aecSpace]:
+        """
+        Returns an iterator of new aecSpaces constructed from the delivered Features
+        in batches, ending the iteration if the Features cannot be read.
+        """
+        start = 0
+        while True:
+            try:
+                group = list(islice(features, batch))
+            except Exception:
+                aecError.report()
+                return
+            if not group: return
+            yield from self.__spaces(group, start)
+            start += len(group)
+
+    def __lines(self, file) -> Iterator[dict]:
+        """
+        Returns an iterator of the Features on each line of the delivered
+        open JSON-lines file, closing the file when the iteration ends.
+        """
+        with file:
+            for line in file:
+                if line.strip(): yield json.loads(line)
+
+    def __read(self, file) -> Iterator[dict]:
+        """
+        Returns an iterator of the Features of the GeoJSON FeatureCollection in the
+        delivered open file, decoding the file incrementally in fixed-size chunks
+        and closing it when the iteration ends.
+        """
+        path = file.name
+        with file:
+            buffer, position, ended = '', 0, False
+
+            def skip(characters: str = ''):
+                nonlocal buffer, position, ended
+                while True:
+                    while position < len(buffer) and (buffer[position].isspace() or buffer[position] in characters):
+                        position += 1
+                    if position < len(buffer) or ended: return
+                    buffer, position = file.read(self.__chunk), 0
+                    ended = not buffer
+
+            def decode(expected: str = None):
+                nonlocal buffer, position, ended
+                skip()
+                if expected is not None:
+                    if buffer[position:position + 1] != expected:
+                        raise ValueError('Expected ' + expected + ' in GeoJSON file: ' + str(path))
+                    position += 1
+                    return None
+                while True:
+                    try:
+                        value, end = self.__decoder.raw_decode(buffer, position)
+                        if end < len(buffer) or ended:
+                            position = end
+                            return value
+                    except json.JSONDecodeError:
+                        if ended: raise
+                    chunk = file.read(self.__chunk)
+                    ended = not chunk
+                    buffer, position = buffer[position:] + chunk, 0
+
+            decode('{')
+            skip()
+            while buffer[position:position + 1] != '}':
+                key = decode()
+                decode(':')
+                if key != 'features':
+                    decode()
+                else:
+                    decode('[')
+                    skip()
+                    while buffer[position:position + 1] != ']':
+                        yield decode()
+                        skip(',')
+                    position += 1
+                skip(',')
+
+    def __space(self, properties: dict, coords: numpy.ndarray) -> aecSpace:
+        """
+        Returns a new aecSpace with the delivered boundary coordinates and the
+        delivered Feature properties, using defaults for missing or null values.
+        Keeps any string or integer ID, generating a new UUID otherwise.
+        Raises TypeError or ValueError for properties of the wrong type.
+        """
+        def value(key: str, default):
+            item = properties.get(key)
+            return default if item is None else item
+        if not isinstance(properties, dict): raise TypeError('Properties must be an object')
+        color = [min(max(int(item), 0), 255) for item in value('color', (255, 255, 255))]
+        if len(color) < 3: raise ValueError('Color needs three components')
+        alpha = min(max(int(value('alpha', 0)), 0), 255)
+        address = tuple(int(item) for item in value('address', (0, 0, 0)))
+        if len(address) != 3: raise ValueError('Address needs three components')
+        ID = properties.get('ID')
+        if isinstance(ID, bool) or not isinstance(ID, (int, str)) or ID == '': ID = uuid4()
+        name = value('name', '')
+        if not isinstance(name, (str, int, float)): raise TypeError('Name must be a string')
+        space = aecSpace.__new__(aecSpace)
+        space.__setstate__((address,
+                            coords,
+                            (color[0], color[1], color[2], alpha),
+                            None,
+                            float(value('height', 1.0)),
+                            str(ID),
+                            float(value('level', 0.0)),
+                            str(name)))
+        return space
+
+    def __spaces(self, features: List[dict], start: int) -> List[aecSpace]:
+        """
+        Returns a list of new aecSpaces constructed from the delivered Features, removing
+        colinear points from and orienting all boundaries in single vectorized calls and
+        creating each space from its slice of the resulting coordinates. Missing or null
+        properties take their default values. Features without a Polygon geometry, with
+        fewer than three non-colinear points, or with properties of the wrong type are
+        reported as errors and skipped, numbered in sequence from the delivered start.
+        """
+        rings, keep = [], []
+        for index, feature in enumerate(features):
+            if not isinstance(feature, dict): continue
+            geometry = feature.get('geometry') or {}
+            if not isinstance(geometry, dict): continue
+            if geometry.get('type') != 'Polygon' or not geometry.get('coordinates'): continue
+            try:
+                ring = numpy.asarray(geometry['coordinates'][0], dtype = float)
+            except (TypeError, ValueError):
+                continue
+            if ring.ndim != 2 or ring.shape[0] < 3 or ring.shape[1] < 2: continue
+            rings.append(ring[:, :2])
+            keep.append(index)
+        shapes = numpy.empty(0, dtype = object)
+        if rings:
+            counts = [ring.shape[0] for ring in rings]
+            shapes = shapelyArray.polygons(shapelyArray.linearrings(numpy.concatenate(rings),
+                                           indices = numpy.repeat(numpy.arange(len(rings)), counts)))
+            shapes = shapelyArray.orient_polygons(shapelyArray.simplify(shapes, 0))
+        exteriors = shapelyArray.get_exterior_ring(shapes)
+        counts = shapelyArray.get_num_coordinates(exteriors) - 1
+        valid = (counts >= 3) & (shapelyArray.area(shapes) > 0)
+        coords = shapelyArray.get_coordinates(exteriors[valid])
+        offsets = numpy.concatenate(([0], numpy.cumsum(counts[valid] + 1))).tolist()
+        accepted = dict(zip(numpy.asarray(keep)[valid].tolist(), range(len(offsets) - 1)))
+        spaces = []
+        for index, feature in enumerate(features):
+            if index not in accepted:
+                aecError.report(ValueError('Feature ' + str(start + index) + ' has no boundary of three non-colinear points'))
+                continue
+            row = accepted[index]
+            try:
+                space = self.__space(feature.get('properties') or {}, coords[offsets[row]:offsets[row + 1] - 1])
+            except (TypeError, ValueError) as error:
+                aecError.report(ValueError('Feature ' + str(start + index) + ' has invalid properties: ' + str(error)))
+                continue
+            spaces.append(space)
+        return spaces
+
+    def iterGeoJSON(self, path: str, batch: int = 10000) -> Iterator[aecSpace]:
+        """
+        Returns an iterator of new aecSpaces constructed from the Features of the
+        GeoJSON FeatureCollection at the delivered path, reading the file incrementally
+        and constructing spaces in batches of the delivered size.
+        Returns None on failure.
+        """
+        try:
+            return self.__iterate(self.__read(open(path, 'r', encoding = 'utf-8')), max(int(batch), 1))
+        except Exception:
+            aecError.report()
+            return None
+
+    def iterJSONL(self, path: str, batch: int = 10000) -> Iterator[aecSpace]:
+        """
+        Returns an iterator of new aecSpaces constructed from the Features on each
+        line of the JSON-lines file at the delivered path, reading the file line by
+        line and constructing spaces in batches of the delivered size.
+        Returns None on failure.
+        """
+        try:
+            return self.__iterate(self.__lines(open(path, 'r', encoding = 'utf-8')), max(int(batch), 1))
+        except Exception:
+            aecError.report()
+            return None
+
+    def write(self, spaces: Iterable[aecSpace], path: str, format: int = 0, batch: int = 10000) -> bool:
+        """
+        Writes the delivered aecSpaceGroup or iterable of aecSpaces to the delivered path
+        as a GeoJSON FeatureCollection or, if the format is aecSpaceJSON.JSONL, as a
+        JSON-lines file, encoding and writing the spaces in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            name = getattr(spaces, 'name', '')
+            spaces = iter(getattr(spaces, 'spaces', spaces))
+            batch = max(int(batch), 1)
+            encoder = json.JSONEncoder(separators = (',', ':'))
+            with open(path, 'w', encoding = 'utf-8') as file:
+                if format == self.GeoJSON:
+                    file.write('{"type":"FeatureCollection","name":' + encoder.encode(name) + ',"features":[\n')
+                separator = ''
+                while True:
+                    group = list(islice(spaces, batch))
+                    if not group: break
+                    lines = [encoder.encode(feature) for feature in self.__features(group)]
+                    if format == self.GeoJSON:
+                        file.write(separator + ',\n'.join(lines))
+                        separator = ',\n'
+                    else:
+                        file.write('\n'.join(lines) + '\n')
+                if format == self.GeoJSON: file.write('\n]}\n')
+            return True
+        except Exception:
+            aecError.report()
+            return False
@@ -0,0 +1,95 @@
+import numpy
+import os
+
+from itertools import islice
+from typing import Iterable
+
+from .aecError import aecError
+from .aecGeometryArray import aecGeometryArray
+from .aecSpace import aecSpace
+
+class aecSpaceOBJ:
+    """
+    Writes aecSpaces to Wavefront OBJ files with an accompanying MTL material library.
+
+    Meshes are computed and written in batches of spaces, so memory use is bounded
+    by the batch size. The vertices, normals, and faces of each batch are formatted
+    with a single string operation over each array rather than line by line.
+    Faces with the same normal share one normal entry. Each space is written as
+    an OBJ group named for the space, using a material from its aecColor.
+    """
+
+    __aecGeometryArray = aecGeometryArray()
+
+    def __format(self, array: numpy.ndarray, line: str) -> bytes:
+        """
+        Returns the rows of the delivered array formatted with the delivered line
+        format in a single operation, rather than formatting each row separately.
+        """
+        return ((line * array.shape[0]) % tuple(array.ravel().tolist())).encode('ascii')
+
+    def __unique(self, rows: numpy.ndarray):
+        """
+        Returns the unique rows of the delivered array and the index of each
+        row among them, sorting the columns together with a lexical sort.
+        """
+        order = numpy.lexsort(rows.T[::-1])
+        ordered = rows[order]
+        first = numpy.ones(order.size, dtype = bool)
+        first[1:] = (ordered[1:] != ordered[:-1]).any(axis = 1)
+        indices = numpy.empty(order.size, dtype = numpy.int64)
+        indices[order] = numpy.cumsum(first) - 1
+        return ordered[first], indices
+
+    def write(self, spaces: Iterable[aecSpace], path: str, batch: int = 10000) -> bool:
+        """
+        Writes the delivered aecSpaceGroup or iterable of aecSpaces to an OBJ file at the
+        delivered path and a material library beside it with the extension .mtl,
+        computing and writing meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            spaces = iter(getattr(spaces, 'spaces', spaces))
+            batch = max(int(batch), 1)
+            library = os.path.splitext(path)[0] + '.mtl'
+            materials = {}
+            vertexTotal, normalTotal = 0, 0
+            with open(path, 'wb') as file:
+                file.write(b'mtllib ' + os.path.basename(library).encode('utf-8') + b'\n')
+                while True:
+                    group = list(islice(spaces, batch))
+                    if not group: break
+                    shapes = self.__aecGeometryArray.makeShapes([space.boundary for space in group])
+                    mesh = self.__aecGeometryArray.getMeshes(shapes,
+                                                             [space.level for space in group],
+                                                             [space.height for space in group])
+                    if mesh is None: raise ValueError('Cannot compute meshes')
+                    file.write(self.__format(mesh.vertices, 'v %.9g %.9g %.9g\n'))
+                    offsets = numpy.repeat(mesh.vertexOffsets[:-1], numpy.diff(mesh.indexOffsets))
+                    vertices = (mesh.indices + offsets).reshape(-1, 3)
+                    normals, normalIndices = self.__unique(mesh.normals[vertices[:, 0]])
+                    file.write(self.__format(normals, 'vn %.9g %.9g %.9g\n'))
+                    faces = numpy.empty((vertices.shape[0], 6), dtype = numpy.int64)
+                    faces[:, 0::2] = vertices + vertexTotal + 1
+                    faces[:, 1::2] = (normalIndices + normalTotal + 1)[:, None]
+                    faceCounts = (numpy.diff(mesh.indexOffsets) // 3).tolist()
+                    template = []
+                    for index, space in enumerate(group):
+                        color = space.color.color + (space.color_alpha,)
+                        material = materials.setdefault(color, 'aecColor_' + '_'.join(str(value) for value in color))
+                        name = ' '.join(str(space.name).split()) or space.ID
+                        template.append('g ' + name.replace('%', '%%') + '\nusemtl ' + material + '\n')
+                        template.append('f %d//%d %d//%d %d//%d\n' * faceCounts[index])
+                    file.write((''.join(template) % tuple(faces.ravel().tolist())).encode('utf-8'))
+                    vertexTotal += int(mesh.vertexOffsets[-1])
+                    normalTotal += normals.shape[0]
+            with open(library, 'w', encoding = 'utf-8') as file:
+                for (red, green, blue, alpha), material in materials.items():
+                    file.write('newmtl ' + material + '\n')
+                    file.write('Kd %.6g %.6g %.6g\n' % (red / 255, green / 255, blue / 255))
+                    file.write('d %.6g\n\n' % (1 - (alpha / 255)))
+            return True
+        except Exception:
+            aecError.report()
+            return False
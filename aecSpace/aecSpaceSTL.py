@@ -0,0 +1,63 @@
+import numpy
+import struct
+
+from itertools import islice
+from typing import Iterable
+
+from .aecError import aecError
+from .aecGeometryArray import aecGeometryArray
+from .aecSpace import aecSpace
+
+class aecSpaceSTL:
+    """
+    Writes aecSpaces to binary STL files.
+
+    Meshes are computed in batches of spaces and the triangles of each batch are
+    packed into a single record array written directly to the file, with the
+    triangle count in the header completed once all batches are written, so
+    memory use is bounded by the batch size.
+    """
+
+    __aecGeometryArray = aecGeometryArray()
+
+    # Defines the binary STL header and triangle record layouts.
+
+    __header = struct.Struct('<80sI')
+    __triangle = numpy.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+    def write(self, spaces: Iterable[aecSpace], path: str, batch: int = 10000) -> bool:
+        """
+        Writes the delivered aecSpaceGroup or iterable of aecSpaces to a binary STL file
+        at the delivered path, computing and writing meshes in batches of the delivered size.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            name = str(getattr(spaces, 'name', '') or 'aecSpace')
+            spaces = iter(getattr(spaces, 'spaces', spaces))
+            batch = max(int(batch), 1)
+            count = 0
+            with open(path, 'wb') as file:
+                file.write(self.__header.pack(name.encode('ascii', 'replace')[:80], 0))
+                while True:
+                    group = list(islice(spaces, batch))
+                    if not group: break
+                    shapes = self.__aecGeometryArray.makeShapes([space.boundary for space in group])
+                    mesh = self.__aecGeometryArray.getMeshes(shapes,
+                                                             [space.level for space in group],
+                                                             [space.height for space in group])
+                    if mesh is None: raise ValueError('Cannot compute meshes')
+                    offsets = numpy.repeat(mesh.vertexOffsets[:-1], numpy.diff(mesh.indexOffsets))
+                    faces = (mesh.indices + offsets).reshape(-1, 3)
+                    triangles = numpy.zeros(faces.shape[0], dtype = self.__triangle)
+                    triangles['normal'] = mesh.normals[faces[:, 0]]
+                    triangles['vertices'] = mesh.vertices[faces]
+                    triangles.tofile(file)
+                    count += faces.shape[0]
+                if count > 0xFFFFFFFF: raise ValueError('Too many triangles for binary STL: ' + str(count))
+                file.seek(80)
+                file.write(struct.pack('<I', count))
+            return True
+        except Exception:
+            aecError.report()
+            return False
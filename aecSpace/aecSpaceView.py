@@ -0,0 +1,187 @@
+import numpy
+
+from typing import List, Sequence, Tuple, Union
+
+from .aecError import aecError
+from .aecSpace import aecSpace
+from .aecSpaceFile import aecSpaceFile
+from .aecSpaceGroup import aecSpaceGroup
+
+class aecSpaceView:
+    """
+    Provides read access to the spaces stored in an aecSpaceFile without loading them,
+    holding the file's columns as memory-mapped views so that only the pages touched by
+    filters and requested spaces are read, and processes opening the same file share one
+    copy of it in the operating system's page cache. Spaces are created on request from
+    the stored columns, constructing each boundary polygon on first use.
+    """
+
+    __aecSpaceFile = aecSpaceFile()
+
+    __slots__ = ['__columns', '__mmap', '__path']
+
+    def __init__(self, path: str, mmap: bool = True):
+        """
+        Constructor opens the aecSpaceFile at the delivered path, memory-mapping its
+        columns if mmap is True and the file is uncompressed, or reading them otherwise.
+        """
+        self.__path = path
+        self.__mmap = bool(mmap)
+        self.__columns = self.__aecSpaceFile.getColumns(path, self.__mmap)
+        if self.__columns is None: raise ValueError('Cannot open aecSpace file: ' + str(path))
+
+    def __getstate__(self) -> tuple:
+        """
+        Returns the path and mapping mode for pickling, so the
+        file is reopened rather than copied into the pickle.
+        """
+        return (self.__path, self.__mmap)
+
+    def __setstate__(self, state: tuple):
+        """
+        Reopens the file recorded in a pickled state.
+        """
+        self.__init__(*state)
+
+    @property
+    def bounds(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the minimum x, minimum y, maximum x,
+        and maximum y coordinates of each stored space boundary.
+        Returns None on failure.
+        """
+        try:
+            return self.__columns['bounds']
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def count(self) -> int:
+        """
+        Property
+        Returns the quantity of stored spaces.
+        Returns None on failure.
+        """
+        try:
+            return int(self.__columns['levels'].shape[0])
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def heights(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the height of each stored space.
+        Returns None on failure.
+        """
+        try:
+            return self.__columns['heights']
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def levels(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the level of each stored space.
+        Returns None on failure.
+        """
+        try:
+            return self.__columns['levels']
+        except Exception:
+            aecError.report()
+            return None
+
+    @property
+    def name(self) -> str:
+        """
+        Property
+        Returns the name of the stored group.
+        Returns None on failure.
+        """
+        try:
+            return self.__columns['name']
+        except Exception:
+            aecError.report()
+            return None
+
+    def getGroup(self, indices: Sequence[int] = None) -> aecSpaceGroup:
+        """
+        Returns a new aecSpaceGroup of the stored spaces at the delivered indices.
+        Returns a group of all stored spaces if no indices are delivered.
+        Returns None on failure.
+        """
+        try:
+            group = aecSpaceGroup()
+            group.name = self.name
+            group.add(self.getSpaces(indices))
+            return group
+        except Exception:
+            aecError.report()
+            return None
+
+    def getSpace(self, index: int) -> aecSpace:
+        """
+        Returns a new aecSpace created from the stored space at the delivered index.
+        Returns None on failure.
+        """
+        try:
+            columns = self.__columns
+            index = int(index)
+            start, end = columns['offsets'][index:index + 2].tolist()
+            first, last = columns['idOffsets'][index:index + 2].tolist()
+            space = aecSpace.__new__(aecSpace)
+            space.__setstate__((tuple(columns['addresses'][index].tolist()),
+                                columns['coords'][start:end],
+                                tuple(columns['colors'][index].tolist()),
+                                None,
+                                float(columns['heights'][index]),
+                                bytes(columns['ids'][first:last]).decode('utf-8'),
+                                float(columns['levels'][index]),
+                                columns['names'][int(columns['nameIDs'][index])]))
+            return space
+        except Exception:
+            aecError.report()
+            return None
+
+    def getSpaces(self, indices: Sequence[int] = None) -> List[aecSpace]:
+        """
+        Returns a list of new aecSpaces created from the stored spaces at the delivered indices.
+        Returns all stored spaces if no indices are delivered.
+        Returns None on failure.
+        """
+        try:
+            if indices is None: indices = range(self.count)
+            return [self.getSpace(index) for index in numpy.asarray(indices, dtype = int).reshape(-1).tolist()]
+        except Exception:
+            aecError.report()
+            return None
+
+    def select(self, level: Union[float, Tuple[float, float]] = None,
+                     bounds: Tuple[float, float, float, float] = None) -> numpy.ndarray:
+        """
+        Returns an array of the indices of the stored spaces at the delivered level, or with
+        levels within a delivered (low, high) range, and with bounding boxes intersecting
+        the delivered (minimum x, minimum y, maximum x, maximum y) bounding box, reading
+        only the level and bounding box columns.
+        Returns the indices of all stored spaces if no filters are delivered.
+        Returns None on failure.
+        """
+        try:
+            mask = numpy.ones(self.count, dtype = bool)
+            if level is not None:
+                levels = self.__columns['levels']
+                if numpy.isscalar(level): mask &= numpy.isclose(levels, float(level))
+                else: mask &= (levels >= level[0]) & (levels <= level[1])
+            if bounds is not None:
+                boxes = self.__columns['bounds']
+                mask &= (boxes[:, 0] <= bounds[2]) & (boxes[:, 2] >= bounds[0]) & \
+                        (boxes[:, 1] <= bounds[3]) & (boxes[:, 3] >= bounds[1])
+            return numpy.flatnonzero(mask)
+        except Exception:
+            aecError.report()
+            return None
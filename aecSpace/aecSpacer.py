@@ -1,9 +1,10 @@
-import traceback
+import numpy
 
 from random import uniform
 from shapely import geometry as shapely
 from typing import List
 
+from .aecError import aecError
 from .aecGeometry import aecGeometry
 from .aecPoint import aecPoint
 from .aecSpace import aecSpace
@@ -24,33 +25,39 @@ class aecSpacer:
         Returns None on failure.
         """
         try:
-            spcProps = space.copy_properties
-            newSpace = aecSpace()
-            newSpace.boundary = spcProps['boundary']            
-            newSpace.color = spcProps['color']
-            newSpace.height = spcProps['height']
-            newSpace.level = spcProps['level']
-            newSpace.name = spcProps['name']
+            newSpace = space.clone()
             newSpace.moveBy(x, y, z)
             return newSpace
         except Exception:
-            traceback.print_exc() 
+            aecError.report() 
             return None
 
-    def getDifference(self, boundary: aecSpace, shape: aecSpace) -> List[aecSpace]:
-        """
-        Returns a list of spaces formed from the 
-        difference of the two delivered spaces.
-        """
-        bndPnts = boundary.points_floor
-        shpPnts = shape.points_floor
-        polygons = self.__aecGeometry.getDifference(bndPnts, shpPnts)
-        spaces = []
-        for points in polygons:
-            space = aecSpace()
-            space.boundary = points
-            spaces.append(space)
-        return spaces
+    def getDifference(self, boundary: aecSpace, 
+                            shape: aecSpace = None, 
+                            shapes: List[aecSpace] = None) -> List[aecSpace]:
+        """
+        Returns a list of spaces formed from the difference of the boundary
+        space and the delivered shape and/or list of shapes, which are
+        subtracted together in a single boolean operation. A difference
+        enclosing a hole is returned as several spaces without holes.
+        Returns None on failure.
+        """
+        try:
+            cutters = []
+            if shape: cutters.append(shape)
+            if shapes: cutters += list(shapes)
+            shpPnts = [space.points_floor for space in cutters]
+            polygons = self.__aecGeometry.getDifference(boundary.points_floor, shapes = shpPnts)
+            if polygons is None: return None
+            spaces = []
+            for points in polygons:
+                space = aecSpace()
+                space.boundary = points
+                spaces.append(space)
+            return spaces
+        except Exception:
+            aecError.report() 
+            return None
     
     def place(self, space: aecSpace, copies: int = 1, 
                     x: float = 0, y: float = 0, z: float = 0) -> List[aecSpace]:
@@ -70,7 +77,7 @@ class aecSpacer:
                 spaces += [self.copy(space, X, Y, Z)]                
             return spaces
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def placeOnLine(self, shape: aecSpace, border: aecSpace, orient: List[int]) -> bool:
@@ -103,7 +110,7 @@ class aecSpacer:
                     return True
             return False
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False        
 
     def placeWithin(self, shape: aecSpace, border: aecSpace) -> bool:
@@ -122,21 +129,17 @@ class aecSpacer:
             topX = xAxis[1].x
             lowY = yAxis[0].y
             topY = yAxis[1].y
-            within = False
-            x = 0
-            tstShape = self.copy(shape)
-            while not within and x < 100:
-                xCoord = uniform(lowX, topX)
-                yCoord = uniform(lowY, topY)
-                bndPnt = aecPoint(xCoord, yCoord, level)
-                tstShape.moveTo(tstShape.centroid_floor, bndPnt)
-                within = border.boundary.contains(tstShape.boundary)
-                x += 1
-            if not within: return False
+            centroid = shape.centroid_floor
+            points = numpy.array([pnt.xy for pnt in shape.points_floor])
+            moves = numpy.array([(uniform(lowX, topX), uniform(lowY, topY)) for x in range(100)])
+            shapes = points[None, :, :] + (moves - centroid.xy)[:, None, :]
+            within = numpy.flatnonzero(border.containsShapes(shapes))
+            if within.size == 0: return False
+            bndPnt = aecPoint(moves[within[0], 0], moves[within[0], 1], level)
             shape.moveTo(shape.centroid_floor, bndPnt)
             return True
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return False
 
     def row(self, space: aecSpace, copies: int = 1, 
@@ -153,7 +156,7 @@ class aecSpacer:
             if xAxis: return self.place(space, copies, x = space.size_x + gap)
             return self.place(space, copies, y = space.size_y + gap)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def stack(self, space: aecSpace, copies: int = 1, plenum: float = 0) -> List[aecSpace]:
@@ -167,7 +170,7 @@ class aecSpacer:
         try:
             return self.place(space, copies, z = space.height + plenum)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def stackToArea(self, space, area, plenum = 0):
@@ -184,5 +187,5 @@ class aecSpacer:
             copies = int(area / spcArea)
             return self.stack(space, copies, plenum)
         except Exception:
-            traceback.print_exc()
+            aecError.report()
             return None
@@ -1,4 +1,4 @@
-import traceback
+from .aecError import aecError
 
 class aecValid:
 
@@ -34,7 +34,7 @@ class aecValid:
             if address[2] > bounds[2]: address[2] = bounds[2]
             return tuple(address)
         except:
-            traceback.print_exc()
+            aecError.report()
             return None        
     
     def angle(self, angle):
@@ -49,7 +49,7 @@ class aecValid:
             if type(angle) == str: angle = float(angle)
             return abs(angle % 360)
         except:
-            traceback.print_exc()
+            aecError.report()
             return None
     
     def color(self, color):
@@ -63,7 +63,7 @@ class aecValid:
             color = [int(x % 255) for x in list(color)]
             return color
         except:
-            traceback.print_exc()
+            aecError.report()
             return None
 
     def indices(self, indices = None, limit = None):
@@ -87,7 +87,7 @@ class aecValid:
                 indices.sort()
             return indices
         except:
-            traceback.print_exc()
+            aecError.report()
             return None   
     
     def percent(self, number: float = 0.0):
@@ -102,7 +102,7 @@ class aecValid:
             while number > 1: number *= 0.1
             return number 
         except:
-            traceback.print_exc()
+            aecError.report()
             return None
     
 # end class    
@@ -10,8 +10,10 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/BlackArtsConsulting/aecSpace",
     packages=setuptools.find_packages(),
+    install_requires=['numpy', 'shapely>=2.1'],
+    python_requires='>=3.7',
     classifiers=(
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ),    
@@ -0,0 +1,57 @@
+from aecSpace.aecGeometry import aecGeometry
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+from aecSpace.aecSpacer import aecSpacer
+
+def square(x: float, y: float, size: float):
+    return [aecPoint(x, y), aecPoint(x + size, y), aecPoint(x + size, y + size), aecPoint(x, y + size)]
+
+def test_interior_cutter_divides_the_difference():
+    differs = aecGeometry().getDifference(square(0, 0, 100), shapes = [square(40, 40, 20), square(10, 70, 5)])
+    assert differs is not None and len(differs) > 1
+    spaces = [aecSpace(points) for points in differs]
+    assert abs(sum(space.area for space in spaces) - (10000 - 400 - 25)) < 1e-6
+    for space in spaces:
+        assert not space.boundary.interiors
+        assert not space.boundary.intersects(aecSpace(square(41, 41, 18)).boundary)
+
+def test_spacer_difference_with_core():
+    floor = aecSpace(square(0, 0, 100))
+    core = aecSpace(square(45, 45, 10))
+    spaces = aecSpacer().getDifference(floor, core)
+    assert len(spaces) == 2
+    assert abs(sum(space.area for space in spaces) - 9900) < 1e-6
+
+def test_crossing_cutters_keep_parts():
+    differs = aecGeometry().getDifference(square(0, 0, 10), shapes = [[aecPoint(4, -1), aecPoint(6, -1),
+                                                                       aecPoint(6, 11), aecPoint(4, 11)]])
+    assert len(differs) == 2
+    assert sorted(aecSpace(points).area for points in differs) == [40, 40]
+
+def test_group_subtract_outcomes_match_geometry():
+    floor, annex, shed = aecSpace(square(0, 0, 100)), aecSpace(square(200, 0, 10)), aecSpace(square(300, 0, 10))
+    floor.name = 'floor'
+    group = aecSpaceGroup()
+    group.add([floor, annex, shed])
+    ID = floor.ID
+    assert group.subtract(square(40, 40, 20)) == [aecSpaceGroup.Pierced, aecSpaceGroup.Unchanged, aecSpaceGroup.Unchanged]
+    assert group.areas.tolist() == [10000, 100, 100]
+    assert group.subtract(square(-10, -10, 20)) == [aecSpaceGroup.Clipped, aecSpaceGroup.Unchanged, aecSpaceGroup.Unchanged]
+    assert group.areas.tolist() == [10000 - 100, 100, 100]
+    assert floor.ID == ID and floor.name == 'floor'
+    assert floor.boundary.exterior.is_ccw and len(floor.points_floor) == 6
+    slot = [aecPoint(304, -1), aecPoint(306, -1), aecPoint(306, 11), aecPoint(304, 11)]
+    assert group.subtract(slot) == [aecSpaceGroup.Unchanged, aecSpaceGroup.Unchanged, aecSpaceGroup.Split]
+    assert group.areas.tolist() == [9900, 100, 40]
+    assert group.subtract(square(195, -5, 20)) == [aecSpaceGroup.Unchanged, aecSpaceGroup.Dropped, aecSpaceGroup.Unchanged]
+    assert group.count == 2
+
+def test_group_shapes_follow_space_changes():
+    group = aecSpaceGroup()
+    group.add([aecSpace(square(0, 0, 10)), aecSpace(square(20, 0, 10))])
+    assert group.area == 200
+    group.spaces[1].boundary = square(20, 0, 5)
+    assert group.area == 125
+    group.spaces[0].moveBy(x = 100)
+    assert group.bounds[0].tolist() == [100, 0, 110, 10]
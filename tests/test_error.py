@@ -0,0 +1,25 @@
+import pytest
+
+from aecSpace.aecError import aecError
+
+def test_report_delivered_exception(capsys):
+    error = ValueError('delivered')
+    with aecError.policy(aecError.Collect) as errors:
+        aecError.report(error)
+    assert errors == [error]
+    with aecError.policy(aecError.Print):
+        aecError.report(error)
+    assert 'ValueError: delivered' in capsys.readouterr().err
+    with aecError.policy(aecError.Raise):
+        with pytest.raises(ValueError, match = 'delivered'):
+            aecError.report(error)
+    with aecError.policy(aecError.Silent):
+        aecError.report(error)
+
+def test_report_caught_exception():
+    with aecError.policy(aecError.Collect) as errors:
+        try:
+            raise KeyError('caught')
+        except KeyError:
+            aecError.report()
+    assert isinstance(errors[0], KeyError)
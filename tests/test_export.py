@@ -0,0 +1,78 @@
+import json
+import numpy
+import pytest
+import struct
+
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def makeGroup(count: int = 12) -> aecSpaceGroup:
+    group = aecSpaceGroup()
+    group.name = 'campus'
+    group.add([aecSpace.fromValidated([(index, 0), (index + 1, 0), (index + 1, 1), (index + 0.5, 1.5), (index, 1)],
+                                      level = index % 3, height = 2, color = (index * 20, 10, 5), name = 'room')
+               for index in range(count)])
+    return group
+
+def readGLB(path: str):
+    data = open(path, 'rb').read()
+    magic, version, length = struct.unpack('<4sII', data[:12])
+    assert (magic, version, length) == (b'glTF', 2, len(data))
+    size, kind = struct.unpack('<I4s', data[12:20])
+    assert kind == b'JSON'
+    document = json.loads(data[20:20 + size])
+    binary = data[28 + size:]
+    assert struct.unpack('<I4s', data[20 + size:28 + size]) == (len(binary), b'BIN\0')
+    return document, binary
+
+def signedVolume(vertices: numpy.ndarray, triangles: numpy.ndarray) -> float:
+    points = vertices.astype(float)[triangles]
+    return numpy.einsum('ij,ij->i', points[:, 0], numpy.cross(points[:, 1], points[:, 2])).sum() / 6
+
+@pytest.mark.parametrize('merge', [False, True])
+def test_glb(tmp_path, merge):
+    group = makeGroup()
+    path = str(tmp_path / 'group.glb')
+    assert group.writeGLB(path, merge, batch = 5)
+    document, binary = readGLB(path)
+    views = document['bufferViews']
+    for accessor in document['accessors']:
+        view = views[accessor['bufferView']]
+        shared = sum(other['bufferView'] == accessor['bufferView'] for other in document['accessors'])
+        if view.get('target') == 34962 and shared > 1: assert 'byteStride' in view
+    volume = 0
+    for mesh in document['meshes']:
+        primitive = mesh['primitives'][0]
+        position = document['accessors'][primitive['attributes']['POSITION']]
+        index = document['accessors'][primitive['indices']]
+        start = views[position['bufferView']]['byteOffset'] + position.get('byteOffset', 0)
+        vertices = numpy.frombuffer(binary, numpy.float32, position['count'] * 3, start).reshape(-1, 3)
+        assert numpy.allclose(vertices.min(axis = 0), position['min'])
+        assert numpy.allclose(vertices.max(axis = 0), position['max'])
+        start = views[index['bufferView']]['byteOffset'] + index.get('byteOffset', 0)
+        triangles = numpy.frombuffer(binary, numpy.uint32, index['count'], start).reshape(-1, 3)
+        volume += signedVolume(vertices, triangles)
+    assert volume == pytest.approx(group.volume)
+    assert len(document['nodes']) == (2 if merge else group.count + 1)
+
+def test_obj_and_stl(tmp_path):
+    group = makeGroup()
+    path = str(tmp_path / 'group.obj')
+    assert group.writeOBJ(path, batch = 5)
+    vertices, faces, groups = [], [], 0
+    for line in open(path):
+        if line.startswith('v '): vertices.append([float(value) for value in line.split()[1:]])
+        elif line.startswith('f '): faces.append([int(item.split('//')[0]) - 1 for item in line.split()[1:]])
+        elif line.startswith('g '): groups += 1
+    assert groups == group.count
+    assert signedVolume(numpy.array(vertices), numpy.array(faces)) == pytest.approx(group.volume)
+    assert open(str(tmp_path / 'group.mtl')).read().count('newmtl') == group.count
+    path = str(tmp_path / 'group.stl')
+    assert group.writeSTL(path, batch = 5)
+    data = open(path, 'rb').read()
+    count = struct.unpack('<I', data[80:84])[0]
+    assert len(data) == 84 + (50 * count)
+    triangles = numpy.frombuffer(data[84:], dtype = [('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+    points = triangles['vertices'].astype(float)
+    volume = numpy.einsum('ij,ij->i', points[:, 0], numpy.cross(points[:, 1], points[:, 2])).sum() / 6
+    assert volume == pytest.approx(group.volume)
@@ -0,0 +1,56 @@
+import pytest
+
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def makeGroup(IDs) -> aecSpaceGroup:
+    spaces = []
+    for index, ID in enumerate(IDs):
+        space = aecSpace.fromValidated([(index, 0), (index + 1, 0), (index + 1, 2), (index, 2)],
+                                       level = index, height = 3, color = (index, 2, 3), name = 'room ' + str(index % 3))
+        if ID is not None:
+            state = space.__getstate__()
+            space = aecSpace.__new__(aecSpace)
+            space.__setstate__(state[:5] + (ID,) + state[6:])
+        spaces.append(space)
+    group = aecSpaceGroup()
+    group.name = 'campus'
+    group.add(spaces)
+    return group
+
+IDs = [None, 'room-101', 'x' * 80, 'salle-é', '', None]
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_file_round_trip(tmp_path, compress):
+    group = makeGroup(IDs)
+    path = str(tmp_path / 'group.aec')
+    assert group.save(path, compress)
+    loaded = aecSpaceGroup()
+    assert loaded.load(path)
+    assert loaded.name == 'campus'
+    assert [space.ID for space in loaded.spaces] == [space.ID for space in group.spaces]
+    for space, other in zip(group.spaces, loaded.spaces):
+        assert (other.name, other.level, other.height, other.color.color) == \
+               (space.name, space.level, space.height, space.color.color)
+        assert [pnt.xy for pnt in other.points_floor] == [pnt.xy for pnt in space.points_floor]
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_view_matches_read(tmp_path, compress):
+    group = makeGroup(IDs)
+    path = str(tmp_path / 'group.aec')
+    group.save(path, compress)
+    loaded = aecSpaceGroup()
+    loaded.load(path)
+    view = aecSpaceGroup.open(path)
+    assert view.count == len(IDs)
+    assert [space.ID for space in view.getSpaces()] == [space.ID for space in loaded.spaces]
+    assert view.select(level = (1, 2)).tolist() == [1, 2]
+    assert view.select(bounds = (2.5, 0, 3.5, 1)).tolist() == [2, 3]
+
+def test_empty_group(tmp_path):
+    path = str(tmp_path / 'empty.aec')
+    assert aecSpaceGroup().save(path)
+    loaded = aecSpaceGroup()
+    assert loaded.load(path)
+    assert loaded.count == 0
+    assert aecSpaceGroup.open(path).count == 0
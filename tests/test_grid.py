@@ -0,0 +1,54 @@
+import numpy
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecSpaceGrid import aecSpaceGrid
+
+def test_single_cell_addresses_accept_numpy_rows():
+    grid = aecSpaceGrid(aecPoint(), (2, 2, 3), (4, 3, 2))
+    address = grid.addresses[5]
+    assert isinstance(address, numpy.ndarray)
+    cell = grid.getCell(address)
+    assert cell is not None
+    assert cell.address == tuple(address.tolist())
+    assert grid.getCell(numpy.array([9, 9, 9])).address == (3, 2, 1)
+    assert grid.deleteCell(address)
+    assert grid.getCell(address) is None
+    assert grid.getCell(tuple(address.tolist())) is None
+    assert grid.count == 4 * 3 * 2 - 1
+
+def test_single_cell_addresses_from_queries():
+    grid = aecSpaceGrid(aecPoint(), 1, (3, 3, 1))
+    neighbors, sources = grid.getNeighbors([(1, 1, 0)])
+    assert len(neighbors) == 4
+    for address in neighbors:
+        assert grid.getCell(address) is not None
+    assert grid.makeCells(aecPoint(), 1, numpy.array([2, 2, 2]))
+    assert grid.count == 8
+
+def test_bulk_cells_accept_index_array_tuples():
+    grid = aecSpaceGrid(aecPoint(), 1, (4, 4, 3))
+    mask = numpy.zeros((4, 4, 3), dtype = bool)
+    mask[0, 1, 2] = True
+    mask[3, 0, 1] = True
+    assert grid.deleteCells(numpy.nonzero(mask))
+    assert grid.getCell((0, 1, 2)) is None
+    assert grid.getCell((3, 0, 1)) is None
+    assert grid.getCell((0, 2, 1)) is not None
+    assert grid.getCell((0, 3, 1)) is not None
+    assert grid.count == 4 * 4 * 3 - 2
+    assert grid.setName('core', numpy.nonzero(mask[:, :, ::-1]))
+    assert grid.getCell((0, 1, 0)).name == 'core'
+    assert grid.getCell((0, 2, 1)).name == ''
+
+def test_bulk_cells_accept_nested_list_masks():
+    grid = aecSpaceGrid(aecPoint(), 1, (2, 2, 1))
+    mask = [[[True], [False]], [[False], [True]]]
+    assert grid.setColor((10, 20, 30), mask)
+    assert grid.getCell((0, 0, 0)).color.color == (10, 20, 30)
+    assert grid.getCell((0, 1, 0)).color.color != (10, 20, 30)
+    assert grid.setLevelOffset(0.5, mask)
+    assert grid.getCell((1, 1, 0)).level == 0.5
+    assert grid.getCell((1, 0, 0)).level == 0
+    assert grid.deleteCells(mask)
+    assert grid.count == 2
+    assert grid.getCell((1, 1, 0)) is None
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+# Defines the import time budget in seconds, including numpy and shapely.
+
+budget = 1.0
+
+script = """
+import sys
+import time
+start = time.perf_counter()
+import aecSpace.aecFloor, aecSpace.aecGeometry, aecSpace.aecShaper, aecSpace.aecSpace, aecSpace.aecSpacer
+import aecSpace.aecSpaceDrawOCC, aecSpace.aecSpaceDrawPlotly, aecSpace.aecSpaceGrid, aecSpace.aecSpaceGroup
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(name for name in ('matplotlib', 'plotly', 'OCC') if name in sys.modules))
+"""
+
+def importPackage():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', script], cwd = root, capture_output = True, text = True, check = True)
+    elapsed, modules = (result.stdout.strip().split(' ') + [''])[:2]
+    return float(elapsed), modules
+
+def test_import_defers_optional_dependencies():
+    elapsed, modules = importPackage()
+    assert modules == ''
+
+def test_import_time_within_budget():
+    elapsed = min(importPackage()[0] for run in range(3))
+    print('import time %.3f s' % elapsed)
+    assert elapsed < budget
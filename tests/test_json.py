@@ -0,0 +1,89 @@
+import json
+import pickle
+import pytest
+
+from aecSpace.aecError import aecError
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def makeFeature(properties, coordinates = None) -> dict:
+    if coordinates is None: coordinates = [[[0, 0], [0, 2], [3, 2], [3, 0], [0, 0]]]
+    return {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': coordinates}, 'properties': properties}
+
+def writeFeatures(tmp_path, features, jsonl: bool) -> str:
+    if jsonl:
+        path = tmp_path / 'spaces.jsonl'
+        path.write_text('\n'.join(json.dumps(feature) for feature in features) + '\n')
+    else:
+        path = tmp_path / 'spaces.geojson'
+        path.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}))
+    return str(path)
+
+def readFeatures(path: str, jsonl: bool):
+    spaces = aecSpaceGroup.iterJSONL(path) if jsonl else aecSpaceGroup.iterGeoJSON(path)
+    return list(spaces)
+
+@pytest.mark.parametrize('jsonl', [False, True])
+def test_round_trip(tmp_path, jsonl):
+    group = aecSpaceGroup()
+    group.name = 'campus'
+    group.add([aecSpace.fromValidated([(index, 0), (index + 1, 0), (index + 1, 1), (index, 1)], level = index,
+                                      height = 3, color = (index, 2, 3), name = 'room') for index in range(25)])
+    path = str(tmp_path / ('spaces.jsonl' if jsonl else 'spaces.geojson'))
+    assert group.writeJSONL(path, batch = 7) if jsonl else group.writeGeoJSON(path, batch = 7)
+    spaces = readFeatures(path, jsonl)
+    assert [space.ID for space in spaces] == [space.ID for space in group.spaces]
+    assert [space.level for space in spaces] == [space.level for space in group.spaces]
+    assert [space.color.color for space in spaces] == [space.color.color for space in group.spaces]
+
+@pytest.mark.parametrize('jsonl', [False, True])
+def test_foreign_IDs(tmp_path, jsonl):
+    features = [makeFeature({'ID': 'room-101'}), makeFeature({'ID': 101}), makeFeature({'ID': None}), makeFeature({})]
+    spaces = readFeatures(writeFeatures(tmp_path, features, jsonl), jsonl)
+    assert [space.ID for space in spaces[:2]] == ['room-101', '101']
+    assert all(len(space.ID) == 36 for space in spaces[2:])
+    group = aecSpaceGroup()
+    group.add(spaces)
+    copy = pickle.loads(pickle.dumps(group))
+    assert [space.ID for space in copy.spaces] == [space.ID for space in spaces]
+    path = str(tmp_path / 'spaces.aec')
+    assert group.save(path)
+    loaded = aecSpaceGroup()
+    assert loaded.load(path)
+    assert [space.ID for space in loaded.spaces] == [space.ID for space in spaces]
+
+@pytest.mark.parametrize('jsonl', [False, True])
+def test_null_and_invalid_properties(tmp_path, jsonl):
+    features = \
+    [
+        makeFeature({'height': None, 'name': None, 'level': None, 'color': None}),
+        makeFeature({'height': 'tall'}),
+        makeFeature({'color': [1, 2]}),
+        makeFeature(None),
+        makeFeature({}, [[[0, 0], [1, 0], [2, 0], [0, 0]]]),
+        makeFeature({}, [[[0, 0], ['a']]]),
+        makeFeature({'name': 'last', 'height': 4}),
+    ]
+    path = writeFeatures(tmp_path, features, jsonl)
+    with aecError.policy(aecError.Collect) as errors:
+        spaces = readFeatures(path, jsonl)
+    assert len(errors) == 4
+    assert all(isinstance(error, ValueError) and str(error).startswith('Feature ') for error in errors)
+    assert [(space.name, space.height, space.level) for space in spaces] == [('', 1.0, 0.0), ('', 1.0, 0.0), ('last', 4.0, 0.0)]
+    assert spaces[0].color.color == (255, 255, 255)
+
+@pytest.mark.parametrize('jsonl', [False, True])
+def test_missing_file(tmp_path, jsonl):
+    path = str(tmp_path / 'missing.json')
+    with aecError.policy(aecError.Collect) as errors:
+        spaces = aecSpaceGroup.iterJSONL(path) if jsonl else aecSpaceGroup.iterGeoJSON(path)
+    assert spaces is None
+    assert isinstance(errors[0], FileNotFoundError)
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / 'truncated.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [makeFeature({}), makeFeature({})]})[:-60])
+    with aecError.policy(aecError.Collect) as errors:
+        spaces = list(aecSpaceGroup.iterGeoJSON(str(path)))
+    assert len(spaces) == 0
+    assert len(errors) == 1
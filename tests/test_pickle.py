@@ -0,0 +1,106 @@
+import pickle
+
+from aecSpace.aecColor import aecColor
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def makeSpace(index: int) -> aecSpace:
+    space = aecSpace([aecPoint(index, 0), aecPoint(index + 2, 0), aecPoint(index + 2, 3), aecPoint(index, 3)])
+    space.level = index * 0.5
+    space.height = 3
+    space.color = (index % 256, 20, 30)
+    space.color_alpha = 40
+    space.name = 'room ' + str(index)
+    space.address = (index, 1, 2)
+    return space
+
+def withID(space: aecSpace, ID: str) -> aecSpace:
+    state = space.__getstate__()
+    renamed = aecSpace.__new__(aecSpace)
+    renamed.__setstate__(state[:5] + (ID,) + state[6:])
+    return renamed
+
+def assertSame(space: aecSpace, other: aecSpace):
+    assert other.ID == space.ID
+    assert other.name == space.name
+    assert other.level == space.level
+    assert other.height == space.height
+    assert other.address == space.address
+    assert other.color.color == space.color.color
+    assert other.color_alpha == space.color_alpha
+    assert [pnt.xy for pnt in other.points_floor] == [pnt.xy for pnt in space.points_floor]
+    assert other.area == space.area
+
+def test_point_and_color_round_trip():
+    point = aecPoint(1, 2, 3)
+    copy = pickle.loads(pickle.dumps(point))
+    assert (copy.ID, copy.xyz) == (point.ID, point.xyz)
+    color = aecColor()
+    color.color = (1, 2, 3)
+    color.alpha = 4
+    copy = pickle.loads(pickle.dumps(color))
+    assert (copy.color, copy.alpha) == ((1, 2, 3), 4)
+
+def test_space_round_trip():
+    space = makeSpace(3)
+    assertSame(space, pickle.loads(pickle.dumps(space)))
+
+def test_lazily_restored_space_round_trip():
+    space = makeSpace(4)
+    restored = pickle.loads(pickle.dumps(space))
+    again = pickle.loads(pickle.dumps(restored))
+    assertSame(space, again)
+    assertSame(space, restored)
+
+def test_space_with_foreign_ID_round_trip():
+    for ID in ['room-101', '', 'x' * 80, 'ABCDEF00-0000-0000-0000-000000000000']:
+        space = withID(makeSpace(5), ID)
+        copy = pickle.loads(pickle.dumps(space))
+        assert copy.ID == ID
+        assertSame(space, copy)
+
+def test_group_round_trip():
+    group = aecSpaceGroup()
+    group.name = 'campus'
+    group.add([makeSpace(index) for index in range(20)])
+    copy = pickle.loads(pickle.dumps(group))
+    assert copy.name == group.name
+    assert copy.count == group.count
+    for space, other in zip(group.spaces, copy.spaces): assertSame(space, other)
+
+def test_group_with_foreign_IDs_round_trip():
+    group = aecSpaceGroup()
+    spaces = [makeSpace(index) for index in range(5)]
+    spaces[2] = withID(spaces[2], 'room-101')
+    group.add(spaces)
+    copy = pickle.loads(pickle.dumps(pickle.loads(pickle.dumps(group))))
+    assert [space.ID for space in copy.spaces] == [space.ID for space in spaces]
+    for space, other in zip(spaces, copy.spaces): assertSame(space, other)
+
+def test_pickled_bytes_per_space():
+    count = 10000
+    spaces = [aecSpace.fromValidated([(index, 0), (index + 1, 0), (index + 1, 1), (index, 1)], name = 'room')
+              for index in range(count)]
+    group = aecSpaceGroup()
+    group.add(spaces)
+    grouped = len(pickle.dumps(group, protocol = pickle.HIGHEST_PROTOCOL)) / count
+    single = len(pickle.dumps(spaces, protocol = pickle.HIGHEST_PROTOCOL)) / count
+    print('pickled bytes per space: group %.1f, list %.1f' % (grouped, single))
+    assert grouped < 140
+    assert single < 180
+
+def test_space_without_boundary():
+    space = aecSpace([aecPoint(0, 0), aecPoint(1, 1), aecPoint(2, 2)])
+    assert space.boundary is None
+    assert space.area is None
+    assert space.points_floor is None
+    restored = pickle.loads(pickle.dumps(space))
+    assert restored.ID == space.ID
+    assert restored.boundary is None
+    assert restored.area is None
+    group = aecSpaceGroup()
+    group.add([space, makeSpace(1)])
+    restored = pickle.loads(pickle.dumps(group))
+    assert restored.spaces[0].boundary is None
+    assert restored.spaces[1].area == 6
@@ -0,0 +1,53 @@
+import numpy
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def test_contains_points():
+    space = aecSpace()
+    inside = space.containsPoints([aecPoint(0.5, 0.5), aecPoint(2, 2)])
+    assert inside.tolist() == [True, False]
+    assert space.containsPoints(numpy.array([[0.25, 0.75, 9.0]])).tolist() == [True]
+
+def test_contains_points_without_points():
+    space = aecSpace()
+    for points in ([], numpy.empty((0, 2)), numpy.empty((0, 3))):
+        inside = space.containsPoints(points)
+        assert isinstance(inside, numpy.ndarray)
+        assert inside.dtype == bool and inside.shape == (0,)
+
+def test_encloses_and_locate():
+    space = aecSpace()
+    space.level = 1.0
+    points = [aecPoint(0.5, 0.5, 1.5), aecPoint(0.5, 0.5, 3.0), aecPoint(2, 2, 1.5)]
+    assert space.encloses(points).tolist() == [True, False, False]
+    group = aecSpaceGroup()
+    other = aecSpace()
+    other.moveBy(x = 2, y = 2)
+    group.add([space, other])
+    assert group.locate(points).tolist() == [0, -1, -1]
+    assert group.locate(numpy.array([[2.5, 2.5]])).tolist() == [1]
+
+def test_encloses_and_locate_without_points():
+    space = aecSpace()
+    group = aecSpaceGroup()
+    assert group.locate([]).shape == (0,)
+    group.add([space])
+    for points in ([], numpy.empty((0, 3)), numpy.empty((0, 2))):
+        enclosed = space.encloses(points)
+        assert enclosed.dtype == bool and enclosed.shape == (0,)
+        located = group.locate(points)
+        assert located.dtype.kind == 'i' and located.shape == (0,)
+
+def test_random_points_follow_random_seed():
+    import random
+    shape = [aecPoint(0, 0), aecPoint(4, 0), aecPoint(4, 1), aecPoint(1, 1), aecPoint(1, 3), aecPoint(0, 3)]
+    space = aecSpace(shape)
+    draws = []
+    for _ in range(2):
+        random.seed(7)
+        draws.append((space.point_floor.xyz, space.point_ceiling.xyz, space.samplePoints(5).tolist()))
+    assert draws[0] == draws[1]
+    assert space.samplePoints(5, seed = 3).tolist() == space.samplePoints(5, seed = 3).tolist()
+    assert space.encloses(space.samplePoints(100)).all()
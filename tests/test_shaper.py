@@ -0,0 +1,54 @@
+import random
+import shapely
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecShaper import aecShaper
+
+shaper = aecShaper()
+
+def union(key: tuple, boxes, origin: aecPoint, xSize: float, ySize: float):
+    """
+    Returns the points of the shape built by the union-based template path.
+    """
+    ring = shaper._aecShaper__template(('reference',) + key, boxes)
+    return shaper._aecShaper__place(ring, origin, xSize, ySize)
+
+def assertSameShape(points, reference):
+    assert points is not None and reference is not None
+    polygon = shapely.Polygon([point.xy for point in points])
+    expected = shapely.Polygon([point.xy for point in reference])
+    assert polygon.is_valid
+    assert polygon.exterior.is_ccw
+    assert polygon.symmetric_difference(expected).area <= 1e-9 * expected.area
+
+def test_closed_form_shapes_match_union():
+    generator = random.Random(28)
+    for case in range(400):
+        origin = aecPoint(generator.uniform(-100, 100), generator.uniform(-100, 100))
+        xSize = generator.uniform(1, 500)
+        ySize = generator.uniform(1, 500)
+
+        xWidth, yDepth = xSize * generator.uniform(0.01, 0.99), ySize * generator.uniform(0.01, 0.99)
+        x, y = xWidth / xSize, yDepth / ySize
+        assertSameShape(shaper.makeL(origin, xSize, ySize, xWidth, yDepth),
+                        union(('L', x, y), [(0, 0, x, 1), (0, 0, 1, y)], origin, xSize, ySize))
+        x1 = 0.5 - (x * 0.5)
+        assertSameShape(shaper.makeT(origin, xSize, ySize, xWidth, yDepth),
+                        union(('T', x, y), [(0, 1 - y, 1, y), (x1, 0, x, 1)], origin, xSize, ySize))
+
+        xWidth1, xWidth2 = xSize * generator.uniform(0.01, 0.49), xSize * generator.uniform(0.01, 0.49)
+        yDepth = ySize * generator.uniform(0.01, 0.99)
+        w1, w2, y = xWidth1 / xSize, xWidth2 / xSize, yDepth / ySize
+        assertSameShape(shaper.makeU(origin, xSize, ySize, xWidth1, xWidth2, yDepth),
+                        union(('U', w1, w2, y), [(0, 0, w1, 1), (0, 0, 1, y), (1 - w2, 0, w2, 1)],
+                              origin, xSize, ySize))
+        assertSameShape(shaper.makeH(origin, xSize, ySize, xWidth1, xWidth2, yDepth),
+                        union(('H', w1, w2, y), [(0, 0, w1, 1), (1 - w2, 0, w2, 1), (0, 0.5 - (y * 0.5), 1, y)],
+                              origin, xSize, ySize))
+
+        x, y = generator.uniform(0.05, 0.9), generator.uniform(0.05, 0.9)
+        xAxis = generator.uniform(y * 0.5, 1 - (y * 0.5))
+        yAxis = generator.uniform(x * 0.5, 1 - (x * 0.5))
+        x1, y1 = yAxis - (x * 0.5), xAxis - (y * 0.5)
+        assertSameShape(shaper.makeCross(origin, xSize, ySize, x * xSize, y * ySize, xAxis, yAxis),
+                        union(('Cross', x, y, xAxis, yAxis), [(x1, 0, x, 1), (0, y1, 1, y)], origin, xSize, ySize))
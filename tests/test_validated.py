@@ -0,0 +1,32 @@
+import time
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecSpace import aecSpace
+
+def makeRings(count: int):
+    return [[(index, 0), (index + 2, 0), (index + 2, 1), (index + 1, 2), (index, 1)] for index in range(count)]
+
+def timeIt(function, *arguments) -> float:
+    best = None
+    for run in range(3):
+        start = time.perf_counter()
+        function(*arguments)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def test_validated_matches_constructor():
+    for ring in makeRings(20):
+        space = aecSpace([aecPoint(x, y) for x, y in ring])
+        trusted = aecSpace.fromValidated(ring, level = 2, height = 3, color = (1, 2, 3), name = 'room')
+        assert [pnt.xy for pnt in trusted.points_floor] == [pnt.xy for pnt in space.points_floor]
+        assert trusted.area == space.area
+        assert (trusted.level, trusted.height, trusted.color.color, trusted.name) == (2, 3, (1, 2, 3), 'room')
+
+def test_validated_benchmark():
+    rings = makeRings(1000)
+    points = [[aecPoint(x, y) for x, y in ring] for ring in rings]
+    validated = timeIt(lambda: [aecSpace(ring) for ring in points])
+    trusted = timeIt(lambda: [aecSpace.fromValidated(ring) for ring in rings])
+    print('1000 spaces: constructor %.3f s, fromValidated %.3f s, %.1fx' % (validated, trusted, validated / trusted))
+    assert trusted * 3 < validated